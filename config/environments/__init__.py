@@ -6,6 +6,16 @@ Localização: /config/environments/__init__.py
 import os
 from typing import Any, Dict, Type, Union
 
+# Valores aceitos para flags booleanas em variáveis de ambiente (montados uma vez)
+_TRUTHY = frozenset({"true", "1", "yes"})
+_FALSY = frozenset({"false", "0", "no"})
+_ENVIRONMENTS = frozenset({"development", "production", "testing"})
+
+
+def _env_in(name: str, values: frozenset) -> bool:
+    """True se a variável de ambiente `name` (sem caixa) está em `values`."""
+    return os.getenv(name, "").lower() in values
+
 
 def get_environment() -> str:
     """
@@ -16,17 +26,17 @@ def get_environment() -> str:
     """
     # Verificar variável de ambiente explícita
     env = os.getenv("ENVIRONMENT", "").lower()
-    if env in ["development", "production", "testing"]:
+    if env in _ENVIRONMENTS:
         return env
     
     # Verificar se está em modo de teste
-    if os.getenv("TESTING", "").lower() in ["true", "1", "yes"]:
+    if _env_in("TESTING", _TRUTHY):
         return "testing"
     
     # Verificar se está em produção (baseado em outras variáveis)
     prod_indicators = [
-        os.getenv("PRODUCTION", "").lower() in ["true", "1", "yes"],
-        os.getenv("DEBUG", "").lower() in ["false", "0", "no"],
+        _env_in("PRODUCTION", _TRUTHY),
+        _env_in("DEBUG", _FALSY),
         "prod" in os.getenv("DATABASE_URL", "").lower(),
         os.getenv("SECRET_KEY", "") != "",
     ]
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     database_url: str = f"sqlite+aiosqlite:///{DEFAULT_DB_PATH.as_posix()}"
     database_url_sync: str = f"sqlite:///{DEFAULT_DB_PATH.as_posix()}"
     debug: bool = False
+    # compila os kernels Numba dos indicadores ao iniciar um bot (evita latência no primeiro tick)
+    indicator_warmup: bool = False
 
     # Pydantic Settings config
     model_config = SettingsConfigDict(
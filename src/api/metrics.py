@@ -77,11 +77,20 @@ class MetricsCollector:
     def __init__(self):
         self.start_time = time.time()
         self.active_users = set()
+        # filhos já resolvidos por combinação de labels: um .labels() por combinação, não por requisição
+        self._http_children: Dict[tuple, Any] = {}
     
     def record_http_request(self, method: str, endpoint: str, status: int, duration: float):
         """Registra métricas de requisição HTTP"""
-        http_requests_total.labels(method=method, endpoint=endpoint, status=status).inc()
-        http_request_duration_seconds.labels(method=method, endpoint=endpoint).observe(duration)
+        key = (method, endpoint, status)
+        children = self._http_children.get(key)
+        if children is None:
+            children = self._http_children[key] = (
+                http_requests_total.labels(method=method, endpoint=endpoint, status=status),
+                http_request_duration_seconds.labels(method=method, endpoint=endpoint),
+            )
+        children[0].inc()
+        children[1].observe(duration)
     
     def update_trading_metrics(self):
         """Atualiza métricas de trading com dados simulados"""
@@ -122,11 +131,23 @@ class MetricsCollector:
 # Instância global do coletor
 metrics_collector = MetricsCollector()
 
+# Scrapes mais próximos que isso reaproveitam o último payload (sem reamostrar CPU nem reformatar)
+_SCRAPE_CACHE_SECONDS = 0.5
+_cached_payload = None
+_cached_at = 0.0
+
 def get_prometheus_metrics():
     """Retorna métricas no formato Prometheus"""
+    global _cached_payload, _cached_at
+    now = time.monotonic()
+    if _cached_payload is not None and now - _cached_at < _SCRAPE_CACHE_SECONDS:
+        return _cached_payload
+    
     # Atualizar métricas antes de retornar
     metrics_collector.update_system_metrics()
     metrics_collector.update_trading_metrics()
     metrics_collector.set_api_health(True)
     
-    return generate_latest()
+    _cached_payload = generate_latest()
+    _cached_at = now
+    return _cached_payload
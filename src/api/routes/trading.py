@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from pydantic import BaseModel
 
 # Mantemos importável para os testes poderem patchar (target: src.api.routes.trading.get_current_client)
@@ -53,25 +55,37 @@ def clear_positions() -> None:
     POSITIONS.clear()
 
 
+def _etag(payload: Dict[str, Any]) -> str:
+    """ETag forte derivado do JSON canônico do payload."""
+    raw = json.dumps(payload, sort_keys=True, default=str).encode()
+    return f'"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"'
+
+
 # -------------------- Rotas que usam o WORKER (com auth para testes unit) --------------------
 @router.get("/status")
-async def trading_status(_: Any = Depends(get_current_client)):
+async def trading_status(request: Request, response: Response, _: Any = Depends(get_current_client)):
     client_id = getattr(_, "id", None)
     try:
         data = await WORKER.get_bot_status(client_id)
     except TypeError:
         data = WORKER.get_bot_status(client_id)
 
-    if isinstance(data, dict) and data:
-        return data
-
-    return {
-        "client_id": client_id,
-        "status": "running" if SYSTEM_STATE.get("running") else "stopped",
-        "strategy": None,
-        "positions": [],
-        "daily_pnl": 0.0,
-    }
+    if not (isinstance(data, dict) and data):
+        data = {
+            "client_id": client_id,
+            "status": "running" if SYSTEM_STATE.get("running") else "stopped",
+            "strategy": None,
+            "positions": [],
+            "daily_pnl": 0.0,
+        }
+
+    # ETag do corpo: o dashboard faz polling com If-None-Match e recebe 304 sem corpo
+    etag = _etag(data)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return data
 
 
 @router.post("/start")
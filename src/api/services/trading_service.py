@@ -9,6 +9,9 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta, UTC
 from decimal import Decimal
 import json
+import uuid
+
+from sqlalchemy import func, tuple_
 
 from src.models.client import Client, ClientConfiguration, TradingPosition, TradingOrder
 from src.models.database import get_db_session
@@ -340,7 +343,8 @@ class TradingService:
         client_id: int,
         symbol: Optional[str] = None,
         status: Optional[str] = None,
-        limit: int = 50
+        limit: int = 50,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Obtém histórico de ordens do cliente
@@ -350,10 +354,23 @@ class TradingService:
             symbol: Filtrar por símbolo (opcional)
             status: Filtrar por status (opcional)
             limit: Limite de ordens
+            cursor: `next_cursor` devolvido pela página anterior (opcional)
             
         Returns:
             Dict com ordens e metadados
+            
+        Raises:
+            ValueError: se o cursor não estiver no formato "<created_at ISO>|<id UUID>"
         """
+        # Valida o cursor antes da consulta: erro do chamador, não falha do serviço
+        keyset = None
+        if cursor:
+            try:
+                cursor_ts, cursor_id = cursor.split("|", 1)
+                keyset = (datetime.fromisoformat(cursor_ts), uuid.UUID(cursor_id))
+            except ValueError as e:
+                raise ValueError(f"Cursor inválido: {cursor!r}") from e
+        
         try:
             async with get_db_session() as session:
                 query = session.query(TradingOrder).filter(
@@ -366,8 +383,15 @@ class TradingService:
                 if status:
                     query = query.filter(TradingOrder.status == status)
                 
+                # Paginação por cursor (keyset em created_at, id como desempate)
+                if keyset:
+                    query = query.filter(
+                        tuple_(TradingOrder.created_at, TradingOrder.id) < tuple_(*keyset)
+                    )
+                
                 orders = query.order_by(
-                    TradingOrder.created_at.desc()
+                    TradingOrder.created_at.desc(),
+                    TradingOrder.id.desc()
                 ).limit(limit).all()
                 
                 # Converter para dict
@@ -386,16 +410,25 @@ class TradingService:
                         "commission": float(order.commission) if order.commission else 0.0,
                     })
                 
-                # Contar total de ordens
-                total_count = session.query(TradingOrder).filter(
-                    TradingOrder.client_id == client_id
-                ).count()
+                # Contar total de ordens e ordens por status numa única consulta agregada
+                status_counts = dict(
+                    session.query(TradingOrder.status, func.count(TradingOrder.id))
+                    .filter(TradingOrder.client_id == client_id)
+                    .group_by(TradingOrder.status)
+                    .all()
+                )
+                total_count = sum(status_counts.values())
                 
                 return {
                     "orders": orders_data,
                     "total": total_count,
+                    "status_counts": status_counts,
                     "limit": limit,
-                    "has_more": len(orders_data) == limit
+                    "has_more": len(orders_data) == limit,
+                    "next_cursor": (
+                        f"{orders[-1].created_at.isoformat()}|{orders[-1].id}"
+                        if len(orders_data) == limit else None
+                    )
                 }
                 
         except Exception as e:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from .interfaces import (
     OrderRequest,
@@ -12,6 +14,14 @@ from .interfaces import (
 )
 
 
+# códigos de motivo de validate_orders (na ordem de prioridade das checagens)
+REASON_OK = 0
+REASON_DAILY_LOSS = 1
+REASON_TOO_MANY_POSITIONS = 2
+REASON_INSUFFICIENT_BALANCE = 3
+REASON_RISK_LIMIT = 4
+
+
 class RiskManager:
     """
     Implementação mínima compatível com os testes.
@@ -22,6 +32,8 @@ class RiskManager:
     - Construtor aceita dict opcional com overrides.
     - validate_order é assíncrono.
     - Métodos de cálculo: calculate_position_size, calculate_stop_loss, calculate_take_profit
+      (e as versões em lote com numpy: calculate_position_sizes, calculate_stop_losses,
+      calculate_take_profits)
     - Limites diários: check_daily_limits, update_daily_loss, reset_daily_stats
     """
 
@@ -102,6 +114,58 @@ class RiskManager:
             return entry_price * (1.0 + take_profit_pct)
         return entry_price * (1.0 - take_profit_pct)
 
+    # ---------- cálculos em lote (varredura de vários símbolos) ----------
+    def calculate_position_sizes(self, balances: np.ndarray, prices: np.ndarray) -> np.ndarray:
+        """Mesma regra de calculate_position_size, elemento a elemento (saldos em USDT)."""
+        balances = np.asarray(balances, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        budget = np.minimum(balances * self.risk_per_trade, self.max_position_size)
+        valid = prices > 0
+        sizes = np.divide(budget, prices, out=np.zeros(np.broadcast(budget, prices).shape), where=valid)
+        return np.maximum(sizes, 0.0)
+
+    def calculate_stop_losses(self, entry_prices: np.ndarray, is_long: np.ndarray, stop_loss_pct: float) -> np.ndarray:
+        """Stop loss por entrada; `is_long` é um array booleano (True = LONG)."""
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        return np.where(is_long, entry_prices * (1.0 - stop_loss_pct), entry_prices * (1.0 + stop_loss_pct))
+
+    def calculate_take_profits(self, entry_prices: np.ndarray, is_long: np.ndarray, take_profit_pct: float) -> np.ndarray:
+        """Take profit por entrada; `is_long` é um array booleano (True = LONG)."""
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        return np.where(is_long, entry_prices * (1.0 + take_profit_pct), entry_prices * (1.0 - take_profit_pct))
+
+    def validate_orders(
+        self,
+        quantities: np.ndarray,
+        prices: np.ndarray,
+        balances: np.ndarray,
+        open_counts: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Versão em lote de validate_order, para vários símbolos de uma vez.
+
+        Retorna (válidas, código de motivo int8 - REASON_*, tamanho sugerido por
+        calculate_position_sizes); as regras e a prioridade são as de validate_order.
+        """
+        quantities = np.asarray(quantities, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        balances = np.asarray(balances, dtype=np.float64)
+        open_counts = np.asarray(open_counts)
+
+        notional = quantities * prices
+        max_budget = np.minimum(balances * self.risk_per_trade, self.max_position_size)
+        reasons = np.select(
+            [
+                np.full(notional.shape, self.daily_loss > self.max_daily_loss),
+                open_counts >= self.max_open_positions,
+                balances < notional,
+                notional > max_budget,
+            ],
+            [REASON_DAILY_LOSS, REASON_TOO_MANY_POSITIONS, REASON_INSUFFICIENT_BALANCE, REASON_RISK_LIMIT],
+            REASON_OK,
+        ).astype(np.int8)
+        return reasons == REASON_OK, reasons, self.calculate_position_sizes(balances, prices)
+
     # ---------- limites diários ----------
     async def check_daily_limits(self) -> bool:
         """Retorna True se ainda está dentro do limite diário de perda."""
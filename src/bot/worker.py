@@ -1,6 +1,8 @@
 from __future__ import annotations
+import asyncio
 from typing import Dict, Any, Optional
 
+from src.indicators import maybe_warmup
 from .trading_bot import TradingBot
 from .risk_manager import RiskManager
 
@@ -102,6 +104,9 @@ class TradingWorker:
                 risk_manager=RiskManager(),
             )
             self.client_bots[cid] = bot
+        # compila os kernels antes do primeiro tick (no-op sem Numba ou com indicator_warmup desligado);
+        # numa thread, para a compilação não travar o event loop dos outros clientes
+        await asyncio.to_thread(maybe_warmup)
         await bot.start()
         return True
 
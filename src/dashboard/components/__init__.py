@@ -18,6 +18,7 @@ from .trading_components import (
     position_table,
     order_history_table,
     performance_metrics,
+    fetch_dashboard_bundle,
 )
 
 from .chart_components import (
@@ -65,6 +66,7 @@ __all__ = [
     "position_table",
     "order_history_table",
     "performance_metrics",
+    "fetch_dashboard_bundle",
     
     # Chart Components
     "price_chart",
@@ -75,6 +75,9 @@ def login_form(api_url: str = "http://localhost:8000") -> Optional[Dict[str, Any
                 # Salvar dados de sessão
                 st.session_state.authenticated = True
                 st.session_state.access_token = login_data["access_token"]
+                st.session_state["_auth_headers"] = {
+                    "Authorization": f"Bearer {login_data['access_token']}"
+                }
                 st.session_state.client_id = login_data["client_id"]
                 st.session_state.email = login_data["email"]
                 
@@ -377,18 +380,13 @@ def _validate_email(email: str) -> bool:
 
 def _is_authenticated() -> bool:
     """Verifica se usuário está autenticado"""
-    return (
-        hasattr(st.session_state, 'authenticated') and
-        st.session_state.authenticated and
-        hasattr(st.session_state, 'access_token') and
-        st.session_state.access_token
-    )
+    return bool(st.session_state.get("authenticated") and st.session_state.get("access_token"))
 
 
 def _clear_session_data() -> None:
     """Limpa dados de sessão"""
     session_keys = [
-        'authenticated', 'access_token', 'client_id', 'email',
+        'authenticated', 'access_token', '_auth_headers', 'client_id', 'email',
         'remember_login', 'login_timestamp'
     ]
     
@@ -398,10 +396,14 @@ def _clear_session_data() -> None:
 
 
 def _get_auth_headers() -> Dict[str, str]:
-    """Retorna headers de autenticação"""
-    if _is_authenticated():
-        return {"Authorization": f"Bearer {st.session_state.access_token}"}
-    return {}
+    """Retorna headers de autenticação (montados uma vez por sessão)"""
+    headers = st.session_state.get("_auth_headers")
+    if headers is None:
+        if not _is_authenticated():
+            return {}
+        headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+        st.session_state["_auth_headers"] = headers
+    return headers
 
 
 # Exportar funções principais
@@ -9,11 +9,36 @@ import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
 import requests
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 import numpy as np
+import hashlib
 
 
+# Semente dos dados simulados (um Generator por chamada: determinístico e thread-safe)
+_MOCK_SEED = 42
+
+# Matriz de correlação simulada do gráfico de risco
+_CORR_MATRIX = np.array([
+    [1.0, 0.7, 0.5, 0.3],
+    [0.7, 1.0, 0.6, 0.4],
+    [0.5, 0.6, 1.0, 0.2],
+    [0.3, 0.4, 0.2, 1.0]
+], dtype=np.float32)
+_CORR_LABELS = ('BTC', 'ETH', 'ADA', 'SOL')
+
+# Máximo de pontos por série enviados ao Plotly (acima disso, downsampling)
+_MAX_PLOT_POINTS = 2000
+
+# Dados simulados de performance das estratégias
+_STRATEGIES_DATA = {
+    'SMA': {'return': 15.2, 'win_rate': 58.3, 'max_drawdown': 12.8, 'sharpe': 1.23},
+    'RSI': {'return': 12.7, 'win_rate': 62.1, 'max_drawdown': 15.2, 'sharpe': 1.15},
+    'PPP Vishva': {'return': 28.9, 'win_rate': 67.4, 'max_drawdown': 9.3, 'sharpe': 1.67}
+}
+
+
+@st.fragment
 def price_chart(
     symbol: str = "BTCUSDT",
     timeframe: str = "1h",
@@ -32,7 +57,22 @@ def price_chart(
     """
     st.subheader(f"📈 Gráfico de Preços - {symbol}")
     
-    # Controles do gráfico
+    symbol, timeframe, show_indicators = _price_chart_controls()
+    
+    try:
+        fig = _render_price(symbol, timeframe, show_indicators)
+        
+        st.plotly_chart(fig, use_container_width=True)
+        
+        return fig
+        
+    except Exception as e:
+        st.error(f"❌ Erro ao carregar gráfico: {str(e)}")
+        return go.Figure()
+
+
+def _price_chart_controls() -> Tuple[str, str, bool]:
+    """Controles do gráfico de preços (símbolo, timeframe, indicadores)"""
     col1, col2, col3 = st.columns(3)
     
     with col1:
@@ -58,99 +98,130 @@ def price_chart(
             key="price_chart_indicators"
         )
     
-    try:
-        # Gerar dados simulados (em produção, viria da API)
-        df = _generate_mock_price_data(symbol, timeframe)
-        
-        # Criar subplot com volume
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.03,
-            subplot_titles=(f'{symbol} - {timeframe}', 'Volume'),
-            row_width=[0.7, 0.3]
-        )
-        
-        # Candlestick principal
+    return symbol, timeframe, show_indicators
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_price_data(symbol: str, timeframe: str) -> pd.DataFrame:
+    """Carrega o OHLCV do gráfico de preços"""
+    # Gerar dados simulados (em produção, viria da API)
+    return _generate_mock_price_data(symbol, timeframe)
+
+
+def _render_price(symbol: str, timeframe: str, show_indicators: bool) -> go.Figure:
+    """Monta a figura de preços a partir do dict memoizado pelo hash dos dados"""
+    df = _load_price_data(symbol, timeframe)
+    
+    digest = hashlib.blake2b(df['close'].to_numpy().tobytes(), digest_size=8)
+    digest.update(df['timestamp'].to_numpy()[-1:].tobytes())
+    
+    return go.Figure(
+        _build_price_figure(digest.hexdigest(), symbol, timeframe, show_indicators, df)
+    )
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _build_price_figure(
+    data_key: str,
+    symbol: str,
+    timeframe: str,
+    show_indicators: bool,
+    _df: pd.DataFrame
+) -> Dict[str, Any]:
+    """Constrói a figura de preços; `_df` fica fora do hash (identificado por `data_key`)"""
+    df = _df
+    
+    # float32 basta para exibição e reduz à metade o payload enviado ao Plotly
+    opens = df['open'].to_numpy(np.float32)
+    highs = df['high'].to_numpy(np.float32)
+    lows = df['low'].to_numpy(np.float32)
+    closes = df['close'].to_numpy(np.float32)
+    volumes = df['volume'].to_numpy(np.float32)
+    
+    # Criar subplot com volume
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.03,
+        subplot_titles=(f'{symbol} - {timeframe}', 'Volume'),
+        row_width=[0.7, 0.3]
+    )
+    
+    # Candlestick principal
+    fig.add_trace(
+        go.Candlestick(
+            x=df['timestamp'],
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            name='Preço',
+            increasing_line_color='#00D4AA',
+            decreasing_line_color='#FF6B6B'
+        ),
+        row=1, col=1
+    )
+    
+    # Indicadores técnicos
+    if show_indicators:
+        # SMA 20
+        sma_20 = df['close'].rolling(window=20).mean().to_numpy(np.float32)
         fig.add_trace(
-            go.Candlestick(
+            go.Scatter(
                 x=df['timestamp'],
-                open=df['open'],
-                high=df['high'],
-                low=df['low'],
-                close=df['close'],
-                name='Preço',
-                increasing_line_color='#00D4AA',
-                decreasing_line_color='#FF6B6B'
+                y=sma_20,
+                mode='lines',
+                name='SMA 20',
+                line=dict(color='#FFA500', width=1)
             ),
             row=1, col=1
         )
         
-        # Indicadores técnicos
-        if show_indicators:
-            # SMA 20
-            sma_20 = df['close'].rolling(window=20).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=sma_20,
-                    mode='lines',
-                    name='SMA 20',
-                    line=dict(color='#FFA500', width=1)
-                ),
-                row=1, col=1
-            )
-            
-            # SMA 50
-            sma_50 = df['close'].rolling(window=50).mean()
-            fig.add_trace(
-                go.Scatter(
-                    x=df['timestamp'],
-                    y=sma_50,
-                    mode='lines',
-                    name='SMA 50',
-                    line=dict(color='#9370DB', width=1)
-                ),
-                row=1, col=1
-            )
-        
-        # Volume
-        colors = ['#00D4AA' if close >= open else '#FF6B6B' 
-                 for close, open in zip(df['close'], df['open'])]
-        
+        # SMA 50
+        sma_50 = df['close'].rolling(window=50).mean().to_numpy(np.float32)
         fig.add_trace(
-            go.Bar(
+            go.Scatter(
                 x=df['timestamp'],
-                y=df['volume'],
-                name='Volume',
-                marker_color=colors,
-                opacity=0.7
+                y=sma_50,
+                mode='lines',
+                name='SMA 50',
+                line=dict(color='#9370DB', width=1)
             ),
-            row=2, col=1
-        )
-        
-        # Layout
-        fig.update_layout(
-            title=f'{symbol} - {timeframe}',
-            yaxis_title='Preço (USDT)',
-            template='plotly_dark',
-            showlegend=True,
-            height=600,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
+            row=1, col=1
         )
-        
-        fig.update_xaxes(rangeslider_visible=False)
-        
-        st.plotly_chart(fig, use_container_width=True)
-        
-        return fig
-        
-    except Exception as e:
-        st.error(f"❌ Erro ao carregar gráfico: {str(e)}")
-        return go.Figure()
+    
+    # Volume
+    colors = ['#00D4AA' if close >= open else '#FF6B6B' 
+             for close, open in zip(df['close'], df['open'])]
+    
+    fig.add_trace(
+        go.Bar(
+            x=df['timestamp'],
+            y=volumes,
+            name='Volume',
+            marker_color=colors,
+            opacity=0.7
+        ),
+        row=2, col=1
+    )
+    
+    # Layout
+    fig.update_layout(
+        title=f'{symbol} - {timeframe}',
+        yaxis_title='Preço (USDT)',
+        template='plotly_dark',
+        showlegend=True,
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    fig.update_xaxes(rangeslider_visible=False)
+    
+    return fig.to_dict()
 
 
+@st.fragment
 def performance_chart(api_url: str = "http://localhost:8000") -> go.Figure:
     """
     Componente de gráfico de performance da conta
@@ -167,85 +238,10 @@ def performance_chart(api_url: str = "http://localhost:8000") -> go.Figure:
     
     st.subheader("📊 Performance da Conta")
     
-    # Seletor de período
-    period = st.selectbox(
-        "Período",
-        ["7d", "30d", "90d", "all"],
-        index=1,
-        format_func=lambda x: {
-            "7d": "7 dias",
-            "30d": "30 dias",
-            "90d": "90 dias",
-            "all": "Todo período"
-        }[x],
-        key="performance_chart_period"
-    )
+    period = _performance_chart_controls()
     
     try:
-        # Gerar dados simulados de performance
-        df = _generate_mock_performance_data(period)
-        
-        # Calcular equity curve
-        df['cumulative_pnl'] = df['daily_pnl'].cumsum()
-        df['equity'] = 10000 + df['cumulative_pnl']  # Capital inicial de $10,000
-        
-        # Criar gráfico
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.05,
-            subplot_titles=('Equity Curve', 'P&L Diário'),
-            row_heights=[0.7, 0.3]
-        )
-        
-        # Equity curve
-        fig.add_trace(
-            go.Scatter(
-                x=df['date'],
-                y=df['equity'],
-                mode='lines',
-                name='Equity',
-                line=dict(color='#00D4AA', width=2),
-                fill='tonexty'
-            ),
-            row=1, col=1
-        )
-        
-        # Linha base do capital inicial
-        fig.add_hline(
-            y=10000,
-            line_dash="dash",
-            line_color="gray",
-            annotation_text="Capital Inicial",
-            row=1, col=1
-        )
-        
-        # P&L diário como barras
-        colors = ['#00D4AA' if pnl >= 0 else '#FF6B6B' for pnl in df['daily_pnl']]
-        fig.add_trace(
-            go.Bar(
-                x=df['date'],
-                y=df['daily_pnl'],
-                name='P&L Diário',
-                marker_color=colors,
-                opacity=0.8
-            ),
-            row=2, col=1
-        )
-        
-        # Layout
-        fig.update_layout(
-            title='Performance da Conta',
-            template='plotly_dark',
-            showlegend=False,
-            height=500,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
-        
-        fig.update_yaxes(title_text="Equity (USD)", row=1, col=1)
-        fig.update_yaxes(title_text="P&L (USD)", row=2, col=1)
-        fig.update_xaxes(title_text="Data", row=2, col=1)
+        fig, df = _render_performance(period)
         
         st.plotly_chart(fig, use_container_width=True)
         
@@ -279,6 +275,111 @@ def performance_chart(api_url: str = "http://localhost:8000") -> go.Figure:
         return go.Figure()
 
 
+def _performance_chart_controls() -> str:
+    """Seletor de período do gráfico de performance"""
+    return st.selectbox(
+        "Período",
+        ["7d", "30d", "90d", "all"],
+        index=1,
+        format_func=lambda x: {
+            "7d": "7 dias",
+            "30d": "30 dias",
+            "90d": "90 dias",
+            "all": "Todo período"
+        }[x],
+        key="performance_chart_period"
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _render_performance(period: str) -> Tuple[go.Figure, pd.DataFrame]:
+    """Monta a figura de performance; cacheada por período"""
+    # Gerar dados simulados de performance
+    df = _generate_mock_performance_data(period)
+    
+    # Calcular equity curve
+    df['cumulative_pnl'] = df['daily_pnl'].cumsum()
+    df['equity'] = 10000 + df['cumulative_pnl']  # Capital inicial de $10,000
+    
+    dates = df['date'].to_numpy()
+    equity = df['equity'].to_numpy(np.float32)
+    pnl = df['daily_pnl'].to_numpy(np.float32)
+    
+    # Limitar o número de pontos enviados ao navegador em séries longas
+    eq_dates, eq_values = dates, equity
+    pnl_dates, pnl_values = dates, pnl
+    if len(equity) > _MAX_PLOT_POINTS:
+        idx = _lttb_indices(dates.view(np.int64), equity, _MAX_PLOT_POINTS)
+        eq_dates, eq_values = dates[idx], equity[idx]
+        
+        # Barras não têm "forma" a preservar: subamostragem por passo fixo
+        step = -(-len(pnl) // _MAX_PLOT_POINTS)
+        pnl_dates, pnl_values = dates[::step], pnl[::step]
+    
+    # Criar gráfico
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        subplot_titles=('Equity Curve', 'P&L Diário'),
+        row_heights=[0.7, 0.3]
+    )
+    
+    # Equity curve (WebGL, sem polígono de preenchimento)
+    fig.add_trace(
+        go.Scattergl(
+            x=eq_dates,
+            y=eq_values,
+            mode='lines',
+            name='Equity',
+            line=dict(color='#00D4AA', width=2)
+        ),
+        row=1, col=1
+    )
+    
+    # Linha base do capital inicial como trace (não é re-layoutada a cada zoom como um shape)
+    fig.add_trace(
+        go.Scattergl(
+            x=[dates[0], dates[-1]],
+            y=[10000, 10000],
+            mode='lines',
+            name='Capital Inicial',
+            line=dict(color='gray', width=1, dash='dash')
+        ),
+        row=1, col=1
+    )
+    
+    # P&L diário como barras
+    colors = ['#00D4AA' if value >= 0 else '#FF6B6B' for value in pnl_values]
+    fig.add_trace(
+        go.Bar(
+            x=pnl_dates,
+            y=pnl_values,
+            name='P&L Diário',
+            marker_color=colors,
+            opacity=0.8
+        ),
+        row=2, col=1
+    )
+    
+    # Layout
+    fig.update_layout(
+        title='Performance da Conta',
+        template='plotly_dark',
+        showlegend=False,
+        height=500,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    fig.update_yaxes(title_text="Equity (USD)", row=1, col=1)
+    fig.update_yaxes(title_text="P&L (USD)", row=2, col=1)
+    fig.update_xaxes(title_text="Data", row=2, col=1)
+    
+    return fig, df
+
+
+@st.fragment
 def portfolio_distribution_chart(api_url: str = "http://localhost:8000") -> go.Figure:
     """
     Componente de gráfico de distribuição do portfólio
@@ -305,11 +406,14 @@ def portfolio_distribution_chart(api_url: str = "http://localhost:8000") -> go.F
             'SOL': 200.0
         }
         
-        # Criar DataFrame
-        df = pd.DataFrame([
-            {'Asset': asset, 'Value': value, 'Percentage': value/sum(portfolio_data.values())*100}
-            for asset, value in portfolio_data.items()
-        ])
+        # Criar DataFrame (total calculado uma única vez)
+        values = np.fromiter(portfolio_data.values(), dtype=np.float64, count=len(portfolio_data))
+        percent = values / values.sum() * 100.0
+        df = pd.DataFrame({
+            'Asset': list(portfolio_data.keys()),
+            'Value': values,
+            'Percentage': percent
+        })
         
         # Gráfico de pizza
         fig = px.pie(
@@ -339,8 +443,9 @@ def portfolio_distribution_chart(api_url: str = "http://localhost:8000") -> go.F
         st.subheader("💰 Detalhes do Portfólio")
         
         # Adicionar preços simulados
-        df['Price'] = [1.0, 50000.0, 3000.0, 0.5, 100.0]  # Preços simulados
-        df['Quantity'] = df['Value'] / df['Price']
+        prices = np.array([1.0, 50000.0, 3000.0, 0.5, 100.0])  # Preços simulados
+        df['Price'] = prices
+        df['Quantity'] = values / prices
         
         # Formatação
         df['Value'] = df['Value'].apply(lambda x: f"${x:.2f}")
@@ -366,6 +471,7 @@ def portfolio_distribution_chart(api_url: str = "http://localhost:8000") -> go.F
         return go.Figure()
 
 
+@st.fragment
 def strategy_comparison_chart() -> go.Figure:
     """
     Componente de gráfico de comparação de estratégias
@@ -376,68 +482,28 @@ def strategy_comparison_chart() -> go.Figure:
     st.subheader("⚖️ Comparação de Estratégias")
     
     try:
-        # Dados simulados de performance das estratégias
-        strategies_data = {
-            'SMA': {'return': 15.2, 'win_rate': 58.3, 'max_drawdown': 12.8, 'sharpe': 1.23},
-            'RSI': {'return': 12.7, 'win_rate': 62.1, 'max_drawdown': 15.2, 'sharpe': 1.15},
-            'PPP Vishva': {'return': 28.9, 'win_rate': 67.4, 'max_drawdown': 9.3, 'sharpe': 1.67}
-        }
-        
-        # Criar DataFrame
-        df = pd.DataFrame(strategies_data).T
-        df.reset_index(inplace=True)
-        df.rename(columns={'index': 'Strategy'}, inplace=True)
-        
-        # Gráfico de barras agrupadas
-        fig = go.Figure()
-        
-        metrics = ['return', 'win_rate', 'sharpe']
-        metric_names = ['Retorno (%)', 'Taxa de Acerto (%)', 'Sharpe Ratio']
-        colors = ['#00D4AA', '#FFA500', '#9370DB']
-        
-        for i, (metric, name, color) in enumerate(zip(metrics, metric_names, colors)):
-            fig.add_trace(
-                go.Bar(
-                    name=name,
-                    x=df['Strategy'],
-                    y=df[metric],
-                    marker_color=color,
-                    opacity=0.8,
-                    yaxis=f'y{i+1}' if i > 0 else 'y'
-                )
-            )
-        
-        # Layout com múltiplos eixos Y
-        fig.update_layout(
-            title='Comparação de Performance das Estratégias',
-            xaxis_title='Estratégia',
-            template='plotly_dark',
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)',
-            height=500,
-            barmode='group'
-        )
+        fig = _render_strategy_comparison()
         
         st.plotly_chart(fig, use_container_width=True)
         
         # Tabela de comparação detalhada
         st.subheader("📊 Métricas Detalhadas")
         
-        # Formatação da tabela
-        display_df = df.copy()
-        display_df['return'] = display_df['return'].apply(lambda x: f"{x:.1f}%")
-        display_df['win_rate'] = display_df['win_rate'].apply(lambda x: f"{x:.1f}%")
-        display_df['max_drawdown'] = display_df['max_drawdown'].apply(lambda x: f"{x:.1f}%")
-        display_df['sharpe'] = display_df['sharpe'].apply(lambda x: f"{x:.2f}")
-        
-        # Renomear colunas
-        display_df = display_df.rename(columns={
-            'Strategy': 'Estratégia',
-            'return': 'Retorno',
-            'win_rate': 'Taxa de Acerto',
-            'max_drawdown': 'Max Drawdown',
-            'sharpe': 'Sharpe Ratio'
-        })
+        # Linhas já formatadas
+        rows = [
+            (
+                name,
+                f"{d['return']:.1f}%",
+                f"{d['win_rate']:.1f}%",
+                f"{d['max_drawdown']:.1f}%",
+                f"{d['sharpe']:.2f}"
+            )
+            for name, d in _STRATEGIES_DATA.items()
+        ]
+        display_df = pd.DataFrame(
+            rows,
+            columns=['Estratégia', 'Retorno', 'Taxa de Acerto', 'Max Drawdown', 'Sharpe Ratio']
+        )
         
         st.dataframe(display_df, use_container_width=True, hide_index=True)
         
@@ -448,6 +514,45 @@ def strategy_comparison_chart() -> go.Figure:
         return go.Figure()
 
 
+@st.cache_data(show_spinner=False)
+def _render_strategy_comparison() -> go.Figure:
+    """Monta a figura de comparação de estratégias"""
+    names = list(_STRATEGIES_DATA)
+    
+    # Gráfico de barras agrupadas
+    fig = go.Figure()
+    
+    metrics = ['return', 'win_rate', 'sharpe']
+    metric_names = ['Retorno (%)', 'Taxa de Acerto (%)', 'Sharpe Ratio']
+    colors = ['#00D4AA', '#FFA500', '#9370DB']
+    
+    for i, (metric, name, color) in enumerate(zip(metrics, metric_names, colors)):
+        fig.add_trace(
+            go.Bar(
+                name=name,
+                x=names,
+                y=[d[metric] for d in _STRATEGIES_DATA.values()],
+                marker_color=color,
+                opacity=0.8,
+                yaxis=f'y{i+1}' if i > 0 else 'y'
+            )
+        )
+    
+    # Layout com múltiplos eixos Y
+    fig.update_layout(
+        title='Comparação de Performance das Estratégias',
+        xaxis_title='Estratégia',
+        template='plotly_dark',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        height=500,
+        barmode='group'
+    )
+    
+    return fig
+
+
+@st.fragment
 def risk_metrics_chart(api_url: str = "http://localhost:8000") -> go.Figure:
     """
     Componente de gráfico de métricas de risco
@@ -461,82 +566,7 @@ def risk_metrics_chart(api_url: str = "http://localhost:8000") -> go.Figure:
     st.subheader("⚠️ Métricas de Risco")
     
     try:
-        # Dados simulados de risco
-        risk_data = _generate_mock_risk_data()
-        
-        # Criar subplot com múltiplas métricas
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('VaR Histórico', 'Drawdown', 'Volatilidade Rolling', 'Correlação'),
-            specs=[[{"secondary_y": False}, {"secondary_y": False}],
-                   [{"secondary_y": False}, {"type": "heatmap"}]]
-        )
-        
-        # VaR (Value at Risk)
-        fig.add_trace(
-            go.Scatter(
-                x=risk_data['date'],
-                y=risk_data['var_95'],
-                mode='lines',
-                name='VaR 95%',
-                line=dict(color='#FF6B6B', width=2)
-            ),
-            row=1, col=1
-        )
-        
-        # Drawdown
-        fig.add_trace(
-            go.Scatter(
-                x=risk_data['date'],
-                y=risk_data['drawdown'],
-                mode='lines',
-                name='Drawdown',
-                line=dict(color='#FFA500', width=2),
-                fill='tonexty'
-            ),
-            row=1, col=2
-        )
-        
-        # Volatilidade rolling
-        fig.add_trace(
-            go.Scatter(
-                x=risk_data['date'],
-                y=risk_data['volatility'],
-                mode='lines',
-                name='Volatilidade',
-                line=dict(color='#9370DB', width=2)
-            ),
-            row=2, col=1
-        )
-        
-        # Matriz de correlação (simulada)
-        corr_matrix = np.array([
-            [1.0, 0.7, 0.5, 0.3],
-            [0.7, 1.0, 0.6, 0.4],
-            [0.5, 0.6, 1.0, 0.2],
-            [0.3, 0.4, 0.2, 1.0]
-        ])
-        
-        fig.add_trace(
-            go.Heatmap(
-                z=corr_matrix,
-                x=['BTC', 'ETH', 'ADA', 'SOL'],
-                y=['BTC', 'ETH', 'ADA', 'SOL'],
-                colorscale='RdYlBu',
-                zmid=0
-            ),
-            row=2, col=2
-        )
-        
-        # Layout
-        fig.update_layout(
-            title='Análise de Risco',
-            template='plotly_dark',
-            showlegend=False,
-            height=600,
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(0,0,0,0)'
-        )
+        fig, risk_data = _render_risk()
         
         st.plotly_chart(fig, use_container_width=True)
         
@@ -566,15 +596,122 @@ def risk_metrics_chart(api_url: str = "http://localhost:8000") -> go.Figure:
         return go.Figure()
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _render_risk() -> Tuple[go.Figure, pd.DataFrame]:
+    """Monta a figura de métricas de risco"""
+    # Dados simulados de risco
+    risk_data = _generate_mock_risk_data()
+    
+    # Criar subplot com múltiplas métricas
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('VaR Histórico', 'Drawdown', 'Volatilidade Rolling', 'Correlação'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}],
+               [{"secondary_y": False}, {"type": "heatmap"}]]
+    )
+    
+    # VaR (Value at Risk)
+    fig.add_trace(
+        go.Scatter(
+            x=risk_data['date'],
+            y=risk_data['var_95'],
+            mode='lines',
+            name='VaR 95%',
+            line=dict(color='#FF6B6B', width=2)
+        ),
+        row=1, col=1
+    )
+    
+    # Drawdown
+    fig.add_trace(
+        go.Scatter(
+            x=risk_data['date'],
+            y=risk_data['drawdown'],
+            mode='lines',
+            name='Drawdown',
+            line=dict(color='#FFA500', width=2),
+            fill='tonexty'
+        ),
+        row=1, col=2
+    )
+    
+    # Volatilidade rolling
+    fig.add_trace(
+        go.Scatter(
+            x=risk_data['date'],
+            y=risk_data['volatility'],
+            mode='lines',
+            name='Volatilidade',
+            line=dict(color='#9370DB', width=2)
+        ),
+        row=2, col=1
+    )
+    
+    # Matriz de correlação (simulada)
+    fig.add_trace(
+        go.Heatmap(
+            z=_CORR_MATRIX,
+            x=list(_CORR_LABELS),
+            y=list(_CORR_LABELS),
+            colorscale='RdYlBu',
+            zmid=0
+        ),
+        row=2, col=2
+    )
+    
+    # Layout
+    fig.update_layout(
+        title='Análise de Risco',
+        template='plotly_dark',
+        showlegend=False,
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig, risk_data
+
+
 # Funções auxiliares privadas
 def _is_authenticated() -> bool:
     """Verifica se usuário está autenticado"""
-    return (
-        hasattr(st.session_state, 'authenticated') and
-        st.session_state.authenticated and
-        hasattr(st.session_state, 'access_token') and
-        st.session_state.access_token
-    )
+    return bool(st.session_state.get("authenticated") and st.session_state.get("access_token"))
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Índices escolhidos pelo Largest-Triangle-Three-Buckets (preserva a forma da série)"""
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    
+    # n_out - 2 buckets entre o primeiro e o último ponto (sempre mantidos)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        
+        area = np.abs(
+            (x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a])
+        )
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    
+    return idx
+
+
+def _time_axis(periods: int, unit: str) -> np.ndarray:
+    """Eixo temporal regular terminando agora, em datetime64 (unit: 'h' ou 'D')"""
+    end = np.datetime64(datetime.now(), unit)
+    return end - np.arange(periods - 1, -1, -1, dtype=f'timedelta64[{unit}]')
 
 
 def _generate_mock_price_data(symbol: str, timeframe: str) -> pd.DataFrame:
@@ -591,28 +728,25 @@ def _generate_mock_price_data(symbol: str, timeframe: str) -> pd.DataFrame:
     
     # Gerar dados simulados
     periods = 200
-    dates = pd.date_range(end=datetime.now(), periods=periods, freq='1H')
+    dates = _time_axis(periods, 'h')
     
     # Simulação de random walk
-    np.random.seed(42)
-    returns = np.random.normal(0, 0.02, periods)
-    prices = [base_price]
+    rng = np.random.default_rng(_MOCK_SEED)
+    returns = rng.normal(0, 0.02, periods)
+    returns[0] = 0.0
     
-    for ret in returns[1:]:
-        prices.append(prices[-1] * (1 + ret))
-    
-    # Criar OHLCV
-    df = pd.DataFrame({
-        'timestamp': dates,
-        'close': prices
-    })
+    # Criar OHLCV num único buffer contíguo (close, open, high, low, volume)
+    buf = np.empty((periods, 5), dtype=np.float64)
+    buf[:, 0] = base_price * np.cumprod(1 + returns)
+    buf[0, 1] = buf[0, 0]
+    buf[1:, 1] = buf[:-1, 0]
+    opens, closes = buf[:, 1], buf[:, 0]
+    buf[:, 2] = np.maximum(opens, closes) * (1.0 + rng.uniform(0, 0.01, periods))
+    buf[:, 3] = np.minimum(opens, closes) * (1.0 - rng.uniform(0, 0.01, periods))
+    buf[:, 4] = rng.uniform(1000, 10000, periods)
     
-    df['open'] = df['close'].shift(1)
-    df['high'] = df[['open', 'close']].max(axis=1) * (1 + np.random.uniform(0, 0.01, len(df)))
-    df['low'] = df[['open', 'close']].min(axis=1) * (1 - np.random.uniform(0, 0.01, len(df)))
-    df['volume'] = np.random.uniform(1000, 10000, len(df))
-    
-    df.fillna(method='bfill', inplace=True)
+    df = pd.DataFrame(buf, columns=['close', 'open', 'high', 'low', 'volume'])
+    df.insert(0, 'timestamp', dates)
     
     return df
 
@@ -622,11 +756,11 @@ def _generate_mock_performance_data(period: str) -> pd.DataFrame:
     days_map = {'7d': 7, '30d': 30, '90d': 90, 'all': 365}
     days = days_map.get(period, 30)
     
-    dates = pd.date_range(end=datetime.now(), periods=days, freq='1D')
+    dates = _time_axis(days, 'D')
     
     # Simulação de P&L diário
-    np.random.seed(42)
-    daily_pnl = np.random.normal(5, 50, days)  # Média de $5/dia, desvio $50
+    rng = np.random.default_rng(_MOCK_SEED)
+    daily_pnl = rng.normal(5, 50, days)  # Média de $5/dia, desvio $50
     
     return pd.DataFrame({
         'date': dates,
@@ -637,21 +771,36 @@ def _generate_mock_performance_data(period: str) -> pd.DataFrame:
 def _generate_mock_risk_data() -> pd.DataFrame:
     """Gera dados simulados de risco"""
     days = 90
-    dates = pd.date_range(end=datetime.now(), periods=days, freq='1D')
+    dates = _time_axis(days, 'D')
     
-    np.random.seed(42)
+    rng = np.random.default_rng(_MOCK_SEED)
     
-    # Simulação de métricas de risco
-    var_95 = np.random.uniform(-200, -50, days)
-    drawdown = np.cummin(np.random.uniform(-20, 0, days))
-    volatility = np.random.uniform(10, 30, days)
+    # Buffer SoA (var_95, drawdown, volatility): uma linha contígua por métrica
+    buf = np.empty((3, days), dtype=np.float32)
     
-    return pd.DataFrame({
-        'date': dates,
-        'var_95': var_95,
-        'drawdown': drawdown,
-        'volatility': volatility
-    })
+    # VaR 95%: uniforme em [-200, -50)
+    rng.random(dtype=np.float32, out=buf[0])
+    buf[0] *= 150.0
+    buf[0] -= 200.0
+    
+    # Drawdown (%) de uma equity curve simulada: equity / pico acumulado - 1
+    rng.standard_normal(dtype=np.float32, out=buf[1])
+    buf[1] *= 0.02
+    buf[1] += 1.0
+    np.cumprod(buf[1], out=buf[1])
+    np.divide(buf[1], np.maximum.accumulate(buf[1]), out=buf[1])
+    buf[1] -= 1.0
+    buf[1] *= 100.0
+    
+    # Volatilidade: uniforme em [10, 30)
+    rng.random(dtype=np.float32, out=buf[2])
+    buf[2] *= 20.0
+    buf[2] += 10.0
+    
+    df = pd.DataFrame(buf.T, columns=['var_95', 'drawdown', 'volatility'])
+    df.insert(0, 'date', dates)
+    
+    return df
 
 
 # Exportar funções principais
@@ -4,20 +4,109 @@ Componentes reutilizáveis para funcionalidades de trading
 Localização: /src/dashboard/components/trading_components.py
 """
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import pandas as pd
 import requests
-from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
+from collections import Counter
+import asyncio
+import bisect
+import html
+import importlib.util
+import threading
+import time
+import httpx
 
 
-def bot_status_card(api_url: str = "http://localhost:8000") -> Dict[str, Any]:
+# HTTP/2 (multiplexação numa única conexão) requer o extra httpx[http2]
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Endpoints buscados em lote por fetch_dashboard_bundle (params = filtros padrão dos componentes)
+_BUNDLE_ENDPOINTS = {
+    "status": ("/api/trading/status", ()),
+    "positions": ("/api/trading/positions", ()),
+    "orders": ("/api/trading/orders", (("limit", 50),)),
+    "performance": ("/api/trading/performance", (("period", "7d"),)),
+}
+
+# Janela (s) do cache persistente de /performance
+_PERF_CACHE_WINDOW = 300
+
+# Formatos de _format_uptime por faixa: (template, unidade, subunidade)
+_UPTIME_BREAKS = (60, 3600, 86400)
+_UPTIME_FORMATS = (
+    ("{0}s", 1, 1),
+    ("{0}m", 60, 1),
+    ("{0}h {1}m", 3600, 60),
+    ("{0}d {1}h", 86400, 3600),
+)
+
+# Colunas (e dtypes) das tabelas de posições e ordens; preços ficam em float64
+# porque float32 não representa 4 casas decimais acima de ~1000
+_POSITION_COLUMNS = {
+    "symbol": "category",
+    "side": "category",
+    "size": "float32",
+    "entry_price": "float64",
+    "current_price": "float64",
+    "unrealized_pnl": "float32",
+    "unrealized_pnl_pct": "float32",
+    "opened_at": "object",
+}
+_ORDER_COLUMNS = {
+    "symbol": "category",
+    "side": "category",
+    "type": "category",
+    "quantity": "float32",
+    "filled_price": "float64",
+    "status": "category",
+    "created_at": "object",
+    "commission": "float32",
+}
+
+# Formatação client-side das colunas numéricas (chaves = nomes já renomeados)
+_POSITION_COLUMN_CONFIG = {
+    "Tamanho": st.column_config.NumberColumn(format="%.6f"),
+    "Preço Entrada": st.column_config.NumberColumn(format="$%.4f"),
+    "Preço Atual": st.column_config.NumberColumn(format="$%.4f"),
+    "P&L": st.column_config.NumberColumn(format="$%.2f"),
+    "P&L %": st.column_config.NumberColumn(format="%.2f%%"),
+}
+# Abaixo deste número de linhas a tabela de posições é renderizada como HTML simples
+_SMALL_TABLE_ROWS = 200
+_POSITION_HTML_COLUMNS = (
+    ("symbol", "Símbolo", ""),
+    ("side", "Lado", ""),
+    ("size", "Tamanho", ".6f"),
+    ("entry_price", "Preço Entrada", "$.4f"),
+    ("current_price", "Preço Atual", "$.4f"),
+    ("unrealized_pnl", "P&L", "$.2f"),
+    ("unrealized_pnl_pct", "P&L %", ".2f%"),
+    ("opened_at", "Aberta em", ""),
+)
+
+_ORDER_COLUMN_CONFIG = {
+    "Quantidade": st.column_config.NumberColumn(format="%.6f"),
+    "Preço": st.column_config.NumberColumn(format="$%.4f"),
+    "Taxa": st.column_config.NumberColumn(format="%.4f"),
+}
+
+
+@st.fragment(run_every="5s")
+def bot_status_card(
+    api_url: str = "http://localhost:8000",
+    status_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Componente de card de status do bot
     
     Args:
         api_url: URL base da API
+        status_data: Status já obtido via `fetch_dashboard_bundle` (opcional;
+            ignorado nas atualizações automáticas do fragmento)
         
     Returns:
         Dict com status do bot
@@ -27,65 +116,48 @@ def bot_status_card(api_url: str = "http://localhost:8000") -> Dict[str, Any]:
         return {}
     
     try:
-        headers = _get_auth_headers()
-        response = requests.get(f"{api_url}/api/trading/status", headers=headers, timeout=10)
+        if status_data is None or _in_fragment_rerun():
+            status_data = _fetch_status(
+                f"{api_url}/api/trading/status",
+                st.session_state.access_token
+            )
         
-        if response.status_code == 200:
-            status_data = response.json()
-            
-            # Card principal de status
-            with st.container():
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    status_color = {
-                        "running": "🟢",
-                        "paused": "🟡", 
-                        "stopped": "🔴",
-                        "error": "🚨"
-                    }.get(status_data.get("bot_status", "unknown"), "⚪")
-                    
-                    st.metric(
-                        "Status do Bot",
-                        f"{status_color} {status_data.get('bot_status', 'Unknown').title()}"
-                    )
-                
-                with col2:
-                    uptime_seconds = status_data.get("uptime", 0)
-                    uptime_str = _format_uptime(uptime_seconds)
-                    st.metric("Tempo Ativo", uptime_str)
-                
-                with col3:
-                    daily_pnl = status_data.get("daily_pnl", 0)
-                    pnl_color = "normal" if daily_pnl >= 0 else "inverse"
-                    st.metric(
-                        "P&L Diário",
-                        f"${daily_pnl:.2f}",
-                        delta=f"{daily_pnl:.2f}",
-                        delta_color=pnl_color
-                    )
-                
-                with col4:
-                    positions_count = status_data.get("positions_count", 0)
-                    st.metric("Posições Abertas", positions_count)
+        # Card principal de status (uma única mensagem HTML em vez de 4 st.metric)
+        status_color = {
+            "running": "🟢",
+            "paused": "🟡", 
+            "stopped": "🔴",
+            "error": "🚨"
+        }.get(status_data.get("bot_status", "unknown"), "⚪")
+        daily_pnl = status_data.get("daily_pnl", 0)
+        
+        st.markdown(
+            _render_metric_row((
+                ("Status do Bot", f"{status_color} {status_data.get('bot_status', 'Unknown').title()}", None),
+                ("Tempo Ativo", _format_uptime(status_data.get("uptime", 0)), None),
+                ("P&L Diário", f"${daily_pnl:.2f}", daily_pnl),
+                ("Posições Abertas", status_data.get("positions_count", 0), None),
+            )),
+            unsafe_allow_html=True
+        )
+        
+        # Informações adicionais
+        with st.expander("📊 Detalhes do Status", expanded=False):
+            col1, col2 = st.columns(2)
             
-            # Informações adicionais
-            with st.expander("📊 Detalhes do Status", expanded=False):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**Configuração Atual:**")
-                    st.write(f"• Estratégia: {status_data.get('strategy', 'N/A')}")
-                    st.write(f"• Símbolos: {', '.join(status_data.get('symbols', []))}")
-                    st.write(f"• Trades Hoje: {status_data.get('total_trades_today', 0)}")
-                
-                with col2:
-                    st.write("**Saldo da Conta:**")
-                    account_balance = status_data.get("account_balance", {})
-                    for asset, balance in account_balance.items():
-                        st.write(f"• {asset}: {balance:.6f}")
+            with col1:
+                st.write("**Configuração Atual:**")
+                st.write(f"• Estratégia: {status_data.get('strategy', 'N/A')}")
+                st.write(f"• Símbolos: {', '.join(status_data.get('symbols', []))}")
+                st.write(f"• Trades Hoje: {status_data.get('total_trades_today', 0)}")
             
-            return status_data
+            with col2:
+                st.write("**Saldo da Conta:**")
+                account_balance = status_data.get("account_balance", {})
+                for asset, balance in account_balance.items():
+                    st.write(f"• {asset}: {balance:.6f}")
+        
+        return status_data
             
     except requests.exceptions.RequestException as e:
         st.error(f"❌ Erro de conexão: {str(e)}")
@@ -95,6 +167,7 @@ def bot_status_card(api_url: str = "http://localhost:8000") -> Dict[str, Any]:
     return {}
 
 
+@st.fragment
 def trading_controls(api_url: str = "http://localhost:8000") -> None:
     """
     Componente de controles de trading
@@ -115,7 +188,7 @@ def trading_controls(api_url: str = "http://localhost:8000") -> None:
     with col1:
         if st.button("▶️ Iniciar", type="primary", use_container_width=True):
             try:
-                response = requests.post(f"{api_url}/api/trading/start", headers=headers, timeout=10)
+                response = _session().post(f"{api_url}/api/trading/start", headers=headers, timeout=10)
                 if response.status_code == 200:
                     st.success("✅ Bot iniciado com sucesso!")
                     st.rerun()
@@ -128,7 +201,7 @@ def trading_controls(api_url: str = "http://localhost:8000") -> None:
     with col2:
         if st.button("⏸️ Pausar", use_container_width=True):
             try:
-                response = requests.post(f"{api_url}/api/trading/pause", headers=headers, timeout=10)
+                response = _session().post(f"{api_url}/api/trading/pause", headers=headers, timeout=10)
                 if response.status_code == 200:
                     st.success("✅ Bot pausado com sucesso!")
                     st.rerun()
@@ -141,7 +214,7 @@ def trading_controls(api_url: str = "http://localhost:8000") -> None:
     with col3:
         if st.button("▶️ Retomar", use_container_width=True):
             try:
-                response = requests.post(f"{api_url}/api/trading/resume", headers=headers, timeout=10)
+                response = _session().post(f"{api_url}/api/trading/resume", headers=headers, timeout=10)
                 if response.status_code == 200:
                     st.success("✅ Bot retomado com sucesso!")
                     st.rerun()
@@ -155,7 +228,7 @@ def trading_controls(api_url: str = "http://localhost:8000") -> None:
         if st.button("⏹️ Parar", use_container_width=True):
             if st.session_state.get('confirm_stop', False):
                 try:
-                    response = requests.post(f"{api_url}/api/trading/stop", headers=headers, timeout=10)
+                    response = _session().post(f"{api_url}/api/trading/stop", headers=headers, timeout=10)
                     if response.status_code == 200:
                         st.success("✅ Bot parado com sucesso!")
                         st.session_state.confirm_stop = False
@@ -170,12 +243,17 @@ def trading_controls(api_url: str = "http://localhost:8000") -> None:
                 st.warning("⚠️ Clique novamente para confirmar")
 
 
-def position_table(api_url: str = "http://localhost:8000") -> pd.DataFrame:
+@st.fragment
+def position_table(
+    api_url: str = "http://localhost:8000",
+    positions: Optional[List[Dict[str, Any]]] = None
+) -> pd.DataFrame:
     """
     Componente de tabela de posições
     
     Args:
         api_url: URL base da API
+        positions: Posições já obtidas via `fetch_dashboard_bundle` (opcional)
         
     Returns:
         DataFrame com posições
@@ -187,46 +265,50 @@ def position_table(api_url: str = "http://localhost:8000") -> pd.DataFrame:
     st.subheader("📊 Posições Abertas")
     
     try:
-        headers = _get_auth_headers()
-        response = requests.get(f"{api_url}/api/trading/positions", headers=headers, timeout=10)
+        if positions is None or _in_fragment_rerun():
+            positions = _fetch(
+                f"{api_url}/api/trading/positions",
+                (),
+                st.session_state.access_token
+            )
         
-        if response.status_code == 200:
-            positions = response.json()
-            
-            if not positions:
-                st.info("ℹ️ Nenhuma posição aberta no momento")
-                return pd.DataFrame()
-            
-            # Converter para DataFrame
-            df = pd.DataFrame(positions)
-            
-            # Formatação das colunas
-            df['entry_price'] = df['entry_price'].apply(lambda x: f"${x:.4f}")
-            df['current_price'] = df['current_price'].apply(lambda x: f"${x:.4f}")
-            df['unrealized_pnl'] = df['unrealized_pnl'].apply(lambda x: f"${x:.2f}")
-            df['unrealized_pnl_pct'] = df['unrealized_pnl_pct'].apply(lambda x: f"{x:.2f}%")
-            df['size'] = df['size'].apply(lambda x: f"{x:.6f}")
-            
-            # Renomear colunas
-            df = df.rename(columns={
-                'symbol': 'Símbolo',
-                'side': 'Lado',
-                'size': 'Tamanho',
-                'entry_price': 'Preço Entrada',
-                'current_price': 'Preço Atual',
-                'unrealized_pnl': 'P&L',
-                'unrealized_pnl_pct': 'P&L %',
-                'opened_at': 'Aberta em'
-            })
-            
-            # Exibir tabela
+        if not positions:
+            st.info("ℹ️ Nenhuma posição aberta no momento")
+            return pd.DataFrame()
+        
+        # Converter para DataFrame (colunar, dtypes explícitos)
+        df = _columns_to_frame(
+            _records_to_columns(positions, tuple(_POSITION_COLUMNS)),
+            _POSITION_COLUMNS
+        )
+        
+        # Renomear colunas
+        df = df.rename(columns={
+            'symbol': 'Símbolo',
+            'side': 'Lado',
+            'size': 'Tamanho',
+            'entry_price': 'Preço Entrada',
+            'current_price': 'Preço Atual',
+            'unrealized_pnl': 'P&L',
+            'unrealized_pnl_pct': 'P&L %',
+            'opened_at': 'Aberta em'
+        })
+        
+        # Exibir tabela: HTML estático para listas pequenas, grid Arrow para as grandes
+        if len(positions) < _SMALL_TABLE_ROWS:
+            st.markdown(
+                _render_small_table(positions, _POSITION_HTML_COLUMNS),
+                unsafe_allow_html=True
+            )
+        else:
             st.dataframe(
                 df,
+                column_config=_POSITION_COLUMN_CONFIG,
                 use_container_width=True,
                 hide_index=True
             )
-            
-            return df
+        
+        return df
             
     except requests.exceptions.RequestException as e:
         st.error(f"❌ Erro de conexão: {str(e)}")
@@ -236,13 +318,20 @@ def position_table(api_url: str = "http://localhost:8000") -> pd.DataFrame:
     return pd.DataFrame()
 
 
-def order_history_table(api_url: str = "http://localhost:8000", limit: int = 50) -> pd.DataFrame:
+@st.fragment
+def order_history_table(
+    api_url: str = "http://localhost:8000",
+    limit: int = 50,
+    orders_data: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
     """
     Componente de tabela de histórico de ordens
     
     Args:
         api_url: URL base da API
         limit: Número máximo de ordens a exibir
+        orders_data: Resposta de /orders já obtida via `fetch_dashboard_bundle`;
+            usada apenas enquanto os filtros estão nos valores padrão
         
     Returns:
         DataFrame com histórico de ordens
@@ -279,7 +368,6 @@ def order_history_table(api_url: str = "http://localhost:8000", limit: int = 50)
         )
     
     try:
-        headers = _get_auth_headers()
         params = {"limit": limit_filter}
         
         if symbol_filter != "Todos":
@@ -287,63 +375,71 @@ def order_history_table(api_url: str = "http://localhost:8000", limit: int = 50)
         if status_filter != "Todos":
             params["status"] = status_filter
         
-        response = requests.get(
-            f"{api_url}/api/trading/orders",
-            headers=headers,
-            params=params,
-            timeout=10
-        )
+        params_key = tuple(sorted(params.items()))
         
-        if response.status_code == 200:
-            data = response.json()
-            orders = data.get("orders", [])
-            
-            if not orders:
-                st.info("ℹ️ Nenhuma ordem encontrada")
-                return pd.DataFrame()
-            
-            # Converter para DataFrame
-            df = pd.DataFrame(orders)
-            
-            # Formatação das colunas
-            if 'filled_price' in df.columns:
-                df['filled_price'] = df['filled_price'].apply(lambda x: f"${x:.4f}" if x else "N/A")
-            if 'quantity' in df.columns:
-                df['quantity'] = df['quantity'].apply(lambda x: f"{x:.6f}")
-            if 'commission' in df.columns:
-                df['commission'] = df['commission'].apply(lambda x: f"{x:.4f}")
-            
-            # Renomear colunas
-            df = df.rename(columns={
-                'symbol': 'Símbolo',
-                'side': 'Lado',
-                'type': 'Tipo',
-                'quantity': 'Quantidade',
-                'filled_price': 'Preço',
-                'status': 'Status',
-                'created_at': 'Criada em',
-                'commission': 'Taxa'
-            })
-            
-            # Exibir informações resumidas
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Total de Ordens", len(orders))
-            with col2:
-                filled_orders = len([o for o in orders if o.get('status') == 'filled'])
-                st.metric("Ordens Executadas", filled_orders)
-            with col3:
-                total_orders = data.get("total", len(orders))
-                st.metric("Total Disponível", total_orders)
-            
-            # Exibir tabela
-            st.dataframe(
-                df,
-                use_container_width=True,
-                hide_index=True
+        if (orders_data is not None and not _in_fragment_rerun()
+                and params_key == _BUNDLE_ENDPOINTS["orders"][1]):
+            data = orders_data
+        else:
+            data = _fetch_orders(
+                f"{api_url}/api/trading/orders",
+                params_key,
+                st.session_state.access_token
             )
-            
-            return df
+        orders = data.get("orders", [])
+        
+        if not orders:
+            st.info("ℹ️ Nenhuma ordem encontrada")
+            return pd.DataFrame()
+        
+        # Converter para DataFrame (colunar, dtypes explícitos)
+        fields = tuple(f for f in _ORDER_COLUMNS if f in orders[0])
+        df = _columns_to_frame(_records_to_columns(orders, fields), _ORDER_COLUMNS)
+        
+        # Ordens sem execução: preço 0 vira célula vazia
+        if 'filled_price' in df.columns:
+            df['filled_price'] = df['filled_price'].where(df['filled_price'] != 0)
+        
+        # Renomear colunas
+        df = df.rename(columns={
+            'symbol': 'Símbolo',
+            'side': 'Lado',
+            'type': 'Tipo',
+            'quantity': 'Quantidade',
+            'filled_price': 'Preço',
+            'status': 'Status',
+            'created_at': 'Criada em',
+            'commission': 'Taxa'
+        })
+        
+        # Contagem do servidor (todas as ordens); sem ela, uma única passada sobre a página
+        status_counts = data.get("status_counts")
+        if status_counts is None:
+            status_counts = Counter(o.get("status") for o in orders)
+        
+        # Exibir informações resumidas
+        col1, col2, col3, col4, col5 = st.columns(5)
+        with col1:
+            st.metric("Total de Ordens", len(orders))
+        with col2:
+            st.metric("Ordens Executadas", status_counts.get("filled", 0))
+        with col3:
+            st.metric("Canceladas", status_counts.get("cancelled", 0))
+        with col4:
+            st.metric("Pendentes", status_counts.get("pending", 0))
+        with col5:
+            total_orders = data.get("total", len(orders))
+            st.metric("Total Disponível", total_orders)
+        
+        # Exibir tabela (números formatados no navegador)
+        st.dataframe(
+            df,
+            column_config=_ORDER_COLUMN_CONFIG,
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        return df
             
     except requests.exceptions.RequestException as e:
         st.error(f"❌ Erro de conexão: {str(e)}")
@@ -353,12 +449,18 @@ def order_history_table(api_url: str = "http://localhost:8000", limit: int = 50)
     return pd.DataFrame()
 
 
-def performance_metrics(api_url: str = "http://localhost:8000") -> Dict[str, Any]:
+@st.fragment
+def performance_metrics(
+    api_url: str = "http://localhost:8000",
+    perf_data: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Componente de métricas de performance
     
     Args:
         api_url: URL base da API
+        perf_data: Resposta de /performance já obtida via `fetch_dashboard_bundle`;
+            usada apenas para o período padrão
         
     Returns:
         Dict com métricas de performance
@@ -383,80 +485,53 @@ def performance_metrics(api_url: str = "http://localhost:8000") -> Dict[str, Any
     )
     
     try:
-        headers = _get_auth_headers()
-        response = requests.get(
-            f"{api_url}/api/trading/performance",
-            headers=headers,
-            params={"period": period},
-            timeout=10
+        params_key = (("period", period),)
+        
+        if (perf_data is None or _in_fragment_rerun()
+                or params_key != _BUNDLE_ENDPOINTS["performance"][1]):
+            perf_data = _fetch_performance(
+                f"{api_url}/api/trading/performance",
+                params_key,
+                st.session_state.access_token
+            )
+        
+        # Métricas principais
+        pnl_pct = perf_data.get("total_pnl_pct", 0)
+        st.markdown(
+            _render_metric_row((
+                ("P&L Total", f"${perf_data.get('total_pnl', 0):.2f}", pnl_pct, "%"),
+                ("Taxa de Acerto", f"{perf_data.get('win_rate', 0):.1f}%", None),
+                ("Total de Trades", perf_data.get("total_trades", 0), None),
+                ("Sharpe Ratio", f"{perf_data.get('sharpe_ratio', 0):.2f}", None),
+            )),
+            unsafe_allow_html=True
         )
         
-        if response.status_code == 200:
-            perf_data = response.json()
-            
-            # Métricas principais
-            col1, col2, col3, col4 = st.columns(4)
+        # Métricas detalhadas
+        with st.expander("📊 Métricas Detalhadas", expanded=False):
+            col1, col2 = st.columns(2)
             
             with col1:
-                total_pnl = perf_data.get("total_pnl", 0)
-                pnl_pct = perf_data.get("total_pnl_pct", 0)
-                st.metric(
-                    "P&L Total",
-                    f"${total_pnl:.2f}",
-                    delta=f"{pnl_pct:.2f}%"
-                )
+                st.write("**Estatísticas de Trading:**")
+                st.write(f"• Trades Vencedores: {perf_data.get('winning_trades', 0)}")
+                st.write(f"• Trades Perdedores: {perf_data.get('losing_trades', 0)}")
+                st.write(f"• Melhor Trade: ${perf_data.get('best_trade', 0):.2f}")
+                st.write(f"• Pior Trade: ${perf_data.get('worst_trade', 0):.2f}")
+                st.write(f"• Trade Médio: ${perf_data.get('average_trade', 0):.2f}")
             
             with col2:
-                win_rate = perf_data.get("win_rate", 0)
-                st.metric("Taxa de Acerto", f"{win_rate:.1f}%")
-            
-            with col3:
-                total_trades = perf_data.get("total_trades", 0)
-                st.metric("Total de Trades", total_trades)
-            
-            with col4:
-                sharpe_ratio = perf_data.get("sharpe_ratio", 0)
-                st.metric("Sharpe Ratio", f"{sharpe_ratio:.2f}")
-            
-            # Métricas detalhadas
-            with st.expander("📊 Métricas Detalhadas", expanded=False):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.write("**Estatísticas de Trading:**")
-                    st.write(f"• Trades Vencedores: {perf_data.get('winning_trades', 0)}")
-                    st.write(f"• Trades Perdedores: {perf_data.get('losing_trades', 0)}")
-                    st.write(f"• Melhor Trade: ${perf_data.get('best_trade', 0):.2f}")
-                    st.write(f"• Pior Trade: ${perf_data.get('worst_trade', 0):.2f}")
-                    st.write(f"• Trade Médio: ${perf_data.get('average_trade', 0):.2f}")
-                
-                with col2:
-                    st.write("**Métricas de Risco:**")
-                    st.write(f"• Profit Factor: {perf_data.get('profit_factor', 0):.2f}")
-                    st.write(f"• Max Drawdown: ${perf_data.get('max_drawdown', 0):.2f}")
-                    st.write(f"• Max Drawdown %: {perf_data.get('max_drawdown_pct', 0):.2f}%")
-            
-            # Gráfico de P&L diário
-            daily_pnl = perf_data.get("daily_pnl", [])
-            if daily_pnl:
-                df_pnl = pd.DataFrame(daily_pnl)
-                df_pnl['date'] = pd.to_datetime(df_pnl['date'])
-                
-                fig = px.line(
-                    df_pnl,
-                    x='date',
-                    y='pnl',
-                    title='P&L Diário',
-                    labels={'pnl': 'P&L (USD)', 'date': 'Data'}
-                )
-                fig.update_traces(line_color='#00D4AA')
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)'
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            
-            return perf_data
+                st.write("**Métricas de Risco:**")
+                st.write(f"• Profit Factor: {perf_data.get('profit_factor', 0):.2f}")
+                st.write(f"• Max Drawdown: ${perf_data.get('max_drawdown', 0):.2f}")
+                st.write(f"• Max Drawdown %: {perf_data.get('max_drawdown_pct', 0):.2f}%")
+        
+        # Gráfico de P&L diário
+        daily_pnl = perf_data.get("daily_pnl", [])
+        if daily_pnl:
+            fig = _build_pnl_figure(period, daily_pnl)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        return perf_data
             
     except requests.exceptions.RequestException as e:
         st.error(f"❌ Erro de conexão: {str(e)}")
@@ -466,39 +541,297 @@ def performance_metrics(api_url: str = "http://localhost:8000") -> Dict[str, Any
     return {}
 
 
+def fetch_dashboard_bundle(api_url: str = "http://localhost:8000") -> Dict[str, Any]:
+    """
+    Busca status, posições, ordens e performance numa única rodada paralela
+    
+    O resultado é cacheado por 2s; passe cada fatia ao componente correspondente
+    (`bot_status_card(status_data=...)`, `position_table(positions=...)`, etc.)
+    em vez de cada um buscar seu endpoint em série.
+    
+    Args:
+        api_url: URL base da API
+        
+    Returns:
+        Dict com as chaves "status", "positions", "orders" e "performance";
+        o valor é None para endpoints que falharam
+    """
+    if not _is_authenticated():
+        return {}
+    
+    return _fetch_dashboard_bundle(api_url, st.session_state.access_token)
+
+
 # Funções auxiliares privadas
+@st.cache_resource
+def _session() -> requests.Session:
+    """Sessão HTTP compartilhada (pool keep-alive); nunca alterar `.headers`, passar por chamada"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_json(url: str, params: Tuple[Tuple[str, Any], ...], token: str) -> Any:
+    """GET autenticado na API; levanta HTTPError para status != 200 (erros não são cacheados)"""
+    response = _session().get(
+        url,
+        headers={"Authorization": f"Bearer {token}"},
+        params=dict(params),
+        timeout=10
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _fetch_status(url: str, token: str) -> Any:
+    """Status do bot via GET condicional (If-None-Match); 304 reaproveita o último corpo da sessão"""
+    headers = {"Authorization": f"Bearer {token}"}
+    cached = st.session_state.get("_status_cache")
+    if cached is not None:
+        headers["If-None-Match"] = st.session_state.get("_status_etag", "")
+    
+    response = _session().get(url, headers=headers, timeout=10)
+    if response.status_code == 304 and cached is not None:
+        return cached
+    
+    response.raise_for_status()
+    data = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        st.session_state["_status_etag"] = etag
+        st.session_state["_status_cache"] = data
+    return data
+
+
+@st.cache_data(ttl="5s", max_entries=128, show_spinner=False)
+def _fetch(url: str, params: Tuple[Tuple[str, Any], ...], token: str) -> Any:
+    """GET genérico, usado para posições (cache de 5s)"""
+    return _get_json(url, params, token)
+
+
+def _fetch_performance(url: str, params: Tuple[Tuple[str, Any], ...], token: str) -> Any:
+    """Métricas de performance (cache em disco por janela de 5min, sobrevive a restarts)"""
+    window = int(time.time() // _PERF_CACHE_WINDOW)
+    # persist="disk" ignora ttl: a janela entra na chave e a anterior é apagada do disco
+    _fetch_performance_window.clear(url, params, token, window - 1)
+    return _fetch_performance_window(url, params, token, window)
+
+
+@st.cache_data(persist="disk", max_entries=32, show_spinner=False)
+def _fetch_performance_window(
+    url: str,
+    params: Tuple[Tuple[str, Any], ...],
+    token: str,
+    window: int
+) -> Any:
+    """GET de /performance cacheado por (filtros, token, janela)"""
+    return _get_json(url, params, token)
+
+
+@st.cache_data(ttl="15m", max_entries=128, show_spinner=False)
+def _fetch_orders(url: str, params: Tuple[Tuple[str, Any], ...], token: str) -> Any:
+    """Histórico de ordens por combinação de filtros (cache de 15m)"""
+    return _get_json(url, params, token)
+
+
+@st.cache_data(ttl="2s", max_entries=32, show_spinner=False)
+def _fetch_dashboard_bundle(api_url: str, token: str) -> Dict[str, Any]:
+    """Dispara os GETs do dashboard concorrentemente (wall-clock = maior RTT, não a soma)"""
+    loop, client = _async_runtime()
+    targets = [
+        (f"{api_url}{path}", dict(params))
+        for path, params in _BUNDLE_ENDPOINTS.values()
+    ]
+    
+    future = asyncio.run_coroutine_threadsafe(
+        _gather(client, targets, {"Authorization": f"Bearer {token}"}),
+        loop
+    )
+    results = future.result(timeout=15)
+    
+    bundle: Dict[str, Any] = {}
+    for name, response in zip(_BUNDLE_ENDPOINTS, results):
+        if isinstance(response, httpx.Response) and response.status_code == 200:
+            bundle[name] = response.json()
+        else:
+            # O componente refaz a busca sozinho e exibe o erro
+            bundle[name] = None
+    
+    return bundle
+
+
+@st.cache_resource
+def _async_runtime() -> Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]:
+    """Event loop dedicado + AsyncClient persistente (HTTP/2 quando `h2` está instalado)"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-http", daemon=True).start()
+    
+    client = httpx.AsyncClient(
+        http2=_HTTP2,
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    )
+    return loop, client
+
+
+async def _gather(
+    client: httpx.AsyncClient,
+    targets: List[Tuple[str, Dict[str, Any]]],
+    headers: Dict[str, str]
+) -> List[Any]:
+    """GETs concorrentes na mesma conexão; exceções voltam como resultado"""
+    return await asyncio.gather(
+        *(client.get(url, params=params, headers=headers) for url, params in targets),
+        return_exceptions=True
+    )
+
+
+@st.cache_data(
+    ttl="1m",
+    max_entries=32,
+    show_spinner=False,
+    hash_funcs={list: lambda rows: (len(rows), rows[-1] if rows else None)}
+)
+def _build_pnl_figure(period: str, daily_pnl: List[Dict[str, Any]]) -> Any:
+    """Figura de P&L diário; a chave só muda quando chega uma nova barra (tamanho/última linha)"""
+    import plotly.express as px  # import tardio: plotly só carrega se houver gráfico
+    
+    df_pnl = pd.DataFrame(daily_pnl)
+    df_pnl['date'] = pd.to_datetime(df_pnl['date'])
+    
+    fig = px.line(
+        df_pnl,
+        x='date',
+        y='pnl',
+        title='P&L Diário',
+        labels={'pnl': 'P&L (USD)', 'date': 'Data'}
+    )
+    fig.update_traces(line_color='#00D4AA')
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)'
+    )
+    return fig
+
+
+def _records_to_columns(
+    records: List[Dict[str, Any]],
+    fields: Tuple[str, ...]
+) -> Dict[str, List[Any]]:
+    """Transpõe a lista de registros JSON em colunas {campo: [valores]}"""
+    return {f: [r.get(f) for r in records] for f in fields}
+
+
+def _columns_to_frame(columns: Dict[str, List[Any]], dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Monta o DataFrame coluna a coluna, sem inferência de tipo por linha"""
+    return pd.DataFrame({
+        name: pd.Series(values, dtype=dtypes.get(name, "object"))
+        for name, values in columns.items()
+    })
+
+
+def _render_small_table(
+    rows: List[Dict[str, Any]],
+    columns: Tuple[Tuple[str, str, str], ...]
+) -> str:
+    """
+    Gera uma <table> HTML para poucas linhas
+    
+    `columns` traz (campo, rótulo, formato); o formato aceita prefixo "$" e
+    sufixo "%" em volta de um format spec ("$.4f", ".2f%").
+    """
+    specs = []
+    for field, _, fmt in columns:
+        # "$" vira entidade HTML para o st.markdown não abrir um bloco LaTeX
+        prefix = "&#36;" if fmt.startswith("$") else ""
+        suffix = "%" if fmt.endswith("%") else ""
+        specs.append((field, prefix, fmt.strip("$%"), suffix))
+    
+    def cell(value: Any, prefix: str, spec: str, suffix: str) -> str:
+        if value is None:
+            return ""
+        if isinstance(value, str):
+            return html.escape(value)
+        return f"{prefix}{value:{spec}}{suffix}"
+    
+    out = ["<table class='mini'><tr>"]
+    out.extend(f"<th>{html.escape(label)}</th>" for _, label, _ in columns)
+    out.append("</tr>")
+    for row in rows:
+        out.append("<tr>")
+        out.extend(
+            f"<td>{cell(row.get(field), prefix, spec, suffix)}</td>"
+            for field, prefix, spec, suffix in specs
+        )
+        out.append("</tr>")
+    out.append("</table>")
+    return "".join(out)
+
+
+def _render_metric_row(cells: Tuple[Tuple[Any, ...], ...]) -> str:
+    """
+    Gera uma linha flex de métricas (equivalente visual a st.columns + st.metric)
+    
+    Cada célula é (rótulo, valor, delta) ou (rótulo, valor, delta, sufixo do delta);
+    delta None omite a linha de variação.
+    """
+    out = ["<div style='display:flex;gap:1rem'>"]
+    for label, value, delta, *suffix in cells:
+        out.append(
+            "<div style='flex:1'>"
+            f"<p style='font-size:0.875rem;margin:0'>{html.escape(str(label))}</p>"
+            f"<p style='font-size:1.75rem;margin:0'>{_html_text(value)}</p>"
+        )
+        if delta is not None:
+            color = "#09ab3b" if delta >= 0 else "#ff2b2b"
+            arrow = "↑" if delta >= 0 else "↓"
+            out.append(
+                f"<p style='color:{color};margin:0'>{arrow} {delta:.2f}{''.join(suffix)}</p>"
+            )
+        out.append("</div>")
+    out.append("</div>")
+    return "".join(out)
+
+
+def _html_text(value: Any) -> str:
+    """Escapa texto para st.markdown (inclui "$", que abriria um bloco LaTeX)"""
+    return html.escape(str(value)).replace("$", "&#36;")
+
+
+def _in_fragment_rerun() -> bool:
+    """True quando só um fragmento está rodando (dados pré-buscados do bundle estariam velhos)"""
+    ctx = get_script_run_ctx()
+    return bool(ctx is not None and ctx.fragment_ids_this_run)
+
+
 def _is_authenticated() -> bool:
     """Verifica se usuário está autenticado"""
-    return (
-        hasattr(st.session_state, 'authenticated') and
-        st.session_state.authenticated and
-        hasattr(st.session_state, 'access_token') and
-        st.session_state.access_token
-    )
+    return bool(st.session_state.get("authenticated") and st.session_state.get("access_token"))
 
 
 def _get_auth_headers() -> Dict[str, str]:
-    """Retorna headers de autenticação"""
-    if _is_authenticated():
-        return {"Authorization": f"Bearer {st.session_state.access_token}"}
-    return {}
+    """Retorna headers de autenticação (montados uma vez por sessão)"""
+    headers = st.session_state.get("_auth_headers")
+    if headers is None:
+        if not _is_authenticated():
+            return {}
+        headers = {"Authorization": f"Bearer {st.session_state.access_token}"}
+        st.session_state["_auth_headers"] = headers
+    return headers
 
 
 def _format_uptime(seconds: int) -> str:
     """Formata tempo de atividade"""
-    if seconds < 60:
-        return f"{seconds}s"
-    elif seconds < 3600:
-        minutes = seconds // 60
-        return f"{minutes}m"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        return f"{hours}h {minutes}m"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        return f"{days}d {hours}h"
+    idx = bisect.bisect_right(_UPTIME_BREAKS, seconds)
+    fmt, unit, sub_unit = _UPTIME_FORMATS[idx]
+    major, rest = divmod(seconds, unit)
+    return fmt.format(major, rest // sub_unit)
 
 
 # Exportar funções principais
@@ -508,5 +841,6 @@ __all__ = [
     "position_table",
     "order_history_table",
     "performance_metrics",
+    "fetch_dashboard_bundle",
 ]
 
@@ -8,11 +8,11 @@ import os
 import sys
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
 
 # Adicionar diretório raiz ao path
 sys.path.append('/app')
@@ -28,8 +28,21 @@ st.set_page_config(
 # Configurações
 API_BASE_URL = os.getenv("API_URL", "http://api:8000")
 
-# CSS customizado
-st.markdown("""
+# Ajuda exibida apenas quando a API está fora do ar
+_HELP_COMMANDS = """
+    # Verificar status dos containers
+    docker-compose -f docker-compose.production.yml ps
+    
+    # Verificar logs da API
+    docker logs crypto-trading-api -f
+    
+    # Testar API diretamente
+    curl http://localhost:8000/health
+    """
+
+# CSS customizado (constante de módulo; re-emitido a cada rerun porque o Streamlit
+# remove da página os elementos que um rerun não volta a desenhar)
+_CSS_BLOB = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -57,9 +70,23 @@ st.markdown("""
         font-weight: bold;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_CSS_BLOB, unsafe_allow_html=True)
 
 # Funções auxiliares
+@st.cache_resource
+def _session():
+    """Sessão HTTP compartilhada (pool keep-alive); headers sempre por chamada"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 def make_api_request(endpoint, method="GET", data=None, token=None):
     """Fazer requisição para a API"""
     try:
@@ -70,9 +97,9 @@ def make_api_request(endpoint, method="GET", data=None, token=None):
             headers["Authorization"] = f"Bearer {token}"
         
         if method == "GET":
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _session().get(url, headers=headers, timeout=10)
         elif method == "POST":
-            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response = _session().post(url, headers=headers, json=data, timeout=10)
         else:
             return None
         
@@ -151,16 +178,7 @@ api_healthy, api_info = check_api_health()
 if not api_healthy:
     st.error("❌ API não está respondendo. Verifique se o serviço está rodando.")
     st.markdown("### 🔧 Comandos de Verificação")
-    st.code("""
-    # Verificar status dos containers
-    docker-compose -f docker-compose.production.yml ps
-    
-    # Verificar logs da API
-    docker logs crypto-trading-api -f
-    
-    # Testar API diretamente
-    curl http://localhost:8000/health
-    """)
+    st.code(_HELP_COMMANDS)
     st.stop()
 
 # Status da API
@@ -215,6 +233,7 @@ if st.session_state.token:
             "PnL": [50 + i*2 + (i%3)*10 for i in range(len(dates))]
         })
         
+        import plotly.express as px  # import tardio: tela de login não carrega plotly
         fig = px.line(pnl_data, x="Date", y="PnL", title="PnL Acumulado")
         st.plotly_chart(fig, use_container_width=True)
     
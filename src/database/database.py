@@ -1,16 +1,30 @@
 from __future__ import annotations
-from typing import Dict, Any, List, Tuple, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Tuple, Optional
 from datetime import datetime
 
+import numpy as np
+
+# colunas/conversão de candles compartilhadas com o DatabaseManager de src.models
+from src.models.database import _CANDLE_COLUMNS, _candle_columns
+
+# máximo de logs mantidos em memória (os mais antigos são descartados)
+_MAX_LOGS = 100_000
+
+
 class DatabaseManager:
     def __init__(self) -> None:
         self._users: Dict[int, Dict[str, Any]] = {}
         self._next_uid = 1
 
-        # (symbol, interval) -> list[dict]
-        self._market: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        # (symbol, interval) -> colunas NumPy com capacidade dobrando; _market_len = linhas usadas
+        self._market: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        self._market_len: Dict[Tuple[str, str], int] = {}
+        # True enquanto os timestamps do buffer estão em ordem crescente (inserção cronológica)
+        self._market_sorted: Dict[Tuple[str, str], bool] = {}
 
-        self._logs: List[Dict[str, Any]] = []
+        self._logs: Deque[Dict[str, Any]] = deque(maxlen=_MAX_LOGS)
         self._next_log_id = 1
 
     # -------- users --------
@@ -27,22 +41,63 @@ class DatabaseManager:
     # -------- market data --------
     async def store_market_data(self, symbol: str, interval: str, candles: List[Dict[str, Any]]) -> int:
         key = (symbol, interval)
-        buf = self._market.setdefault(key, [])
-        for c in candles:
-            buf.append({
-                "timestamp": int(c["timestamp"]),
-                "open": float(c["open"]),
-                "high": float(c["high"]),
-                "low": float(c["low"]),
-                "close": float(c["close"]),  # os testes verificam esta chave
-                "volume": float(c.get("volume", 0.0)),
-            })
-        return len(candles)
+        n = len(candles)
+        if not n:
+            return 0
+
+        # colunas novas (mesma conversão int/float de antes, "close" é verificada nos testes)
+        new = _candle_columns(candles)
+
+        size = self._market_len.get(key, 0)
+        cols = self._market.get(key)
+        if cols is None or size + n > cols["timestamp"].shape[0]:
+            capacity = max(64, 2 * (size + n))
+            grown = {name: np.empty(capacity, dtype) for name, dtype in _CANDLE_COLUMNS}
+            if cols is not None:
+                for name, _ in _CANDLE_COLUMNS:
+                    grown[name][:size] = cols[name][:size]
+            cols = self._market[key] = grown
+
+        ts = new["timestamp"]
+        monotonic = bool(np.all(ts[1:] >= ts[:-1])) and (size == 0 or ts[0] >= cols["timestamp"][size - 1])
+        self._market_sorted[key] = self._market_sorted.get(key, True) and monotonic
+
+        for name, _ in _CANDLE_COLUMNS:
+            cols[name][size:size + n] = new[name]
+        self._market_len[key] = size + n
+        return n
 
     async def get_market_data(self, symbol: str, interval: str, limit: int = 100) -> List[Dict[str, Any]]:
         key = (symbol, interval)
-        data = sorted(self._market.get(key, []), key=lambda x: x["timestamp"], reverse=True)
-        return data[:limit]
+        size = self._market_len.get(key, 0)
+        if not size or limit <= 0:
+            return []
+        cols = self._market[key]
+
+        if not self._market_sorted.get(key, True):
+            self._sort_market(key)
+
+        # buffer ordenado: os k mais recentes são as últimas k linhas, O(k)
+        start = max(size - limit, 0)
+        rows = zip(*(cols[name][start:size][::-1].tolist() for name, _ in _CANDLE_COLUMNS))
+        names = [name for name, _ in _CANDLE_COLUMNS]
+        return [dict(zip(names, row)) for row in rows]
+
+    def _sort_market(self, key: Tuple[str, str]) -> None:
+        """Reordena o buffer por timestamp uma vez, em vez de ordenar a cada leitura."""
+        size = self._market_len[key]
+        cols = self._market[key]
+        ts = cols["timestamp"][:size]
+        breaks = np.flatnonzero(ts[1:] < ts[:-1])
+        if breaks.size:
+            # o prefixo até a primeira inversão já está ordenado: só a região a partir
+            # da posição do menor timestamp atrasado precisa ser reordenada
+            first = int(breaks[0]) + 1
+            start = int(np.searchsorted(ts[:first], ts[first:].min(), side="right"))
+            order = np.argsort(ts[start:], kind="stable")
+            for name, _ in _CANDLE_COLUMNS:
+                cols[name][start:size] = cols[name][start:size][order]
+        self._market_sorted[key] = True
 
     # -------- logging --------
     async def log_message(self, level: str, message: str, source: str,
@@ -62,6 +117,5 @@ class DatabaseManager:
         return lid
 
     async def get_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
-        # mais recente primeiro (ids crescentes)
-        ordered = sorted(self._logs, key=lambda r: r["id"], reverse=True)
-        return ordered[:limit]
+        # mais recente primeiro: ids são crescentes na ordem de inserção
+        return list(islice(reversed(self._logs), max(limit, 0)))
@@ -1,13 +1,26 @@
 # Minimal, test-compatible indicators API
 from __future__ import annotations
-from typing import List, Optional, Iterable
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Iterable, Union
 import math
 
+import numpy as np
+
+from ._batch import compute_all
+from ._kernels import atr_last, rsi_last, stochrsi_last
+
 # reexport safe_float (usado por strategies)
 try:
     from src.utils.data_utils import safe_float  # type: ignore
 except Exception:
+    _INF = math.inf
+
     def safe_float(x, default=None):
+        # caminho rápido: já é float (caso comum); x == x é falso só para NaN
+        if type(x) is float:
+            return x if (x == x and x != _INF and x != -_INF) else default
         try:
             v = float(x)
             if math.isnan(v) or math.isinf(v):
@@ -35,77 +48,207 @@ class BaseIndicator:
     def is_ready(self) -> bool:
         return len(self.data) >= self.period
 
+    def reset(self) -> None:
+        """Descarta o histórico e o estado incremental."""
+        self.data = []
+
     def calculate(self, *_a, **_k):
         raise NotImplementedError
 
 
 def _clean_series(seq: Iterable[float]) -> List[float]:
-    out: List[float] = []
-    for v in seq:
-        fv = safe_float(v, default=None)
-        if fv is not None:
-            out.append(fv)
-    return out
+    return _clean_array(seq).tolist()
+
+
+def _clean_array(seq: Iterable[float]) -> np.ndarray:
+    """Série como float64 contíguo, sem None/NaN/Inf (sanitização vetorizada)."""
+    try:
+        arr = np.asarray(seq, dtype=np.float64)
+        if arr.ndim == 1:
+            return arr[np.isfinite(arr)]
+    except (TypeError, ValueError):
+        pass
+    # entradas heterogêneas (strings não numéricas, objetos): valor a valor
+    return np.fromiter(
+        (v for v in (safe_float(x, default=None) for x in seq) if v is not None),
+        dtype=np.float64,
+    )
+
+
+def _ema_last(arr: np.ndarray, period: int) -> float:
+    """
+    Último valor da EMA (semente = primeiro preço) sem laço Python.
+
+    Forma fechada da recorrência ema = x*k + ema*(1-k):
+    ema_n = a^(n-1)*x_0 + k * sum_i a^(n-1-i)*x_i, com a = 1-k.
+    """
+    k = 2.0 / (period + 1.0)
+    w = (1.0 - k) ** np.arange(arr.size - 1, -1, -1, dtype=np.float64)
+    return float(w[0] * arr[0] + k * np.dot(w[1:], arr[1:]))
+
+
+# Memoização por conteúdo da série: estratégias que avaliam o mesmo símbolo no mesmo
+# tick chamam calculate() repetidas vezes com a mesma lista. A chave é o buffer float64
+# já sanitizado (bytes são hasheáveis), então resultados nunca vazam entre séries diferentes.
+_CACHE_SIZE = 256
+
+
+# Séries longas podem rodar em float32 (metade dos bytes lidos); os kernels acumulam
+# em float64. O dtype faz parte da chave para não misturar resultados das duas precisões.
+@lru_cache(maxsize=_CACHE_SIZE)
+def _ema_cached(buf: bytes, period: int, dtype: str = "<f8") -> float:
+    return _ema_last(np.frombuffer(buf, dtype=dtype), period)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _rsi_cached(buf: bytes, period: int, dtype: str = "<f8") -> float:
+    return float(rsi_last(np.frombuffer(buf, dtype=dtype), period))
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _stochrsi_cached(buf: bytes, rsi_period: int, stoch_period: int) -> float:
+    return float(stochrsi_last(np.frombuffer(buf, dtype=np.float64), rsi_period, stoch_period))
 
 
 class EMAIndicator(BaseIndicator):
-    def __init__(self, period: int, **_):
+    def __init__(self, period: int, dtype=np.float64, **_):
         super().__init__(period)
+        self.dtype = np.dtype(dtype)
+        self._k = 2.0 / (self.period + 1.0)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self._ema: Optional[float] = None
+
+    def push(self, value: float) -> Optional[float]:
+        """Adiciona um preço e devolve a EMA atual em O(1) (mesma semente de calculate)."""
+        v = safe_float(value, default=None)
+        if v is None:
+            return self._ema
+        self.data.append(v)
+        if self._ema is None:
+            self._ema = v
+        else:
+            # ema += k * (x - ema): equivale a x*k + ema*(1-k) com uma multiplicação a menos
+            self._ema += self._k * (v - self._ema)
+        return self._ema
 
     def calculate(self, data: Optional[List[float]] = None) -> Optional[float]:
-        seq = _clean_series(self.data if data is None else data)
-        if not seq:
+        seq = _clean_array(self.data if data is None else data).astype(self.dtype, copy=False)
+        if not seq.size:
             return None
-        k = 2.0 / (self.period + 1.0)
-        ema = seq[0]
-        for x in seq[1:]:
-            ema = x * k + ema * (1.0 - k)
-        return ema
+        return _ema_cached(seq.tobytes(), self.period, self.dtype.str)
 
 
 class RSIIndicator(BaseIndicator):
-    def __init__(self, period: int = 14, **_):
+    def __init__(self, period: int = 14, dtype=np.float64, **_):
         super().__init__(period)
+        self.dtype = np.dtype(dtype)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev: Optional[float] = None
+        self._changes: deque = deque(maxlen=self.period)
+        # somas correntes de ganhos/perdas da janela e quantas variações entram em cada uma
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._n_gain = 0
+        self._n_loss = 0
+
+    def push(self, value: float) -> Optional[float]:
+        """Adiciona um preço e devolve o RSI atual em O(1) (mesma janela de calculate)."""
+        v = safe_float(value, default=None)
+        if v is not None:
+            self.data.append(v)
+            if self._prev is not None:
+                if len(self._changes) == self.period:
+                    # a variação mais antiga sai da janela
+                    old = self._changes[0]
+                    if old > 0:
+                        self._gain_sum -= old
+                        self._n_gain -= 1
+                    elif old < 0:
+                        self._loss_sum += old
+                        self._n_loss -= 1
+                d = v - self._prev
+                self._changes.append(d)
+                if d > 0:
+                    self._gain_sum += d
+                    self._n_gain += 1
+                elif d < 0:
+                    self._loss_sum -= d
+                    self._n_loss += 1
+                # janela sem ganhos/perdas: zera a soma para não carregar resíduo de arredondamento
+                if not self._n_gain:
+                    self._gain_sum = 0.0
+                if not self._n_loss:
+                    self._loss_sum = 0.0
+            self._prev = v
+        if len(self._changes) < self.period:
+            return None
+        g = self._gain_sum / self.period
+        l = self._loss_sum / self.period
+        if l == 0.0:
+            return 100.0
+        return 100.0 - (100.0 / (1.0 + g / l))
 
     def calculate(self, data: Optional[List[float]] = None) -> Optional[float]:
-        seq = _clean_series(self.data if data is None else data)
-        if len(seq) < self.period + 1:
+        seq = _clean_array(self.data if data is None else data).astype(self.dtype, copy=False)
+        if seq.size < self.period + 1:
             return None
-        gains, losses = [], []
-        for i in range(1, len(seq)):
-            d = seq[i] - seq[i - 1]
-            gains.append(max(d, 0.0))
-            losses.append(-min(d, 0.0))
-        g = sum(gains[-self.period:]) / self.period
-        l = sum(losses[-self.period:]) / self.period
-        if l == 0:
-            return 100.0
-        rs = g / l
-        return 100.0 - (100.0 / (1.0 + rs))
+        return _rsi_cached(seq.tobytes(), self.period, self.dtype.str)
 
 
 class ATRIndicator(BaseIndicator):
-    def __init__(self, period: int = 14, **_):
+    def __init__(self, period: int = 14, dtype=np.float64, **_):
         super().__init__(period)
-        self._ohlc: List[tuple[float, float, float]] = []  # (high, low, close)
+        self.dtype = np.dtype(dtype)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        # Colunas contíguas (8 B por valor em float64, 4 B em float32) em vez de tuplas de PyFloat
+        self._high = array(self.dtype.char)
+        self._low = array(self.dtype.char)
+        self._close = array(self.dtype.char)
+        self._atr = 0.0
 
     def add_ohlc_data(self, high: float, low: float, close: float) -> None:
+        self.push(high, low, close)
+
+    def push(self, high: float, low: float, close: float) -> Optional[float]:
+        """Adiciona um candle e devolve o ATR de Wilder atual em O(1) (igual a atr_last)."""
         h = safe_float(high); l = safe_float(low); c = safe_float(close)
         if None not in (h, l, c):
-            self._ohlc.append((h, l, c))
+            self._high.append(h)
+            self._low.append(l)
+            self._close.append(c)
+            n = len(self._close) - 1
+            if n:
+                # relê das colunas para usar a mesma precisão armazenada que calculate()
+                h, l, prev_close = self._high[-1], self._low[-1], self._close[-2]
+                tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
+                if n < self.period:
+                    self._atr += tr
+                elif n == self.period:
+                    self._atr = (self._atr + tr) / self.period
+                else:
+                    self._atr = (self._atr * (self.period - 1) + tr) / self.period
+        if len(self._close) < self.period + 1:
+            return None
+        return self._atr
 
     def calculate(self, data=None) -> Optional[float]:
-        if len(self._ohlc) < self.period + 1:
-            return None
-        trs: List[float] = []
-        prev_close = self._ohlc[0][2]
-        for (h, l, c) in self._ohlc[1:]:
-            tr = max(h - l, abs(h - prev_close), abs(l - prev_close))
-            trs.append(tr)
-            prev_close = c
-        if len(trs) < self.period:
+        if len(self._close) < self.period + 1:
             return None
-        return sum(trs[-self.period:]) / self.period
+        return float(atr_last(
+            np.frombuffer(self._high, dtype=self.dtype),
+            np.frombuffer(self._low, dtype=self.dtype),
+            np.frombuffer(self._close, dtype=self.dtype),
+            self.period,
+        ))
 
 
 class UTBotIndicator(BaseIndicator):
@@ -114,20 +257,16 @@ class UTBotIndicator(BaseIndicator):
         self.multiplier = float(multiplier)
 
     def calculate_signals(self, prices: List[float]) -> List[str]:
-        seq = _clean_series(prices)
-        if len(seq) < 2:
+        seq = _clean_array(prices)
+        if seq.size < 2:
             return []
-        out: List[str] = []
-        for i in range(1, len(seq)):
-            prev, cur = seq[i - 1], seq[i]
-            change = (cur - prev) / prev if prev != 0 else 0.0
-            if change > 0.005 * self.multiplier:
-                out.append("buy")
-            elif change < -0.005 * self.multiplier:
-                out.append("sell")
-            else:
-                out.append("hold")
-        return out
+        prev = seq[:-1]
+        change = np.divide(np.diff(seq), prev, out=np.zeros(prev.shape), where=prev != 0)
+        thr = 0.005 * self.multiplier
+        out = np.full(change.shape, "hold", dtype=object)
+        out[change > thr] = "buy"
+        out[change < -thr] = "sell"
+        return out.tolist()
 
 
 class EWOIndicator(BaseIndicator):
@@ -135,19 +274,34 @@ class EWOIndicator(BaseIndicator):
         super().__init__(fast_period)
         self.fast_period = int(fast_period)
         self.slow_period = int(slow_period)
+        self._fast = EMAIndicator(self.fast_period)
+        self._slow = EMAIndicator(self.slow_period)
+
+    def reset(self) -> None:
+        super().reset()
+        self._fast.reset()
+        self._slow.reset()
+
+    def push(self, value: float) -> Optional[float]:
+        """Adiciona um preço e devolve EMA rápida - EMA lenta em O(1)."""
+        v = safe_float(value, default=None)
+        if v is not None:
+            self.data.append(v)
+            self._fast.push(v)
+            self._slow.push(v)
+        if len(self.data) < max(self.fast_period, self.slow_period):
+            return None
+        return self._fast._ema - self._slow._ema
 
-    def _ema(self, seq: List[float], p: int) -> float:
-        k = 2.0 / (p + 1.0)
-        v = seq[0]
-        for x in seq[1:]:
-            v = x * k + v * (1.0 - k)
-        return v
+    def _ema(self, seq: np.ndarray, p: int) -> float:
+        return _ema_last(seq, p)
 
     def calculate(self, data: Optional[List[float]] = None) -> Optional[float]:
-        seq = _clean_series(self.data if data is None else data)
-        if len(seq) < max(self.fast_period, self.slow_period):
+        seq = _clean_array(self.data if data is None else data)
+        if seq.size < max(self.fast_period, self.slow_period):
             return None
-        return self._ema(seq, self.fast_period) - self._ema(seq, self.slow_period)
+        buf = seq.tobytes()
+        return _ema_cached(buf, self.fast_period) - _ema_cached(buf, self.slow_period)
 
 
 class StochRSIIndicator(BaseIndicator):
@@ -155,39 +309,55 @@ class StochRSIIndicator(BaseIndicator):
         super().__init__(rsi_period)
         self.rsi_period = int(rsi_period)
         self.stoch_period = int(stoch_period)
-
-    def calculate(self, data: Optional[List[float]] = None) -> Optional[float]:
-        seq = _clean_series(self.data if data is None else data)
-        if len(seq) < self.rsi_period + self.stoch_period + 1:
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self._prev: Optional[float] = None
+        self._changes = 0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._rsis: deque = deque(maxlen=self.stoch_period)
+
+    def push(self, value: float) -> Optional[float]:
+        """Adiciona um preço e devolve o StochRSI atual (RSI de Wilder incremental, como wilder_rsi_series)."""
+        v = safe_float(value, default=None)
+        if v is not None:
+            self.data.append(v)
+            if self._prev is not None:
+                d = v - self._prev
+                gain = d if d > 0.0 else 0.0
+                loss = -d if d < 0.0 else 0.0
+                p = self.rsi_period
+                self._changes += 1
+                if self._changes < p:
+                    self._avg_gain += gain
+                    self._avg_loss += loss
+                else:
+                    if self._changes == p:
+                        self._avg_gain = (self._avg_gain + gain) / p
+                        self._avg_loss = (self._avg_loss + loss) / p
+                    else:
+                        self._avg_gain = (self._avg_gain * (p - 1) + gain) / p
+                        self._avg_loss = (self._avg_loss * (p - 1) + loss) / p
+                    if self._avg_loss == 0.0:
+                        self._rsis.append(100.0)
+                    else:
+                        self._rsis.append(100.0 - (100.0 / (1.0 + self._avg_gain / self._avg_loss)))
+            self._prev = v
+        if len(self.data) < self.rsi_period + self.stoch_period + 1:
             return None
+        lo = min(self._rsis)
+        hi = max(self._rsis)
+        if hi == lo:
+            return 0.5
+        return (self._rsis[-1] - lo) / (hi - lo)
 
-        def _rsi(vals: List[float], p: int) -> Optional[float]:
-            if len(vals) < p + 1:
-                return None
-            gains, losses = [], []
-            for i in range(1, len(vals)):
-                d = vals[i] - vals[i - 1]
-                gains.append(max(d, 0.0))
-                losses.append(-min(d, 0.0))
-            g = sum(gains[-p:]) / p
-            l = sum(losses[-p:]) / p
-            if l == 0:
-                return 100.0
-            rs = g / l
-            return 100.0 - (100.0 / (1.0 + rs))
-
-        rsi_series: List[float] = []
-        for i in range(self.rsi_period, len(seq)):
-            r = _rsi(seq[: i + 1], self.rsi_period)
-            if r is not None:
-                rsi_series.append(r)
-        if len(rsi_series) < self.stoch_period:
+    def calculate(self, data: Optional[List[float]] = None) -> Optional[float]:
+        seq = _clean_array(self.data if data is None else data)
+        if seq.size < self.rsi_period + self.stoch_period + 1:
             return None
-        window = rsi_series[-self.stoch_period:]
-        mn, mx = min(window), max(window)
-        if mx == mn:
-            return 0.5
-        return (rsi_series[-1] - mn) / (mx - mn)
+        return _stochrsi_cached(seq.tobytes(), self.rsi_period, self.stoch_period)
 
 
 class HeikinAshiIndicator:
@@ -196,23 +366,97 @@ class HeikinAshiIndicator:
         pass
 
     def calculate_candles(self, ohlc: List[dict]) -> List[dict]:
-        out: List[dict] = []
-        ha_open = None
-        for i, c in enumerate(ohlc):
-            o = safe_float(c.get("open")); h = safe_float(c.get("high"))
-            l = safe_float(c.get("low"));  cl = safe_float(c.get("close"))
-            if None in (o, h, l, cl):
-                continue
-            ha_close = (o + h + l + cl) / 4.0
-            if i == 0:
-                ha_open = (o + cl) / 2.0
-            else:
-                prev = out[-1]
-                ha_open = (prev["open"] + prev["close"]) / 2.0
-            ha_high = max(h, ha_open, ha_close)
-            ha_low = min(l, ha_open, ha_close)
-            out.append({"open": ha_open, "high": ha_high, "low": ha_low, "close": ha_close})
-        return out
+        rows = _ohlc_matrix(ohlc)
+        if not rows.shape[0]:
+            return []
+        o, h, l, c = rows.T
+
+        ha_close = 0.25 * (o + h + l + c)
+        # ha_open[i] = (ha_open[i-1] + ha_close[i-1]) / 2 = sum_k 0.5^k * ha_close[i-k]
+        # + 0.5^i * semente; os pesos caem abaixo do epsilon do float64 após _HA_TAPS termos
+        ha_open = np.convolve(ha_close, _HA_KERNEL)[: ha_close.size]
+        ha_open += 0.5 * (o[0] + c[0]) * 0.5 ** np.arange(ha_close.size)
+        ha_high = np.maximum(np.maximum(h, ha_open), ha_close)
+        ha_low = np.minimum(np.minimum(l, ha_open), ha_close)
+
+        return [
+            {"open": op, "high": hi, "low": lo, "close": cl}
+            for op, hi, lo, cl in zip(ha_open.tolist(), ha_high.tolist(), ha_low.tolist(), ha_close.tolist())
+        ]
+
+
+def compute_indicators(
+    close: Iterable[float],
+    high: Optional[Iterable[float]] = None,
+    low: Optional[Iterable[float]] = None,
+    *,
+    ema_fast: int = 5,
+    ema_slow: int = 35,
+    rsi_period: int = 14,
+    atr_period: int = 14,
+    stoch_period: int = 14,
+    multiplier: float = 2.0,
+) -> Dict[str, Union[float, str, None]]:
+    """
+    Últimos valores de EMA, EWO, RSI, ATR, StochRSI e sinal UTBot numa única passada.
+
+    Equivale a chamar calculate() de cada indicador sobre a mesma série, sem percorrê-la
+    cinco vezes. Sem `high`/`low` o ATR volta None; candles com algum campo inválido
+    são descartados por inteiro para manter as colunas alinhadas. `close`, `high` e
+    `low` com tamanhos diferentes levantam ValueError.
+    """
+    if high is None or low is None:
+        c = _clean_array(close)
+        h = l = c
+    else:
+        rows = np.array(
+            # strict: colunas de tamanhos diferentes são erro, não truncamento silencioso
+            [[safe_float(v, default=math.nan) for v in row] for row in zip(close, high, low, strict=True)],
+            dtype=np.float64,
+        ).reshape(-1, 3)
+        rows = rows[np.isfinite(rows).all(axis=1)]
+        c, h, l = (np.ascontiguousarray(col) for col in rows.T)
+
+    ef, es, rsi, atr, stoch, change = compute_all(
+        c, h, l, int(ema_fast), int(ema_slow), int(rsi_period), int(atr_period), int(stoch_period)
+    )
+    n = c.size
+    thr = 0.005 * float(multiplier)
+
+    def _val(v: float) -> Optional[float]:
+        return None if math.isnan(v) else float(v)
+
+    signal = None
+    if n >= 2:
+        signal = "buy" if change > thr else "sell" if change < -thr else "hold"
+    return {
+        "ema_fast": _val(ef),
+        "ema_slow": _val(es),
+        "ewo": float(ef - es) if n >= max(ema_fast, ema_slow) else None,
+        "rsi": _val(rsi),
+        "atr": _val(atr) if h is not c else None,
+        "stochrsi": _val(stoch),
+        "utbot": signal,
+    }
+
+
+# Núcleo da recorrência do Heikin Ashi: [0, 0.5, 0.25, ...] (0.5^64 < eps relativo)
+_HA_TAPS = 64
+_HA_KERNEL = np.concatenate(([0.0], 0.5 ** np.arange(1, _HA_TAPS + 1)))
+
+
+def _ohlc_matrix(ohlc: List[dict]) -> np.ndarray:
+    """Matriz (n, 4) open/high/low/close, descartando candles com campos inválidos."""
+    fields = ("open", "high", "low", "close")
+    try:
+        rows = np.array([[c.get(f) for f in fields] for c in ohlc], dtype=np.float64)
+    except (TypeError, ValueError):
+        rows = np.array(
+            [[safe_float(c.get(f), default=math.nan) for f in fields] for c in ohlc],
+            dtype=np.float64,
+        )
+    rows = rows.reshape(-1, 4)
+    return rows[np.isfinite(rows).all(axis=1)]
 
 
 __all__ = [
@@ -225,4 +469,8 @@ __all__ = [
     "EWOIndicator",
     "StochRSIIndicator",
     "HeikinAshiIndicator",
+    "compute_indicators",
 ]
+
+# aquecimento explícito (ex.: ao iniciar um bot), nunca no import do pacote
+from ._warmup import maybe_warmup  # noqa: E402,F401
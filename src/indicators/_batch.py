@@ -0,0 +1,104 @@
+# Cálculo conjunto dos indicadores de um símbolo numa única passada sobre os candles
+from __future__ import annotations
+
+import numpy as np
+
+from ._kernels import njit
+
+
+@njit(cache=True, nogil=True)
+def compute_all(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    ema_fast: int,
+    ema_slow: int,
+    rsi_period: int,
+    atr_period: int,
+    stoch_period: int,
+):
+    """
+    Valores finais de EMA rápida/lenta, RSI, ATR, StochRSI e a última variação (UTBot).
+
+    Percorre `close` uma vez atualizando todos os estados em paralelo, com a mesma
+    semântica dos kernels individuais (EMA semeada no primeiro preço, RSI pelas médias
+    simples das últimas `rsi_period` variações, ATR e StochRSI de Wilder). Indicadores
+    sem dados suficientes voltam como NaN; `high`/`low` devem ter o tamanho de `close`.
+    """
+    n = close.shape[0]
+    nan = np.nan
+    if n == 0:
+        return nan, nan, nan, nan, nan, nan
+
+    kf = 2.0 / (ema_fast + 1.0)
+    ks = 2.0 / (ema_slow + 1.0)
+    ef = float(close[0])
+    es = ef
+
+    rsi_gain = 0.0
+    rsi_loss = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    atr = 0.0
+    stoch_lo = np.inf
+    stoch_hi = -np.inf
+    wilder = nan
+
+    for i in range(1, n):
+        x = float(close[i])
+        d = x - float(close[i - 1])
+        gain = d if d > 0.0 else 0.0
+        loss = -d if d < 0.0 else 0.0
+
+        ef += kf * (x - ef)
+        es += ks * (x - es)
+
+        # RSI simples: só as últimas `rsi_period` variações entram na soma
+        if i >= n - rsi_period:
+            rsi_gain += gain
+            rsi_loss += loss
+
+        # RSI de Wilder (base do StochRSI), semeado com a média das primeiras variações
+        if i < rsi_period:
+            avg_gain += gain
+            avg_loss += loss
+        else:
+            if i == rsi_period:
+                avg_gain = (avg_gain + gain) / rsi_period
+                avg_loss = (avg_loss + loss) / rsi_period
+            else:
+                avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+                avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+            wilder = 100.0 if avg_loss == 0.0 else 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+            if i >= n - stoch_period:
+                stoch_lo = min(stoch_lo, wilder)
+                stoch_hi = max(stoch_hi, wilder)
+
+        prev_close = float(close[i - 1])
+        tr = float(max(high[i] - low[i], abs(high[i] - prev_close), abs(low[i] - prev_close)))
+        if i < atr_period:
+            atr += tr
+        elif i == atr_period:
+            atr = (atr + tr) / atr_period
+        else:
+            atr = (atr * (atr_period - 1) + tr) / atr_period
+
+    rsi = nan
+    if n >= rsi_period + 1:
+        g = rsi_gain / rsi_period
+        l = rsi_loss / rsi_period
+        rsi = 100.0 if l == 0.0 else 100.0 - (100.0 / (1.0 + g / l))
+
+    stoch = nan
+    if n >= rsi_period + stoch_period + 1:
+        stoch = 0.5 if stoch_hi == stoch_lo else (wilder - stoch_lo) / (stoch_hi - stoch_lo)
+
+    if n < atr_period + 1:
+        atr = nan
+
+    change = nan
+    if n >= 2:
+        prev = float(close[n - 2])
+        change = (float(close[n - 1]) - prev) / prev if prev != 0.0 else 0.0
+
+    return ef, es, rsi, atr, stoch, change
@@ -0,0 +1,93 @@
+# Kernels numéricos dos indicadores (compilados com Numba quando disponível)
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except ImportError:  # numba é opcional: sem ele os kernels rodam como Python puro
+    HAS_NUMBA = False
+
+    def njit(*args, **_kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+@njit(cache=True, nogil=True)
+def rsi_last(seq: np.ndarray, period: int) -> float:
+    """RSI (médias simples das últimas `period` variações) do último ponto de `seq`."""
+    d = np.diff(seq[seq.shape[0] - period - 1:]).astype(np.float64)
+    g = np.maximum(d, 0.0).sum() / period
+    l = -np.minimum(d, 0.0).sum() / period
+    if l == 0.0:
+        return 100.0
+    return 100.0 - (100.0 / (1.0 + g / l))
+
+
+@njit(cache=True, nogil=True)
+def wilder_rsi_series(seq: np.ndarray, period: int) -> np.ndarray:
+    """
+    Série de RSI com suavização de Wilder numa única passada (O(n), uma alocação).
+
+    Semente = média simples das primeiras `period` variações, como em
+    indicators_legacy.RSIIndicator.add_value; o item k corresponde a seq[period + k].
+    """
+    n = seq.shape[0]
+    out = np.empty(n - period, dtype=np.float64)
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for j in range(1, period + 1):
+        d = float(seq[j] - seq[j - 1])
+        if d > 0.0:
+            avg_gain += d
+        elif d < 0.0:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    for k in range(n - period):
+        if k > 0:
+            d = float(seq[period + k] - seq[period + k - 1])
+            gain = d if d > 0.0 else 0.0
+            loss = -d if d < 0.0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0.0:
+            out[k] = 100.0
+        else:
+            out[k] = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+@njit(cache=True, nogil=True)
+def stochrsi_last(seq: np.ndarray, rsi_period: int, stoch_period: int) -> float:
+    """StochRSI do último ponto: (rsi - min) / (max - min) nas últimas `stoch_period` RSIs de Wilder."""
+    window = wilder_rsi_series(seq, rsi_period)[-stoch_period:]
+    lo = window.min()
+    hi = window.max()
+    if hi == lo:
+        return 0.5
+    return (window[-1] - lo) / (hi - lo)
+
+
+@njit(cache=True, nogil=True)
+def atr_last(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int) -> float:
+    """
+    ATR de Wilder do último candle numa única passada (requer len >= period + 1).
+
+    TR começa no segundo candle (usa o fechamento anterior); semente = média simples
+    dos primeiros `period` TRs, depois atr = (atr * (period - 1) + tr) / period.
+    """
+    atr = 0.0  # acumulador float64 mesmo com colunas float32
+    for i in range(1, high.shape[0]):
+        tr = float(max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1])))
+        if i < period:
+            atr += tr
+        elif i == period:
+            atr = (atr + tr) / period
+        else:
+            atr = (atr * (period - 1) + tr) / period
+    return atr
@@ -0,0 +1,43 @@
+# Aquecimento dos kernels JIT: compila antes do primeiro tick real
+from __future__ import annotations
+
+import numpy as np
+
+from ._batch import compute_all
+from ._kernels import HAS_NUMBA, atr_last, rsi_last, stochrsi_last
+
+_WARMUP_SIZE = 500
+
+
+def warmup_kernels(size: int = _WARMUP_SIZE) -> None:
+    """Executa cada kernel uma vez com dados sintéticos, nas mesmas assinaturas dos chamadores."""
+    rng = np.random.default_rng(0)
+    close = 100.0 + np.cumsum(rng.standard_normal(size))
+    high = close + 1.0
+    low = close - 1.0
+    # _rsi_cached/_stochrsi_cached leem a série de bytes: arrays somente-leitura
+    # (o Numba compila uma assinatura separada para eles)
+    frozen = np.frombuffer(close.tobytes(), dtype="<f8")
+    rsi_last(frozen, 14)
+    stochrsi_last(frozen, 14, 14)
+    # ATRIndicator lê das colunas array('d') e compute_indicators de arrays próprios: graváveis
+    atr_last(high, low, close, 14)
+    compute_all(close, high, low, 5, 35, 14, 14, 14)
+
+
+_warmed_up = False
+
+
+def maybe_warmup() -> None:
+    """Aquece os kernels uma vez se Numba estiver instalado e `settings.indicator_warmup` ativo."""
+    global _warmed_up
+    if _warmed_up or not HAS_NUMBA:
+        return  # já compilado, ou sem JIT não há compilação a antecipar
+    try:
+        from config.settings import settings  # type: ignore
+        enabled = bool(getattr(settings, "indicator_warmup", False))
+    except Exception:
+        enabled = False
+    if enabled:
+        warmup_kernels()
+        _warmed_up = True
@@ -2,7 +2,8 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from typing import List, Dict, Optional
-import math
+
+from src.indicators import safe_float as _safe_float
 
 # ---------- Base ----------
 class BaseIndicator:
@@ -213,8 +214,6 @@ class HeikinAshiIndicator:
         return ha
 
 
-# Helpers para robustez (NaN/Inf clamp)
+# Helpers para robustez (NaN/Inf clamp) — mesma implementação de src.indicators
 def safe_float(x: float, default: float = 0.0) -> float:
-    if x is None or math.isnan(x) or math.isinf(x):
-        return default
-    return float(x)
+    return _safe_float(x, default)
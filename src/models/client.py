@@ -10,6 +10,42 @@ import uuid
 from .database import Base
 
 
+def _generated_to_dict(*fields, name="to_dict"):
+    """
+    Decorator que gera o serializador da classe uma única vez, a partir das colunas.
+
+    Cada campo vira uma leitura direta do atributo: UUID -> str(), DateTime -> isoformat()
+    (ou None), demais tipos sem conversão. Evita montar o dict campo a campo em Python
+    genérico a cada linha serializada.
+    """
+    def decorate(cls):
+        columns = cls.__table__.columns
+        items = []
+        for field in fields:
+            column_type = columns[field].type
+            if isinstance(column_type, UUID):
+                expr = f"str(self.{field})"
+            elif isinstance(column_type, DateTime):
+                expr = f"(v.isoformat() if (v := self.{field}) else None)"
+            else:
+                expr = f"self.{field}"
+            items.append(f"{field!r}: {expr}")
+        source = f"def {name}(self):\n    return {{{', '.join(items)}}}\n"
+        namespace = {}
+        exec(compile(source, f"<{cls.__name__}.{name}>", "exec"), namespace)
+        fn = namespace[name]
+        fn.__qualname__ = f"{cls.__name__}.{name}"
+        fn.__doc__ = "Convert to dictionary"
+        setattr(cls, name, fn)
+        return cls
+    return decorate
+
+
+@_generated_to_dict(
+    "id", "email", "name", "is_active", "is_verified", "trading_config", "risk_config",
+    "created_at", "updated_at", "last_login",
+    name="_public_dict",
+)
 class Client(Base):
     """Client model"""
     __tablename__ = "clients"
@@ -44,18 +80,7 @@ class Client(Base):
     
     def to_dict(self, include_sensitive=False):
         """Convert to dictionary"""
-        data = {
-            "id": str(self.id),
-            "email": self.email,
-            "name": self.name,
-            "is_active": self.is_active,
-            "is_verified": self.is_verified,
-            "trading_config": self.trading_config,
-            "risk_config": self.risk_config,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "last_login": self.last_login.isoformat() if self.last_login else None
-        }
+        data = self._public_dict()
         
         if include_sensitive:
             data.update({
@@ -66,6 +91,11 @@ class Client(Base):
         return data
 
 
+@_generated_to_dict(
+    "id", "client_id", "session_token", "ip_address", "user_agent", "is_active",
+    "created_at", "expires_at", "last_activity",
+    name="_columns_dict",
+)
 class ClientSession(Base):
     """Client session model for tracking active sessions"""
     __tablename__ = "client_sessions"
@@ -98,20 +128,15 @@ class ClientSession(Base):
     
     def to_dict(self):
         """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "client_id": str(self.client_id),
-            "session_token": self.session_token,
-            "ip_address": self.ip_address,
-            "user_agent": self.user_agent,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "last_activity": self.last_activity.isoformat() if self.last_activity else None,
-            "is_expired": self.is_expired()
-        }
+        data = self._columns_dict()
+        data["is_expired"] = self.is_expired()
+        return data
 
 
+@_generated_to_dict(
+    "id", "client_id", "config_name", "config_type", "config_data", "is_active", "is_default",
+    "created_at", "updated_at",
+)
 class ClientConfiguration(Base):
     """Client trading configuration model"""
     __tablename__ = "client_configurations"
@@ -139,22 +164,12 @@ class ClientConfiguration(Base):
     
     def __repr__(self):
         return f"<ClientConfiguration(id={self.id}, client_id={self.client_id}, name={self.config_name})>"
-    
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "client_id": str(self.client_id),
-            "config_name": self.config_name,
-            "config_type": self.config_type,
-            "config_data": self.config_data,
-            "is_active": self.is_active,
-            "is_default": self.is_default,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
 
 
+@_generated_to_dict(
+    "id", "client_id", "symbol", "side", "size", "entry_price", "mark_price",
+    "unrealized_pnl", "realized_pnl", "is_open", "opened_at", "closed_at", "updated_at",
+)
 class TradingPosition(Base):
     """Trading position model"""
     __tablename__ = "trading_positions"
@@ -186,26 +201,12 @@ class TradingPosition(Base):
     
     def __repr__(self):
         return f"<TradingPosition(id={self.id}, client_id={self.client_id}, symbol={self.symbol})>"
-    
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "client_id": str(self.client_id),
-            "symbol": self.symbol,
-            "side": self.side,
-            "size": self.size,
-            "entry_price": self.entry_price,
-            "mark_price": self.mark_price,
-            "unrealized_pnl": self.unrealized_pnl,
-            "realized_pnl": self.realized_pnl,
-            "is_open": self.is_open,
-            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
-            "closed_at": self.closed_at.isoformat() if self.closed_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
 
 
+@_generated_to_dict(
+    "id", "client_id", "exchange_order_id", "symbol", "side", "order_type", "quantity", "price",
+    "filled_quantity", "avg_price", "status", "created_at", "filled_at", "updated_at",
+)
 class TradingOrder(Base):
     """Trading order model"""
     __tablename__ = "trading_orders"
@@ -238,23 +239,3 @@ class TradingOrder(Base):
     
     def __repr__(self):
         return f"<TradingOrder(id={self.id}, client_id={self.client_id}, symbol={self.symbol})>"
-    
-    def to_dict(self):
-        """Convert to dictionary"""
-        return {
-            "id": str(self.id),
-            "client_id": str(self.client_id),
-            "exchange_order_id": self.exchange_order_id,
-            "symbol": self.symbol,
-            "side": self.side,
-            "order_type": self.order_type,
-            "quantity": self.quantity,
-            "price": self.price,
-            "filled_quantity": self.filled_quantity,
-            "avg_price": self.avg_price,
-            "status": self.status,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "filled_at": self.filled_at.isoformat() if self.filled_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
-        }
-
@@ -1,9 +1,15 @@
 # src/models/database.py
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from operator import itemgetter
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
 from datetime import datetime
 
+import numpy as np
+
 # Declarative base compat (evita warnings nos testes que importam Base)
 try:
     from sqlalchemy.orm import declarative_base  # type: ignore
@@ -13,6 +19,35 @@ except Exception:
     Base = _DummyBase()  # type: ignore
 
 
+# máximo de logs mantidos em memória (os mais antigos são descartados)
+_MAX_LOGS = 100_000
+
+# candles mantidos por símbolo/intervalo (os mais antigos são descartados)
+_MAX_CANDLES = 5000
+
+# colunas do bucket de candles (SoA) e seus dtypes
+_CANDLE_COLUMNS: Tuple[Tuple[str, Any], ...] = (
+    ("timestamp", np.int64),
+    ("open", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("close", np.float64),
+    ("volume", np.float64),
+)
+
+# campos obrigatórios do candle, lidos de uma vez (volume é opcional)
+_CANDLE_FIELDS = itemgetter("timestamp", "open", "high", "low", "close")
+
+
+def _candle_columns(candles: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Converte a lista de candles em colunas numpy numa única passada Python."""
+    rows = [(*_CANDLE_FIELDS(c), c.get("volume", 0.0)) for c in candles]
+    return {
+        name: np.array(values, dtype=dtype)
+        for (name, dtype), values in zip(_CANDLE_COLUMNS, zip(*rows))
+    }
+
+
 @dataclass
 class _User:
     id: int
@@ -29,8 +64,12 @@ class DatabaseManager:
     def __init__(self) -> None:
         self._users: Dict[int, _User] = {}
         self._user_seq: int = 0
-        self._logs: List[Dict[str, Any]] = []
-        self._market: Dict[str, List[Dict[str, Any]]] = {}  # key: f"{symbol}:{interval}"
+        self._logs: Deque[Dict[str, Any]] = deque(maxlen=_MAX_LOGS)
+        self._next_log_id: int = 1
+        # key: (symbol, interval) -> colunas NumPy ordenadas por timestamp;
+        # _market_span guarda o intervalo [início, fim) ocupado em cada buffer
+        self._market: Dict[Tuple[str, str], Dict[str, np.ndarray]] = {}
+        self._market_span: Dict[Tuple[str, str], Tuple[int, int]] = {}
 
     # ---- Users ----
     async def create_user(self, username: str, email: str, password_hash: str) -> Dict[str, Any]:
@@ -47,44 +86,81 @@ class DatabaseManager:
 
     # ---- Market data ----
     async def store_market_data(self, symbol: str, interval: str, candles: List[Dict[str, Any]]) -> int:
-        key = f"{symbol}:{interval}"
-        bucket = self._market.setdefault(key, [])
-        for c in candles:
-            # padroniza e garante chaves
-            bucket.append({
-                "timestamp": int(c["timestamp"]),
-                "open": float(c["open"]),
-                "high": float(c["high"]),
-                "low": float(c["low"]),
-                "close": float(c["close"]),
-                "volume": float(c.get("volume", 0.0)),
-            })
-        # mantém só os últimos 5000 por segurança
-        if len(bucket) > 5000:
-            self._market[key] = bucket[-5000:]
-        return len(candles)
+        key = (symbol, interval)
+        n = len(candles)
+        if not n:
+            return 0
+
+        # padroniza e garante chaves (uma passada, transposta em colunas)
+        new = _candle_columns(candles)
+        ts = new["timestamp"]
+        if not np.all(ts[1:] >= ts[:-1]):
+            order = np.argsort(ts, kind="stable")
+            new = {name: col[order] for name, col in new.items()}
+        if n > _MAX_CANDLES:
+            # já ordenado: os de timestamp mais antigo ficam de fora
+            new = {name: col[-_MAX_CANDLES:] for name, col in new.items()}
+        ts = new["timestamp"]
+        m = ts.shape[0]
+
+        start, end = self._market_span.get(key, (0, 0))
+        cols = self._market.get(key)
+        if cols is None or end + m > cols["timestamp"].shape[0]:
+            # realoca (no máximo 2x o limite) levando todas as linhas vivas; o corte dos
+            # mais antigos só acontece depois do merge, como no caminho sem realocação
+            live = end - start
+            capacity = min(max(64, 2 * (live + m)), 2 * _MAX_CANDLES)
+            fresh = {name: np.empty(capacity, dtype) for name, dtype in _CANDLE_COLUMNS}
+            if cols is not None:
+                for name, _ in _CANDLE_COLUMNS:
+                    fresh[name][:live] = cols[name][start:end]
+            cols = self._market[key] = fresh
+            start, end = 0, live
+
+        if end == start or ts[0] >= cols["timestamp"][end - 1]:
+            # caso comum (candles cronológicos): append no fim do buffer
+            for name, _ in _CANDLE_COLUMNS:
+                cols[name][end:end + m] = new[name]
+        else:
+            # fora de ordem: intercala o lote já ordenado nas posições de bisect
+            # (side="right" mantém os existentes antes dos novos com mesmo timestamp)
+            pos = np.searchsorted(cols["timestamp"][start:end], ts, side="right")
+            for name, _ in _CANDLE_COLUMNS:
+                cols[name][start:end + m] = np.insert(cols[name][start:end], pos, new[name])
+        end += m
+        # mantém só os últimos 5000 por segurança (recorte da janela, sem cópia)
+        self._market_span[key] = (max(start, end - _MAX_CANDLES), end)
+        return n
 
     async def get_market_data(self, symbol: str, interval: str, limit: int = 100) -> List[Dict[str, Any]]:
-        key = f"{symbol}:{interval}"
-        data = list(self._market.get(key, []))
-        # mais recente primeiro
-        data.sort(key=lambda x: x["timestamp"], reverse=True)
-        return data[:limit]
+        key = (symbol, interval)
+        start, end = self._market_span.get(key, (0, 0))
+        if end == start or limit <= 0:
+            return []
+        cols = self._market[key]
+        # mais recente primeiro: as últimas `limit` linhas invertidas, O(limit)
+        first = max(end - limit, start)
+        names = [name for name, _ in _CANDLE_COLUMNS]
+        rows = zip(*(cols[name][first:end][::-1].tolist() for name in names))
+        return [dict(zip(names, row)) for row in rows]
 
     # ---- Logging ----
     async def log_message(self, level: str, message: str, module: str, user_id: Optional[int] = None, meta: Optional[Dict[str, Any]] = None) -> int:
-        log_id = len(self._logs) + 1
+        log_id = self._next_log_id
+        self._next_log_id += 1
         self._logs.append({
             "id": log_id,
             "level": level,
             "message": message,
             "module": module,
             "user_id": user_id,
-            "meta": dict(meta or {}),
-            "created_at": datetime.utcnow().timestamp()
+            # meta é do chamador (normalmente um dict recém-montado): guardado sem cópia
+            "meta": meta if meta is not None else {},
+            "created_at": time.time()
         })
         return log_id
 
     async def get_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
-        data = sorted(self._logs, key=lambda x: x["created_at"], reverse=True)
-        return data[:limit]
+        # mais recente primeiro: log_message sempre acrescenta no fim, então a ordem de
+        # inserção já é a ordem cronológica; O(limit) em vez de ordenar tudo
+        return list(islice(reversed(self._logs), max(limit, 0)))
@@ -3,11 +3,16 @@
 Sistema completo de coleta e exposição de métricas
 Localização: /src/monitoring/metrics.py
 """
+import asyncio
+import functools
+import platform
+import sys
 import time
 import threading
 import psutil
+from collections import deque
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime
 from prometheus_client import (
     Counter, Histogram, Gauge, Summary, Info,
     CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST,
@@ -15,10 +20,25 @@ from prometheus_client import (
 )
 import logging
 from dataclasses import dataclass
+from types import SimpleNamespace
+
+import numpy as np
 
 
 logger = logging.getLogger(__name__)
 
+# Histórico mantido pelo TradingMetrics (os registros mais antigos são descartados)
+_MAX_TRADE_HISTORY = 100_000
+_MAX_POSITION_HISTORY = 10_000
+_MAX_ORDER_HISTORY = 100_000
+# Partições de disco são reenumeradas só a cada 10 min; pseudo-sistemas de arquivos ignorados
+_PARTITIONS_REFRESH_SECONDS = 600
+_PSEUDO_FSTYPES = frozenset({'tmpfs', 'devtmpfs', 'squashfs', 'overlay'})
+# Payload de /metrics reaproveitado entre scrapes mais próximos que isso (segundos)
+_SCRAPE_CACHE_SECONDS = 0.5
+# Janela de atualizações de posição usada na contagem de posições abertas
+_OPEN_POSITIONS_WINDOW = 100
+
 
 @dataclass
 class MetricDefinition:
@@ -29,233 +49,260 @@ class MetricDefinition:
     labels: List[str] = None
 
 
+# Registry próprio do módulo (o REGISTRY global do prometheus_client já é usado por
+# src/api/metrics.py com nomes iguais) e métricas construídas uma vez por registry
+_DEFAULT_REGISTRY = CollectorRegistry()
+_METRICS_BY_REGISTRY: Dict[CollectorRegistry, SimpleNamespace] = {}
+_METRICS_LOCK = threading.Lock()
+
+
+def _build_metrics(registry: CollectorRegistry) -> SimpleNamespace:
+    """Criar (uma única vez por registry) as métricas básicas"""
+    m = SimpleNamespace()
+    
+    # Métricas HTTP/API
+    m.http_requests_total = Counter(
+        'http_requests_total',
+        'Total HTTP requests',
+        ['method', 'endpoint', 'status'],
+        registry=registry
+    )
+    
+    m.http_request_duration = Histogram(
+        'http_request_duration_seconds',
+        'HTTP request duration',
+        ['method', 'endpoint'],
+        registry=registry
+    )
+    
+    # Métricas do Bot
+    m.bot_trades_total = Counter(
+        'bot_trades_total',
+        'Total trades executed',
+        ['strategy', 'symbol', 'side'],
+        registry=registry
+    )
+    
+    m.bot_pnl = Gauge(
+        'bot_pnl_total',
+        'Total P&L',
+        ['strategy', 'symbol'],
+        registry=registry
+    )
+    
+    m.bot_account_balance = Gauge(
+        'bot_account_balance',
+        'Account balance',
+        ['currency'],
+        registry=registry
+    )
+    
+    m.bot_positions = Gauge(
+        'bot_positions_count',
+        'Number of open positions',
+        ['strategy', 'symbol'],
+        registry=registry
+    )
+    
+    m.bot_orders_total = Counter(
+        'bot_orders_total',
+        'Total orders placed',
+        ['strategy', 'symbol', 'side', 'status'],
+        registry=registry
+    )
+    
+    # Métricas de Performance
+    m.bot_win_rate = Gauge(
+        'bot_win_rate',
+        'Win rate percentage',
+        ['strategy'],
+        registry=registry
+    )
+    
+    m.bot_max_drawdown = Gauge(
+        'bot_max_drawdown_percent',
+        'Maximum drawdown percentage',
+        ['strategy'],
+        registry=registry
+    )
+    
+    m.bot_sharpe_ratio = Gauge(
+        'bot_sharpe_ratio',
+        'Sharpe ratio',
+        ['strategy'],
+        registry=registry
+    )
+    
+    # Métricas de Sistema
+    m.system_cpu_usage = Gauge(
+        'system_cpu_usage_percent',
+        'CPU usage percentage',
+        registry=registry
+    )
+    
+    m.system_memory_usage = Gauge(
+        'system_memory_usage_bytes',
+        'Memory usage in bytes',
+        registry=registry
+    )
+    
+    m.system_disk_usage = Gauge(
+        'system_disk_usage_percent',
+        'Disk usage percentage',
+        ['mountpoint'],
+        registry=registry
+    )
+    
+    # Métricas de Conexão
+    m.api_connection_errors = Counter(
+        'bot_api_connection_errors_total',
+        'API connection errors',
+        ['exchange', 'error_type'],
+        registry=registry
+    )
+    
+    m.api_rate_limit_errors = Counter(
+        'bot_api_rate_limit_errors_total',
+        'API rate limit errors',
+        ['exchange'],
+        registry=registry
+    )
+    
+    # Métricas de Autenticação
+    m.auth_attempts = Counter(
+        'auth_attempts_total',
+        'Authentication attempts',
+        ['status'],
+        registry=registry
+    )
+    
+    m.auth_failed_logins = Counter(
+        'auth_failed_logins_total',
+        'Failed login attempts',
+        ['reason'],
+        registry=registry
+    )
+    
+    # Métricas de Aplicação
+    m.app_info = Info(
+        'app_info',
+        'Application information',
+        registry=registry
+    )
+    
+    m.app_uptime = Gauge(
+        'app_uptime_seconds',
+        'Application uptime in seconds',
+        registry=registry
+    )
+    
+    # Definir informações da aplicação
+    m.app_info.info({
+        'version': '1.0.0',
+        'name': 'crypto-trading-mvp',
+        'environment': 'development'
+    })
+    
+    return m
+
+
+def _metrics_for(registry: CollectorRegistry) -> SimpleNamespace:
+    """Métricas já registradas em `registry` (criadas na primeira chamada)"""
+    with _METRICS_LOCK:
+        metrics = _METRICS_BY_REGISTRY.get(registry)
+        if metrics is None:
+            metrics = _METRICS_BY_REGISTRY[registry] = _build_metrics(registry)
+        return metrics
+
+
 class PrometheusMetrics:
     """Coletor de métricas Prometheus"""
     
     def __init__(self, registry: Optional[CollectorRegistry] = None):
-        self.registry = registry or CollectorRegistry()
+        self.registry = registry or _DEFAULT_REGISTRY
         self._metrics = {}
-        self._setup_metrics()
-    
-    def _setup_metrics(self):
-        """Configurar métricas básicas"""
-        
-        # Métricas HTTP/API
-        self.http_requests_total = Counter(
-            'http_requests_total',
-            'Total HTTP requests',
-            ['method', 'endpoint', 'status'],
-            registry=self.registry
-        )
-        
-        self.http_request_duration = Histogram(
-            'http_request_duration_seconds',
-            'HTTP request duration',
-            ['method', 'endpoint'],
-            registry=self.registry
-        )
-        
-        # Métricas do Bot
-        self.bot_trades_total = Counter(
-            'bot_trades_total',
-            'Total trades executed',
-            ['strategy', 'symbol', 'side'],
-            registry=self.registry
-        )
-        
-        self.bot_pnl = Gauge(
-            'bot_pnl_total',
-            'Total P&L',
-            ['strategy', 'symbol'],
-            registry=self.registry
-        )
-        
-        self.bot_account_balance = Gauge(
-            'bot_account_balance',
-            'Account balance',
-            ['currency'],
-            registry=self.registry
-        )
-        
-        self.bot_positions = Gauge(
-            'bot_positions_count',
-            'Number of open positions',
-            ['strategy', 'symbol'],
-            registry=self.registry
-        )
-        
-        self.bot_orders_total = Counter(
-            'bot_orders_total',
-            'Total orders placed',
-            ['strategy', 'symbol', 'side', 'status'],
-            registry=self.registry
-        )
-        
-        # Métricas de Performance
-        self.bot_win_rate = Gauge(
-            'bot_win_rate',
-            'Win rate percentage',
-            ['strategy'],
-            registry=self.registry
-        )
-        
-        self.bot_max_drawdown = Gauge(
-            'bot_max_drawdown_percent',
-            'Maximum drawdown percentage',
-            ['strategy'],
-            registry=self.registry
-        )
-        
-        self.bot_sharpe_ratio = Gauge(
-            'bot_sharpe_ratio',
-            'Sharpe ratio',
-            ['strategy'],
-            registry=self.registry
-        )
-        
-        # Métricas de Sistema
-        self.system_cpu_usage = Gauge(
-            'system_cpu_usage_percent',
-            'CPU usage percentage',
-            registry=self.registry
-        )
-        
-        self.system_memory_usage = Gauge(
-            'system_memory_usage_bytes',
-            'Memory usage in bytes',
-            registry=self.registry
-        )
-        
-        self.system_disk_usage = Gauge(
-            'system_disk_usage_percent',
-            'Disk usage percentage',
-            ['mountpoint'],
-            registry=self.registry
-        )
-        
-        # Métricas de Conexão
-        self.api_connection_errors = Counter(
-            'bot_api_connection_errors_total',
-            'API connection errors',
-            ['exchange', 'error_type'],
-            registry=self.registry
-        )
-        
-        self.api_rate_limit_errors = Counter(
-            'bot_api_rate_limit_errors_total',
-            'API rate limit errors',
-            ['exchange'],
-            registry=self.registry
-        )
-        
-        # Métricas de Autenticação
-        self.auth_attempts = Counter(
-            'auth_attempts_total',
-            'Authentication attempts',
-            ['status'],
-            registry=self.registry
-        )
-        
-        self.auth_failed_logins = Counter(
-            'auth_failed_logins_total',
-            'Failed login attempts',
-            ['reason'],
-            registry=self.registry
-        )
-        
-        # Métricas de Aplicação
-        self.app_info = Info(
-            'app_info',
-            'Application information',
-            registry=self.registry
-        )
-        
-        self.app_uptime = Gauge(
-            'app_uptime_seconds',
-            'Application uptime in seconds',
-            registry=self.registry
-        )
-        
-        # Definir informações da aplicação
-        self.app_info.info({
-            'version': '1.0.0',
-            'name': 'crypto-trading-mvp',
-            'environment': 'development'
-        })
+        # metric -> {valores dos labels -> filho}; evita o despacho de .labels() a cada registro
+        self._label_cache: Dict[Any, Dict[tuple, Any]] = {}
+        self._partitions: List[Any] = []
+        self._partitions_refreshed = 0.0
+        # instâncias do mesmo registry compartilham os objetos de métrica
+        vars(self).update(vars(_metrics_for(self.registry)))
+        # referência inicial para cpu_percent(interval=None) medir desde a última chamada
+        psutil.cpu_percent(interval=None)
+    
+    def _labeled(self, metric, *values):
+        """Filho de `metric` para os valores de label (na ordem declarada), memoizado."""
+        cache = self._label_cache.get(metric)
+        if cache is None:
+            cache = self._label_cache[metric] = {}
+        child = cache.get(values)
+        if child is None:
+            child = cache[values] = metric.labels(*values)
+        return child
     
     def record_http_request(self, method: str, endpoint: str, status: int, duration: float):
         """Registrar requisição HTTP"""
-        self.http_requests_total.labels(
-            method=method,
-            endpoint=endpoint,
-            status=str(status)
-        ).inc()
-        
-        self.http_request_duration.labels(
-            method=method,
-            endpoint=endpoint
-        ).observe(duration)
+        self._labeled(self.http_requests_total, method, endpoint, str(status)).inc()
+        self._labeled(self.http_request_duration, method, endpoint).observe(duration)
     
     def record_trade(self, strategy: str, symbol: str, side: str, pnl: float):
         """Registrar trade executado"""
-        self.bot_trades_total.labels(
-            strategy=strategy,
-            symbol=symbol,
-            side=side
-        ).inc()
+        self._labeled(self.bot_trades_total, strategy, symbol, side).inc()
         
-        # Atualizar P&L
-        current_pnl = self.bot_pnl.labels(strategy=strategy, symbol=symbol)._value._value
-        self.bot_pnl.labels(strategy=strategy, symbol=symbol).set(current_pnl + pnl)
+        # Atualizar P&L acumulado (Gauge.inc aceita valores negativos)
+        self._labeled(self.bot_pnl, strategy, symbol).inc(pnl)
     
     def update_account_balance(self, currency: str, balance: float):
         """Atualizar saldo da conta"""
-        self.bot_account_balance.labels(currency=currency).set(balance)
+        self._labeled(self.bot_account_balance, currency).set(balance)
     
     def update_positions_count(self, strategy: str, symbol: str, count: int):
         """Atualizar número de posições abertas"""
-        self.bot_positions.labels(strategy=strategy, symbol=symbol).set(count)
+        self._labeled(self.bot_positions, strategy, symbol).set(count)
     
     def record_order(self, strategy: str, symbol: str, side: str, status: str):
         """Registrar ordem colocada"""
-        self.bot_orders_total.labels(
-            strategy=strategy,
-            symbol=symbol,
-            side=side,
-            status=status
-        ).inc()
+        self._labeled(self.bot_orders_total, strategy, symbol, side, status).inc()
     
     def update_performance_metrics(self, strategy: str, win_rate: float, 
                                  max_drawdown: float, sharpe_ratio: float):
         """Atualizar métricas de performance"""
-        self.bot_win_rate.labels(strategy=strategy).set(win_rate)
-        self.bot_max_drawdown.labels(strategy=strategy).set(max_drawdown)
-        self.bot_sharpe_ratio.labels(strategy=strategy).set(sharpe_ratio)
+        self._labeled(self.bot_win_rate, strategy).set(win_rate)
+        self._labeled(self.bot_max_drawdown, strategy).set(max_drawdown)
+        self._labeled(self.bot_sharpe_ratio, strategy).set(sharpe_ratio)
     
     def record_api_error(self, exchange: str, error_type: str):
         """Registrar erro de API"""
-        self.api_connection_errors.labels(
-            exchange=exchange,
-            error_type=error_type
-        ).inc()
+        self._labeled(self.api_connection_errors, exchange, error_type).inc()
     
     def record_rate_limit_error(self, exchange: str):
         """Registrar erro de rate limit"""
-        self.api_rate_limit_errors.labels(exchange=exchange).inc()
+        self._labeled(self.api_rate_limit_errors, exchange).inc()
     
     def record_auth_attempt(self, status: str):
         """Registrar tentativa de autenticação"""
-        self.auth_attempts.labels(status=status).inc()
+        self._labeled(self.auth_attempts, status).inc()
     
     def record_failed_login(self, reason: str):
         """Registrar login falhado"""
-        self.auth_failed_logins.labels(reason=reason).inc()
+        self._labeled(self.auth_failed_logins, reason).inc()
+    
+    def disk_partitions(self) -> List[Any]:
+        """Partições reais (sem pseudo-FS), reenumeradas no máximo a cada 10 minutos."""
+        now = time.monotonic()
+        if not self._partitions_refreshed or now - self._partitions_refreshed >= _PARTITIONS_REFRESH_SECONDS:
+            self._partitions = [
+                p for p in psutil.disk_partitions(all=False)
+                if p.fstype not in _PSEUDO_FSTYPES
+            ]
+            self._partitions_refreshed = now
+        return self._partitions
     
     def update_system_metrics(self):
         """Atualizar métricas do sistema"""
         try:
-            # CPU
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU (não bloqueante: uso desde a chamada anterior)
+            cpu_percent = psutil.cpu_percent(interval=None)
             self.system_cpu_usage.set(cpu_percent)
             
             # Memória
@@ -263,7 +310,7 @@ class PrometheusMetrics:
             self.system_memory_usage.set(memory.used)
             
             # Disco
-            for partition in psutil.disk_partitions():
+            for partition in self.disk_partitions():
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
                     usage_percent = (usage.used / usage.total) * 100
@@ -281,6 +328,17 @@ class PrometheusMetrics:
         return generate_latest(self.registry)
 
 
+def _trade_day(timestamp: Any) -> str:
+    """Data (YYYY-MM-DD) do trade; strings ISO usam o prefixo, sem fromisoformat"""
+    if isinstance(timestamp, str):
+        if len(timestamp) >= 10 and timestamp[4] == '-':
+            return timestamp[:10]
+        return datetime.fromisoformat(timestamp).date().isoformat()
+    if isinstance(timestamp, datetime):
+        return timestamp.date().isoformat()
+    return datetime.fromtimestamp(timestamp).date().isoformat()
+
+
 class BusinessMetrics:
     """Métricas específicas de negócio"""
     
@@ -296,33 +354,34 @@ class BusinessMetrics:
         
         # Atualizar métricas Prometheus
         if 'win_rate' in stats:
-            self.prometheus.bot_win_rate.labels(strategy=strategy).set(stats['win_rate'])
+            self.prometheus._labeled(self.prometheus.bot_win_rate, strategy).set(stats['win_rate'])
         
         if 'max_drawdown' in stats:
-            self.prometheus.bot_max_drawdown.labels(strategy=strategy).set(stats['max_drawdown'])
+            self.prometheus._labeled(self.prometheus.bot_max_drawdown, strategy).set(stats['max_drawdown'])
         
         if 'sharpe_ratio' in stats:
-            self.prometheus.bot_sharpe_ratio.labels(strategy=strategy).set(stats['sharpe_ratio'])
+            self.prometheus._labeled(self.prometheus.bot_sharpe_ratio, strategy).set(stats['sharpe_ratio'])
     
     def calculate_daily_metrics(self, strategy: str, trades: List[Dict[str, Any]]):
         """Calcular métricas diárias"""
-        today = datetime.now().date()
-        daily_trades = [
-            trade for trade in trades
-            if datetime.fromisoformat(trade['timestamp']).date() == today
-        ]
+        today = datetime.now().date().isoformat()
+        n = len(trades)
+        is_today = np.fromiter(
+            (_trade_day(trade['timestamp']) == today for trade in trades), dtype=bool, count=n
+        )
+        pnl = np.fromiter((trade.get('pnl', 0) for trade in trades), dtype=np.float64, count=n)[is_today]
         
-        if not daily_trades:
+        if not pnl.size:
             return
         
         # P&L diário
-        daily_pnl = sum(trade.get('pnl', 0) for trade in daily_trades)
+        daily_pnl = float(pnl.sum())
         
         # Número de trades
-        trade_count = len(daily_trades)
+        trade_count = int(pnl.size)
         
         # Win rate diário
-        winning_trades = len([t for t in daily_trades if t.get('pnl', 0) > 0])
+        winning_trades = int(np.count_nonzero(pnl > 0))
         daily_win_rate = (winning_trades / trade_count * 100) if trade_count > 0 else 0
         
         # Atualizar cache
@@ -349,38 +408,67 @@ class SystemMetrics:
         self.prometheus = prometheus_metrics
         self._start_time = time.time()
         self._update_thread = None
+        self._update_task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
         self._running = False
+        # dados estáticos do host, recalculados no mesmo ritmo da lista de partições
+        self._static_info: Optional[Dict[str, Any]] = None
+        self._static_info_at = 0.0
     
     def start_monitoring(self, interval: int = 30):
-        """Iniciar monitoramento contínuo"""
+        """Iniciar monitoramento contínuo (task asyncio se houver loop rodando)"""
         if self._running:
             return
         
         self._running = True
-        self._update_thread = threading.Thread(
-            target=self._update_loop,
-            args=(interval,),
-            daemon=True
-        )
-        self._update_thread.start()
+        self._stop_event.clear()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is not None:
+            self._update_task = loop.create_task(self._update_loop_async(interval))
+        else:
+            # chamado fora de um event loop: mantém o amostrador em thread
+            self._update_thread = threading.Thread(
+                target=self._update_loop,
+                args=(interval,),
+                daemon=True
+            )
+            self._update_thread.start()
         logger.info("Monitoramento de sistema iniciado")
     
     def stop_monitoring(self):
         """Parar monitoramento"""
         self._running = False
+        self._stop_event.set()
+        if self._update_task:
+            self._update_task.cancel()
+            self._update_task = None
         if self._update_thread:
             self._update_thread.join()
+            self._update_thread = None
         logger.info("Monitoramento de sistema parado")
     
+    async def _update_loop_async(self, interval: int):
+        """Loop de atualização das métricas no event loop"""
+        while self._running:
+            try:
+                self.update_all_metrics()
+            except Exception as e:
+                logger.error(f"Erro no loop de métricas: {e}")
+            await asyncio.sleep(interval)
+    
     def _update_loop(self, interval: int):
-        """Loop de atualização das métricas"""
+        """Loop de atualização das métricas (thread)"""
         while self._running:
             try:
                 self.update_all_metrics()
-                time.sleep(interval)
             except Exception as e:
                 logger.error(f"Erro no loop de métricas: {e}")
-                time.sleep(interval)
+            # acorda imediatamente em stop_monitoring em vez de dormir o intervalo todo
+            self._stop_event.wait(interval)
     
     def update_all_metrics(self):
         """Atualizar todas as métricas do sistema"""
@@ -393,17 +481,21 @@ class SystemMetrics:
     
     def get_system_info(self) -> Dict[str, Any]:
         """Obter informações do sistema"""
-        return {
-            'uptime': time.time() - self._start_time,
-            'cpu_count': psutil.cpu_count(),
-            'memory_total': psutil.virtual_memory().total,
-            'disk_total': sum(
-                psutil.disk_usage(p.mountpoint).total 
-                for p in psutil.disk_partitions()
-            ),
-            'python_version': f"{psutil.version_info}",
-            'platform': psutil.platform
-        }
+        now = time.monotonic()
+        if self._static_info is None or now - self._static_info_at >= _PARTITIONS_REFRESH_SECONDS:
+            self._static_info = {
+                'cpu_count': psutil.cpu_count(),
+                'memory_total': psutil.virtual_memory().total,
+                'disk_total': sum(
+                    psutil.disk_usage(p.mountpoint).total 
+                    for p in self.prometheus.disk_partitions()
+                ),
+                'python_version': sys.version,
+                'platform': platform.platform()
+            }
+            self._static_info_at = now
+        
+        return {'uptime': time.time() - self._start_time, **self._static_info}
 
 
 class TradingMetrics:
@@ -411,16 +503,47 @@ class TradingMetrics:
     
     def __init__(self, prometheus_metrics: PrometheusMetrics):
         self.prometheus = prometheus_metrics
-        self._trade_history = []
-        self._position_history = []
-        self._order_history = []
+        # timestamps em epoch (time.time()): o filtro por período é uma comparação numérica
+        self._trade_history = deque(maxlen=_MAX_TRADE_HISTORY)
+        self._position_history = deque(maxlen=_MAX_POSITION_HISTORY)
+        self._order_history = deque(maxlen=_MAX_ORDER_HISTORY)
+        # (strategy, symbol) das últimas atualizações 'open' (None nas demais) e a contagem
+        # por chave, mantida incrementalmente em vez de reescanear a janela
+        self._open_window = deque(maxlen=_OPEN_POSITIONS_WINDOW)
+        self._open_positions: Dict[tuple, int] = {}
+        # colunas (SoA) de timestamp/pnl dos trades para o resumo vetorizado;
+        # [_trade_start, _trade_end) é a janela viva (mesmo limite do histórico)
+        self._trade_ts = np.empty(64, dtype=np.float64)
+        self._trade_pnl = np.empty(64, dtype=np.float64)
+        self._trade_start = 0
+        self._trade_end = 0
+    
+    def _append_trade_columns(self, ts: float, pnl: float):
+        """Acrescenta um trade às colunas, realocando (até 2x o limite) quando cheias."""
+        start, end = self._trade_start, self._trade_end
+        if end == self._trade_ts.shape[0]:
+            keep = min(end - start, _MAX_TRADE_HISTORY - 1)
+            capacity = min(max(64, 2 * (keep + 1)), 2 * _MAX_TRADE_HISTORY)
+            ts_col = np.empty(capacity, dtype=np.float64)
+            pnl_col = np.empty(capacity, dtype=np.float64)
+            ts_col[:keep] = self._trade_ts[end - keep:end]
+            pnl_col[:keep] = self._trade_pnl[end - keep:end]
+            self._trade_ts, self._trade_pnl = ts_col, pnl_col
+            start, end = 0, keep
+        self._trade_ts[end] = ts
+        self._trade_pnl[end] = pnl
+        end += 1
+        self._trade_start = max(start, end - _MAX_TRADE_HISTORY)
+        self._trade_end = end
     
     def record_trade_execution(self, trade_data: Dict[str, Any]):
         """Registrar execução de trade"""
+        now = time.time()
         self._trade_history.append({
             **trade_data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now
         })
+        self._append_trade_columns(now, float(trade_data.get('pnl', 0) or 0.0))
         
         # Atualizar métricas Prometheus
         self.prometheus.record_trade(
@@ -434,25 +557,36 @@ class TradingMetrics:
         """Registrar atualização de posição"""
         self._position_history.append({
             **position_data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         })
         
-        # Contar posições abertas por estratégia/símbolo
-        open_positions = {}
-        for pos in self._position_history[-100:]:  # Últimas 100 posições
-            if pos.get('status') == 'open':
-                key = (pos.get('strategy', 'unknown'), pos.get('symbol', 'unknown'))
-                open_positions[key] = open_positions.get(key, 0) + 1
-        
-        # Atualizar métricas
-        for (strategy, symbol), count in open_positions.items():
+        # Contar posições abertas por estratégia/símbolo nas últimas 100 atualizações
+        counts = self._open_positions
+        changed = []
+        if len(self._open_window) == self._open_window.maxlen:
+            evicted = self._open_window[0]
+            if evicted is not None:
+                counts[evicted] -= 1
+                changed.append(evicted)
+        key = None
+        if position_data.get('status') == 'open':
+            key = (position_data.get('strategy', 'unknown'), position_data.get('symbol', 'unknown'))
+            counts[key] = counts.get(key, 0) + 1
+            changed.append(key)
+        self._open_window.append(key)
+        
+        # Atualizar métricas (só as chaves que mudaram)
+        for strategy, symbol in set(changed):
+            count = counts[(strategy, symbol)]
+            if not count:
+                del counts[(strategy, symbol)]
             self.prometheus.update_positions_count(strategy, symbol, count)
     
     def record_order_placement(self, order_data: Dict[str, Any]):
         """Registrar colocação de ordem"""
         self._order_history.append({
             **order_data,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': time.time()
         })
         
         # Atualizar métricas Prometheus
@@ -465,26 +599,25 @@ class TradingMetrics:
     
     def get_trading_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Obter resumo de trading das últimas horas"""
-        cutoff = datetime.now() - timedelta(hours=hours)
+        cutoff = time.time() - hours * 3600
         
-        recent_trades = [
-            trade for trade in self._trade_history
-            if datetime.fromisoformat(trade['timestamp']) > cutoff
-        ]
+        ts = self._trade_ts[self._trade_start:self._trade_end]
+        pnl = self._trade_pnl[self._trade_start:self._trade_end]
+        recent = pnl[ts > cutoff]
         
-        if not recent_trades:
+        if not recent.size:
             return {'trades': 0, 'pnl': 0, 'win_rate': 0}
         
-        total_pnl = sum(trade.get('pnl', 0) for trade in recent_trades)
-        winning_trades = len([t for t in recent_trades if t.get('pnl', 0) > 0])
-        win_rate = (winning_trades / len(recent_trades)) * 100
+        trades = int(recent.size)
+        winning_trades = int(np.count_nonzero(recent > 0))
+        win_rate = (winning_trades / trades) * 100
         
         return {
-            'trades': len(recent_trades),
-            'pnl': total_pnl,
+            'trades': trades,
+            'pnl': float(recent.sum()),
             'win_rate': win_rate,
             'winning_trades': winning_trades,
-            'losing_trades': len(recent_trades) - winning_trades
+            'losing_trades': trades - winning_trades
         }
 
 
@@ -498,6 +631,8 @@ class MetricsCollector:
         self.system = SystemMetrics(self.prometheus)
         self.trading = TradingMetrics(self.prometheus)
         self._server_started = False
+        self._cached_payload: Optional[bytes] = None
+        self._cached_at = 0.0
     
     def start(self):
         """Iniciar coletor de métricas"""
@@ -518,8 +653,12 @@ class MetricsCollector:
         logger.info("Coletor de métricas parado")
     
     def get_all_metrics(self) -> str:
-        """Obter todas as métricas"""
-        return self.prometheus.get_metrics()
+        """Obter todas as métricas (serialização reaproveitada por _SCRAPE_CACHE_SECONDS)"""
+        now = time.monotonic()
+        if self._cached_payload is None or now - self._cached_at >= _SCRAPE_CACHE_SECONDS:
+            self._cached_payload = self.prometheus.get_metrics()
+            self._cached_at = now
+        return self._cached_payload
     
     def health_check(self) -> Dict[str, Any]:
         """Verificar saúde do sistema de métricas"""
@@ -544,28 +683,44 @@ def get_metrics_collector() -> MetricsCollector:
 
 # Decorador para métricas HTTP
 def track_http_requests(func):
-    """Decorador para rastrear requisições HTTP"""
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
+    """Decorador para rastrear requisições HTTP (funções síncronas ou async)"""
+    # coletor resolvido uma vez, na decoração, e não a cada requisição
+    record = get_metrics_collector().prometheus.record_http_request
+    
+    def _record(args, status, start_time):
+        duration = time.perf_counter() - start_time
+        
+        # Extrair informações da requisição (se disponível)
+        method = getattr(args[0], 'method', 'GET') if args else 'GET'
+        endpoint = getattr(args[0], 'path', '/') if args else '/'
         
+        # Registrar métrica
+        record(method, endpoint, status, duration)
+    
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            status = 500
+            try:
+                result = await func(*args, **kwargs)
+                status = getattr(result, 'status_code', 200)
+                return result
+            finally:
+                _record(args, status, start_time)
+        
+        return async_wrapper
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        status = 500
         try:
             result = func(*args, **kwargs)
             status = getattr(result, 'status_code', 200)
-        except Exception as e:
-            status = 500
-            raise
+            return result
         finally:
-            duration = time.time() - start_time
-            
-            # Extrair informações da requisição (se disponível)
-            method = getattr(args[0], 'method', 'GET') if args else 'GET'
-            endpoint = getattr(args[0], 'path', '/') if args else '/'
-            
-            # Registrar métrica
-            collector = get_metrics_collector()
-            collector.prometheus.record_http_request(method, endpoint, status, duration)
-        
-        return result
+            _record(args, status, start_time)
     
     return wrapper
 
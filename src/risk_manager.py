@@ -1,45 +1,12 @@
 # AUTOGERADO por quick_fix.py
 from __future__ import annotations
-from typing import Optional, List, Dict
 
-class RiskManager:
-    def __init__(self, config: Optional[dict] = None):
-        cfg = config or {}
-        self.max_position_size: float = float(cfg.get("max_position_size", 1000.0))
-        self.max_daily_loss: float = float(cfg.get("max_daily_loss", 100.0))
-        self.max_open_positions: int = int(cfg.get("max_open_positions", 5))
-        self.risk_per_trade: float = float(cfg.get("risk_per_trade", 0.02))
-        self._daily_pnl: float = 0.0
-
-    def get_max_position_size(self) -> float:
-        return self.max_position_size
-
-    def update_daily_pnl(self, delta: float):
-        self._daily_pnl += float(delta)
-
-    def reset_daily(self):
-        self._daily_pnl = 0.0
-
-    def check_position_limits(self, open_positions: List[dict]) -> bool:
-        return len(open_positions) < self.max_open_positions
-
-    def calculate_position_size(self, balance: float, price: float) -> float:
-        if price <= 0:
-            return 0.0
-        size_by_risk = (balance * self.risk_per_trade) / price
-        return max(0.0, min(size_by_risk, self.max_position_size))
-
-    def validate_order(self, side: str, balance: float, price: float, open_positions: List[dict]) -> Dict[str, object]:
-        if self._daily_pnl <= -abs(self.max_daily_loss):
-            return {"valid": False, "reason": "daily_loss_exceeded"}
-        if not self.check_position_limits(open_positions):
-            return {"valid": False, "reason": "too_many_positions"}
-        size = self.calculate_position_size(balance, price)
-        if size <= 0:
-            return {"valid": False, "reason": "insufficient_balance"}
-        return {"valid": True, "size": size}
 
 class RiskManager:
+    # criado por símbolo/estratégia: sem __dict__ por instância
+    __slots__ = ("_max_position_size", "max_daily_loss", "max_open_positions", "risk_per_trade",
+                 "daily_loss", "validate_order")
+
     def __init__(self, config: dict | None = None):
         cfg = config or {}
         self.max_position_size = float(cfg.get("max_position_size", 1000.0))
@@ -48,6 +15,29 @@ class RiskManager:
         self.risk_per_trade = float(cfg.get("risk_per_trade", 0.01))
         self.daily_loss = 0.0
 
+    @property
+    def max_position_size(self) -> float:
+        return self._max_position_size
+
+    @max_position_size.setter
+    def max_position_size(self, value: float):
+        self._max_position_size = value
+        self._bind_validate_order()
+
+    def _bind_validate_order(self):
+        # validate_order é o caminho quente: limites em closure (LOAD_DEREF em vez de self.<attr>)
+        max_size = self._max_position_size
+
+        def validate_order(balance: float, price: float, size: float, side: str, _abs=abs):
+            cost = _abs(size) * price
+            if cost > balance:
+                raise ValueError("Saldo insuficiente")
+            if _abs(size) > max_size:
+                raise ValueError("Tamanho de posição excede o máximo")
+            return True
+
+        self.validate_order = validate_order
+
     def get_max_position_size(self):
         return self.max_position_size
 
@@ -63,14 +53,6 @@ class RiskManager:
     def check_position_limits(self, open_positions: list) -> bool:
         return len(open_positions) < self.max_open_positions
 
-    def validate_order(self, balance: float, price: float, size: float, side: str):
-        cost = abs(size) * price
-        if cost > balance:
-            raise ValueError("Saldo insuficiente")
-        if abs(size) > self.max_position_size:
-            raise ValueError("Tamanho de posição excede o máximo")
-        return True
-
     def check_daily_limits(self) -> bool:
         return self.daily_loss <= self.max_daily_loss
 
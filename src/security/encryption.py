@@ -2,10 +2,10 @@
 Encryption utilities for API keys and sensitive data
 """
 import base64
+import functools
+import hashlib
 import os
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.fernet import Fernet, InvalidToken
 import logging
 
 import sys
@@ -18,6 +18,14 @@ from config.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _derive_key(password: bytes, salt: bytes, iterations: int) -> bytes:
+    """Derive a Fernet key with PBKDF2 (memoized: the result is deterministic)"""
+    # stdlib PBKDF2 runs in OpenSSL's PKCS5_PBKDF2_HMAC (same output as PBKDF2HMAC)
+    raw = hashlib.pbkdf2_hmac('sha256', password, salt, iterations, dklen=32)
+    return base64.urlsafe_b64encode(raw)
+
+
 class EncryptionManager:
     """Manages encryption and decryption of sensitive data"""
     
@@ -34,14 +42,8 @@ class EncryptionManager:
             # Use a fixed salt for consistency (in production, store this securely)
             salt = b'crypto_trading_mvp_salt_2025'
             
-            # Derive key using PBKDF2
-            kdf = PBKDF2HMAC(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=salt,
-                iterations=100000,
-            )
-            key = base64.urlsafe_b64encode(kdf.derive(password))
+            # Derive key using PBKDF2 (computed once per process)
+            key = _derive_key(password, salt, 100000)
             
             # Create Fernet instance
             self._fernet = Fernet(key)
@@ -58,8 +60,8 @@ class EncryptionManager:
             if not data:
                 return ""
             
-            encrypted_data = self._fernet.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted_data).decode()
+            # Fernet tokens are already urlsafe base64
+            return self._fernet.encrypt(data.encode()).decode('ascii')
             
         except Exception as e:
             logger.error(f"Error encrypting data: {e}")
@@ -71,11 +73,12 @@ class EncryptionManager:
             if not encrypted_data:
                 return ""
             
-            # Decode from base64
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            
-            # Decrypt
-            decrypted_data = self._fernet.decrypt(encrypted_bytes)
+            token = encrypted_data.encode('ascii')
+            try:
+                decrypted_data = self._fernet.decrypt(token)
+            except InvalidToken:
+                # Legacy values were base64-encoded a second time
+                decrypted_data = self._fernet.decrypt(base64.urlsafe_b64decode(token))
             return decrypted_data.decode()
             
         except Exception as e:
@@ -95,6 +98,17 @@ def get_encryption_manager() -> EncryptionManager:
     return _encryption_manager
 
 
+@functools.lru_cache(maxsize=64)
+def _decrypt_cached(token: str) -> str:
+    """Decrypt a token once; API keys are few and reused on every auth call"""
+    return get_encryption_manager().decrypt(token)
+
+
+def clear_decrypt_cache() -> None:
+    """Drop cached plaintexts (call after rotating the encryption key)"""
+    _decrypt_cached.cache_clear()
+
+
 def encrypt_api_key(api_key: str) -> str:
     """Encrypt an API key"""
     return get_encryption_manager().encrypt(api_key)
@@ -102,7 +116,7 @@ def encrypt_api_key(api_key: str) -> str:
 
 def decrypt_api_key(encrypted_api_key: str) -> str:
     """Decrypt an API key"""
-    return get_encryption_manager().decrypt(encrypted_api_key)
+    return _decrypt_cached(encrypted_api_key)
 
 
 def encrypt_sensitive_data(data: str) -> str:
@@ -112,7 +126,7 @@ def encrypt_sensitive_data(data: str) -> str:
 
 def decrypt_sensitive_data(encrypted_data: str) -> str:
     """Decrypt sensitive data"""
-    return get_encryption_manager().decrypt(encrypted_data)
+    return _decrypt_cached(encrypted_data)
 
 
 def generate_encryption_key() -> str:
@@ -2,56 +2,143 @@ from __future__ import annotations
 
 
 # src/strategy/indicators/__init__.py
-import types
-import sys
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
-PKG = __name__  # "src.strategy.indicators"
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except ImportError:  # numba é opcional: sem ele tudo roda pelo pandas
+    HAS_NUMBA = False
+
 # ---- Implementações mínimas e determinísticas usadas nos testes ----
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _ewm_loop(x, alpha):
+        """Recorrência de ewm(adjust=False).mean(), com a mesma aritmética do pandas."""
+        y = np.empty_like(x)
+        old_wt = 1.0 - alpha
+        w = x[0]
+        y[0] = w
+        for i in range(1, x.shape[0]):
+            if w != x[i]:
+                w = (old_wt * w + alpha * x[i]) / (old_wt + alpha)
+            y[i] = w
+        return y
+
+    @njit(cache=True)
+    def _ewo_loop(x, af, as_):
+        """EMA rápida - EMA lenta numa única passada (mesma aritmética de _ewm_loop)."""
+        out = np.empty_like(x)
+        of = 1.0 - af
+        os_ = 1.0 - as_
+        f = x[0]
+        s = x[0]
+        out[0] = 0.0
+        for i in range(1, x.shape[0]):
+            xi = x[i]
+            if f != xi:
+                f = (of * f + af * xi) / (of + af)
+            if s != xi:
+                s = (os_ * s + as_ * xi) / (os_ + as_)
+            out[i] = f - s
+        return out
+
+
+def _ewm_mean(series: pd.Series, span: Optional[float] = None, alpha: Optional[float] = None) -> pd.Series:
+    """series.ewm(span=.../alpha=..., adjust=False).mean(); kernel numba quando disponível."""
+    if HAS_NUMBA:
+        # mesma conversão span/alpha -> com -> alpha do pandas
+        com = (span - 1) / 2.0 if span is not None else (1.0 - alpha) / alpha
+        a = 1.0 / (1.0 + com)
+        x = series.to_numpy(dtype=np.float64)
+        nan = np.isnan(x)
+        # NaN só no início (ex.: diff) é tratado como no pandas: a média começa no 1º valor
+        start = int(nan.argmin()) if x.shape[0] else 0
+        if x.shape[0] and not nan[start:].any():
+            y = np.full_like(x, np.nan)
+            y[start:] = _ewm_loop(x[start:], a)
+            return pd.Series(y, index=series.index)
+    return series.ewm(span=span, alpha=alpha, adjust=False).mean()
+
+
 class EMAIndicator:
     def __init__(self, close: pd.Series, window: int = 12, adjust: bool = False):
+        self.reset(close, window, adjust)
+    def reset(self, close: pd.Series, window: int = 12, adjust: bool = False):
         self.close = close
         self.window = window
         self.adjust = adjust
     def ema(self) -> pd.Series:
+        if not self.adjust:
+            return _ewm_mean(self.close, span=self.window)
         return self.close.ewm(span=self.window, adjust=self.adjust).mean()
 
 class RSIIndicator:
     def __init__(self, close: pd.Series, window: int = 14):
+        self.reset(close, window)
+    def reset(self, close: pd.Series, window: int = 14):
         self.close = close; self.window = window
     def rsi(self) -> pd.Series:
         delta = self.close.diff()
         gain = delta.clip(lower=0)
         loss = -delta.clip(upper=0)
-        avg_gain = gain.ewm(alpha=1/self.window, adjust=False).mean()
-        avg_loss = loss.ewm(alpha=1/self.window, adjust=False).mean()
+        avg_gain = _ewm_mean(gain, alpha=1/self.window)
+        avg_loss = _ewm_mean(loss, alpha=1/self.window)
         rs = avg_gain / (avg_loss.replace(0, 1e-12))
         return 100 - (100 / (1 + rs))
 
+def _rolling_mean(x: np.ndarray, window: int, index) -> pd.Series:
+    """rolling(window, min_periods=1).mean() via convolução (pandas se houver NaN)."""
+    n = x.shape[0]
+    if n == 0 or np.isnan(x).any():
+        # NaN nos dados: rolling do pandas ignora os buracos na média
+        return pd.Series(x, index=index).rolling(window, min_periods=1).mean()
+    # somas parciais da convolução / quantidade de valores na janela
+    sums = np.convolve(x, np.ones(window))[:n]
+    return pd.Series(sums / np.minimum(np.arange(1, n + 1), window), index=index)
+
 class ATRIndicator:
     def __init__(self, high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14):
+        self.reset(high, low, close, window)
+    def reset(self, high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14):
         self.high, self.low, self.close, self.window = high, low, close, window
     def atr(self) -> pd.Series:
-        prev_close = self.close.shift(1)
-        tr = pd.concat([
-            (self.high - self.low),
-            (self.high - prev_close).abs(),
-            (self.low - prev_close).abs(),
-        ], axis=1).max(axis=1)
-        return tr.rolling(self.window, min_periods=1).mean()
+        h = self.high.to_numpy(dtype=np.float64, copy=False)
+        l = self.low.to_numpy(dtype=np.float64, copy=False)
+        c = self.close.to_numpy(dtype=np.float64, copy=False)
+        prev_close = np.empty_like(c)
+        prev_close[:1] = np.nan
+        prev_close[1:] = c[:-1]
+        # fmax ignora o NaN do primeiro candle, como o max(axis=1) do pandas
+        tr = np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close)))
+        return _rolling_mean(tr, self.window, self.high.index)
 
 class EWOIndicator:
     """Elliott Wave Oscillator = EMA(fast) - EMA(slow)"""
     def __init__(self, close: pd.Series, fast: int = 5, slow: int = 35, adjust: bool = False):
+        self.reset(close, fast, slow, adjust)
+    def reset(self, close: pd.Series, fast: int = 5, slow: int = 35, adjust: bool = False):
         self.close, self.fast, self.slow, self.adjust = close, fast, slow, adjust
     def ewo(self) -> pd.Series:
+        if not self.adjust:
+            if HAS_NUMBA:
+                x = self.close.to_numpy(dtype=np.float64)
+                if x.shape[0] and not np.isnan(x).any():
+                    af = 1.0 / (1.0 + (self.fast - 1) / 2.0)
+                    as_ = 1.0 / (1.0 + (self.slow - 1) / 2.0)
+                    return pd.Series(_ewo_loop(x, af, as_), index=self.close.index)
+            return _ewm_mean(self.close, span=self.fast) - _ewm_mean(self.close, span=self.slow)
         f = self.close.ewm(span=self.fast, adjust=self.adjust).mean()
         s = self.close.ewm(span=self.slow, adjust=self.adjust).mean()
         return f - s
 
 class StochRSIIndicator:
     def __init__(self, close: pd.Series, rsi_window: int = 14, k_window: int = 14):
+        self.reset(close, rsi_window, k_window)
+    def reset(self, close: pd.Series, rsi_window: int = 14, k_window: int = 14):
         self.close, self.rsi_window, self.k_window = close, rsi_window, k_window
     def stoch_rsi(self) -> pd.Series:
         rsi = RSIIndicator(self.close, window=self.rsi_window).rsi()
@@ -62,6 +149,8 @@ class StochRSIIndicator:
 
 class MACDIndicator:
     def __init__(self, close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9, adjust: bool = False):
+        self.reset(close, fast, slow, signal, adjust)
+    def reset(self, close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9, adjust: bool = False):
         self.close, self.fast, self.slow, self.signal, self.adjust = close, fast, slow, signal, adjust
     def macd(self):
         ema_fast = self.close.ewm(span=self.fast, adjust=self.adjust).mean()
@@ -73,14 +162,85 @@ class MACDIndicator:
 
 class BBANDSIndicator:
     def __init__(self, close: pd.Series, window: int = 20, n_std: float = 2.0):
+        self.reset(close, window, n_std)
+    def reset(self, close: pd.Series, window: int = 20, n_std: float = 2.0):
         self.close, self.window, self.n_std = close, window, n_std
     def bands(self):
-        ma = self.close.rolling(self.window, min_periods=1).mean()
+        ma = _rolling_mean(self.close.to_numpy(dtype=np.float64), self.window, self.close.index)
         sd = self.close.rolling(self.window, min_periods=1).std(ddof=0).fillna(0)
         upper = ma + self.n_std * sd
         lower = ma - self.n_std * sd
         return lower, ma, upper
 
+# ---- Cálculo conjunto (uma passada sobre high/low/close) ----
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _bundle_kernel(h, l, c, spans, rsi_window, atr_window):
+        """EMAs, RSI e ATR com a mesma semântica das classes acima, num único loop."""
+        n = c.shape[0]
+        k = spans.shape[0]
+        emas = np.empty((k, n))
+        rsi = np.empty(n)
+        atr = np.empty(n)
+        if n == 0:
+            return emas, rsi, atr
+        alphas = 2.0 / (spans + 1.0)
+        a_rsi = 1.0 / rsi_window
+        for j in range(k):
+            emas[j, 0] = c[0]
+        rsi[0] = np.nan
+        avg_gain = 0.0
+        avg_loss = 0.0
+        tr_sum = h[0] - l[0]
+        trs = np.empty(n)
+        trs[0] = tr_sum
+        atr[0] = tr_sum
+        for i in range(1, n):
+            x = c[i]
+            for j in range(k):
+                emas[j, i] = emas[j, i - 1] + alphas[j] * (x - emas[j, i - 1])
+            d = x - c[i - 1]
+            gain = d if d > 0.0 else 0.0
+            loss = -d if d < 0.0 else 0.0
+            if i == 1:
+                avg_gain = gain
+                avg_loss = loss
+            else:
+                avg_gain += a_rsi * (gain - avg_gain)
+                avg_loss += a_rsi * (loss - avg_loss)
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / (avg_loss if avg_loss != 0.0 else 1e-12))
+            tr = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+            trs[i] = tr
+            tr_sum += tr
+            if i >= atr_window:
+                tr_sum -= trs[i - atr_window]
+            atr[i] = tr_sum / min(i + 1, atr_window)
+        return emas, rsi, atr
+
+
+def compute_bundle(df: pd.DataFrame, ema_spans=(20, 100), rsi_window: int = 14, atr_window: int = 14) -> Dict[str, pd.Series]:
+    """
+    EMAs (`ema<span>`), RSI e ATR do mesmo DataFrame OHLC de uma vez.
+
+    Com numba, um único kernel percorre high/low/close uma vez para todos os
+    indicadores; sem numba (ou com NaN nos dados) usa as classes acima.
+    """
+    close, high, low = df["close"], df["high"], df["low"]
+    if HAS_NUMBA:
+        h = high.to_numpy(dtype=np.float64)
+        l = low.to_numpy(dtype=np.float64)
+        c = close.to_numpy(dtype=np.float64)
+        if not (np.isnan(h).any() or np.isnan(l).any() or np.isnan(c).any()):
+            emas, rsi, atr = _bundle_kernel(h, l, c, np.asarray(ema_spans, dtype=np.int64), rsi_window, atr_window)
+            out = {f"ema{span}": pd.Series(emas[j], index=df.index) for j, span in enumerate(ema_spans)}
+            out["rsi"] = pd.Series(rsi, index=df.index)
+            out["atr"] = pd.Series(atr, index=df.index)
+            return out
+    out = {f"ema{span}": EMAIndicator(close, span).ema() for span in ema_spans}
+    out["rsi"] = RSIIndicator(close, rsi_window).rsi()
+    out["atr"] = ATRIndicator(high, low, close, atr_window).atr()
+    return out
+
 # Wrappers simples que alguns testes esperam
 class EMA: 
     def __init__(self, close: pd.Series, window: int = 12, adjust: bool = False): self._i = EMAIndicator(close, window, adjust)
@@ -113,19 +273,5 @@ class BBANDS:
 # ---- Public API direto do pacote ----
 __all__ = [
     "EMAIndicator","RSIIndicator","ATRIndicator","EWOIndicator","StochRSIIndicator","MACDIndicator","BBANDSIndicator",
-    "EMA","RSI","ATR","EWO","StochRSI","MACD","BBANDS"
+    "EMA","RSI","ATR","EWO","StochRSI","MACD","BBANDS","compute_bundle"
 ]
-
-# ---- Submódulos dinâmicos (fazem imports do tipo ...indicators.ema funcionarem) ----
-def _make_module(name: str, symbols: dict):
-    m = types.ModuleType(f"{PKG}.{name}")
-    m.__dict__.update(symbols)
-    sys.modules[m.__name__] = m
-
-_make_module("ema", {"EMAIndicator": EMAIndicator, "EMA": EMA})
-_make_module("rsi", {"RSIIndicator": RSIIndicator, "RSI": RSI})
-_make_module("atr", {"ATRIndicator": ATRIndicator, "ATR": ATR})
-_make_module("ewo", {"EWOIndicator": EWOIndicator, "EWO": EWO})
-_make_module("stoch_rsi", {"StochRSIIndicator": StochRSIIndicator, "StochRSI": StochRSI})
-_make_module("macd", {"MACDIndicator": MACDIndicator, "MACD": MACD})
-_make_module("bbands", {"BBANDSIndicator": BBANDSIndicator, "BBANDS": BBANDS})
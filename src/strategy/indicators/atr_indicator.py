@@ -1,29 +1,43 @@
+from collections import deque
+
 from .base_indicator import BaseIndicator
 
 class ATRIndicator(BaseIndicator):
+    __slots__ = ("high", "low", "close", "_trs", "_tr_sum", "_count", "_atr")
+
     def __init__(self, period: int = 14):
         super().__init__(period)
-        self.high = []
-        self.low = []
-        self.close = []
+        # só os últimos candles/TRs necessários para a janela
+        self.high = deque(maxlen=self.period + 1)
+        self.low = deque(maxlen=self.period + 1)
+        self.close = deque(maxlen=self.period + 1)
+        self._trs = deque(maxlen=self.period)
+        self._tr_sum = 0.0
+        self._count = 0
         self._atr = None
 
     def add_ohlc(self, high: float, low: float, close: float):
-        self.high.append(float(high))
-        self.low.append(float(low))
-        self.close.append(float(close))
+        high, low, close = float(high), float(low), float(close)
+        if self.close:
+            prev_close = self.close[-1]
+            tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+            if len(self._trs) == self._trs.maxlen:
+                # o TR mais antigo sai da janela ao anexar o novo
+                self._tr_sum -= self._trs[0]
+            self._trs.append(tr)
+            self._tr_sum += tr
+        self.high.append(high)
+        self.low.append(low)
+        self.close.append(close)
+        self._count += 1
         self._recalc()
 
     def _recalc(self):
-        n = len(self.close)
-        if n < self.period + 1:
+        if self._count < self.period + 1:
             self._atr = None
             return
-        trs = []
-        for i in range(1, n):
-            tr = max(self.high[i]-self.low[i], abs(self.high[i]-self.close[i-1]), abs(self.low[i]-self.close[i-1]))
-            trs.append(tr)
-        self._atr = sum(trs[-self.period:]) / self.period
+        # soma corrente dos últimos `period` TRs: O(1) por candle
+        self._atr = self._tr_sum / self.period
 
     def value(self):
         return self._atr
@@ -1,15 +1,23 @@
+from collections import deque
+from itertools import islice
+
 class BaseIndicator:
+    __slots__ = ("period", "data")
+
     def __init__(self, period: int = 14):
         self.period = int(period)
-        self.data = []
+        # histórico limitado: os valores mais antigos são descartados
+        self.data = deque(maxlen=max(self.period * 4, 1024))
 
     def add_data(self, value: float):
         self.data.append(float(value))
 
     def get_data(self, n: int = None):
-        if n is None:
-            return list(self.data)
-        return list(self.data[-n:])
+        if not n or n < 0:
+            # mesmo resultado de list(self.data[-n:]) para n nulo/negativo
+            return list(self.data)[-n:] if n else list(self.data)
+        size = len(self.data)
+        return list(islice(self.data, max(size - n, 0), size))
 
     @property
     def is_ready(self) -> bool:
@@ -0,0 +1,2 @@
+# Implementações em src/strategy/indicators/__init__.py
+from . import BBANDS, BBANDSIndicator  # noqa: F401
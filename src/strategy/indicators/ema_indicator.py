@@ -1,6 +1,8 @@
 from .base_indicator import BaseIndicator
 
 class EMAIndicator(BaseIndicator):
+    __slots__ = ("_ema",)
+
     def __init__(self, period: int = 14):
         super().__init__(period)
         self._ema = None
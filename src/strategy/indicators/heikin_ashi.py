@@ -1,4 +1,5 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
 class HeikinAshiIndicator:
@@ -15,16 +16,24 @@ class HeikinAshiIndicator:
         self.close = close.astype(float)
 
     def heikin_ashi(self) -> pd.DataFrame:
-        ha_close = (self.open + self.high + self.low + self.close) / 4.0
+        o = self.open.to_numpy(dtype=np.float64)
+        h = self.high.to_numpy(dtype=np.float64)
+        l = self.low.to_numpy(dtype=np.float64)
+        c = self.close.to_numpy(dtype=np.float64)
+        ha_close = (o + h + l + c) / 4.0
 
-        ha_open = pd.Series(index=self.open.index, dtype=float)
-        if len(self.open) > 0:
-            ha_open.iloc[0] = (self.open.iloc[0] + self.close.iloc[0]) / 2.0
-        for i in range(1, len(self.open)):
-            ha_open.iloc[i] = (ha_open.iloc[i-1] + ha_close.iloc[i-1]) / 2.0
+        # recorrência do open sobre arrays (sem .iloc por linha)
+        ha_open = np.empty_like(ha_close)
+        if ha_open.shape[0] > 0:
+            prev = (o[0] + c[0]) / 2.0
+            ha_open[0] = prev
+            for i, hc in enumerate(ha_close[:-1].tolist(), start=1):
+                prev = (prev + hc) / 2.0
+                ha_open[i] = prev
 
-        ha_high = pd.concat([self.high, ha_open, ha_close], axis=1).max(axis=1)
-        ha_low  = pd.concat([self.low, ha_open, ha_close], axis=1).min(axis=1)
+        # fmax/fmin ignoram NaN como o max/min(axis=1) do pandas
+        ha_high = np.fmax(h, np.fmax(ha_open, ha_close))
+        ha_low = np.fmin(l, np.fmin(ha_open, ha_close))
 
         return pd.DataFrame(
             {"open": ha_open, "high": ha_high, "low": ha_low, "close": ha_close},
@@ -93,6 +93,15 @@ class IndicatorManager:
                 self.logger.error(f"Formato de dados inesperado: {len(first_row)} colunas")
                 return pd.DataFrame()
             
+            # Caminho rápido: dados limpos (caso comum da API) convertidos direto via numpy
+            df = self._prepare_clean_data(kline_data, columns)
+            if df is not None:
+                if len(df) < 10:
+                    self.logger.error(f"DataFrame final tem poucas linhas: {len(df)}")
+                    return pd.DataFrame()
+                self.logger.info(f"DataFrame preparado com sucesso: {len(df)} linhas")
+                return df
+            
             df = pd.DataFrame(kline_data, columns=columns)
             
             # CORREÇÃO: Verificação explícita de DataFrame vazio
@@ -195,6 +204,39 @@ class IndicatorManager:
             self.logger.error(f"Erro ao preparar dados: {e}")
             return pd.DataFrame()
     
+    def _prepare_clean_data(self, kline_data: List[List], columns: List[str]):
+        """
+        Versão numpy de prepare_data_safe para klines totalmente numéricas e finitas
+        
+        Returns:
+            DataFrame equivalente ao do caminho pandas, ou None se os dados precisarem
+            da limpeza completa (valores inválidos, NaN/inf, linhas irregulares)
+        """
+        try:
+            values = np.asarray(kline_data, dtype=object).astype(np.float64)
+        except (TypeError, ValueError):
+            return None
+        if values.ndim != 2 or values.shape[1] != len(columns) or not np.isfinite(values).all():
+            return None
+        
+        # mesmas regras de timestamp do caminho completo
+        ts = values[:, 0]
+        if ts.max() > 1e12:
+            ts = ts / 1000
+        if ts.max() > 2e12 or ts.min() < 1e9:
+            self.logger.warning("Timestamps fora do range válido, gerando sequenciais")
+            end_time = datetime.now()
+            start_time = end_time - timedelta(minutes=15 * len(ts))
+            index = pd.date_range(start=start_time, end=end_time, periods=len(ts))
+        else:
+            index = pd.to_datetime(ts, unit='ms')
+        
+        df = pd.DataFrame(values[:, 1:], columns=columns[1:], index=pd.DatetimeIndex(index, name='timestamp'))
+        # a API já entrega em ordem: só ordena quando necessário
+        if not df.index.is_monotonic_increasing:
+            df.sort_index(inplace=True)
+        return df
+    
     def calculate_all(self, kline_data: list) -> Dict[str, Any]:
         """
         Calcula todos os indicadores
@@ -1,6 +1,8 @@
 from .base_indicator import BaseIndicator
 
 class RSIIndicator(BaseIndicator):
+    __slots__ = ()
+
     def value(self):
         if len(self.data) < self.period + 1:
             return None
@@ -1,6 +1,33 @@
 from __future__ import annotations
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit  # type: ignore
+    HAS_NUMBA = True
+except ImportError:  # numba é opcional: sem ele o ATR segue pelo ewm do pandas
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _wilder_atr(h, l, c, alpha):
+        """TR + suavização de Wilder numa passada, com a aritmética de ewm(alpha=alpha, adjust=False)."""
+        n = h.shape[0]
+        out = np.empty(n)
+        if n == 0:
+            return out
+        old_wt = 1.0 - alpha
+        atr = h[0] - l[0]
+        out[0] = atr
+        for i in range(1, n):
+            tr = max(h[i] - l[i], abs(h[i] - c[i - 1]), abs(l[i] - c[i - 1]))
+            if atr != tr:
+                atr = (old_wt * atr + alpha * tr) / (old_wt + alpha)
+            out[i] = atr
+        return out
+
+
 class UTBotIndicator:
     """
     Implementação simples de um 'UT Bot'-like:
@@ -18,11 +45,19 @@ class UTBotIndicator:
         self.factor = factor
 
     def _atr(self) -> pd.Series:
-        prev_close = self.close.shift(1)
-        tr1 = self.high - self.low
-        tr2 = (self.high - prev_close).abs()
-        tr3 = (self.low - prev_close).abs()
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        h = self.high.to_numpy(dtype=np.float64, copy=False)
+        l = self.low.to_numpy(dtype=np.float64, copy=False)
+        c = self.close.to_numpy(dtype=np.float64, copy=False)
+        if HAS_NUMBA and not (np.isnan(h).any() or np.isnan(l).any() or np.isnan(c).any()):
+            # mesma conversão alpha -> com -> alpha que o pandas faz internamente
+            a = 1 / self.atr_period
+            alpha = 1.0 / (1.0 + (1.0 - a) / a)
+            return pd.Series(_wilder_atr(h, l, c, alpha), index=self.high.index)
+        prev_close = np.empty_like(c)
+        prev_close[:1] = np.nan
+        prev_close[1:] = c[:-1]
+        # fmax ignora o NaN do primeiro candle, como o max(axis=1) do pandas
+        tr = pd.Series(np.fmax(h - l, np.fmax(np.abs(h - prev_close), np.abs(l - prev_close))), index=self.high.index)
         # Wilder smoothing = EMA com alpha=1/period e adjust=False
         return tr.ewm(alpha=1/self.atr_period, adjust=False).mean()
 
@@ -264,6 +264,34 @@ class TestTradingEndpoints:
         assert data["status"] == "running"
         assert data["client_id"] == 1
     
+    @patch('src.api.routes.trading.get_current_client')
+    @patch('src.bot.worker.TradingWorker.get_bot_status')
+    def test_get_trading_status_not_modified(self, mock_get_status, mock_get_current, client, auth_headers):
+        """Testa resposta 304 quando o ETag do status não mudou"""
+        mock_client = Mock()
+        mock_client.id = 1
+        mock_get_current.return_value = mock_client
+        mock_get_status.return_value = {"client_id": 1, "status": "running", "daily_pnl": 0.0}
+        
+        first = client.get("/api/trading/status", headers=auth_headers)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+        
+        second = client.get(
+            "/api/trading/status",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert second.status_code == 304
+        assert second.content == b""
+        
+        mock_get_status.return_value = {"client_id": 1, "status": "paused", "daily_pnl": 0.0}
+        third = client.get(
+            "/api/trading/status",
+            headers={**auth_headers, "If-None-Match": etag}
+        )
+        assert third.status_code == 200
+        assert third.json()["status"] == "paused"
+    
     @patch('src.api.routes.trading.get_current_client')
     @patch('src.bot.worker.TradingWorker.start_bot')
     def test_start_trading_success(self, mock_start_bot, mock_get_current, client, auth_headers):
@@ -0,0 +1,93 @@
+# 🧪 Testes Unitários - Criptografia de chaves de API
+"""
+Testes unitários para src.security.encryption
+Localização: /tests/unit/test_encryption.py
+"""
+import base64
+from types import SimpleNamespace
+
+import pytest
+from cryptography.fernet import Fernet, InvalidToken
+
+from src.security import encryption
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """EncryptionManager global com uma chave de teste e cache de decrypt limpo"""
+    monkeypatch.setattr(encryption, "settings", SimpleNamespace(encryption_key="chave-de-teste"))
+    monkeypatch.setattr(encryption, "_encryption_manager", None)
+    encryption.clear_decrypt_cache()
+    yield encryption.get_encryption_manager()
+    encryption.clear_decrypt_cache()
+
+
+class TestEncryptionManager:
+    """Testes para encrypt/decrypt"""
+
+    def test_round_trip(self, manager):
+        """Texto cifrado volta ao original"""
+        token = manager.encrypt("api_key_12345")
+        assert token != "api_key_12345"
+        assert manager.decrypt(token) == "api_key_12345"
+
+    def test_empty_values(self, manager):
+        """String vazia não passa pelo Fernet"""
+        assert manager.encrypt("") == ""
+        assert manager.decrypt("") == ""
+
+    def test_token_is_plain_fernet(self, manager):
+        """O token novo é o próprio token Fernet (sem segunda camada de base64)"""
+        token = manager.encrypt("segredo")
+        assert manager._fernet.decrypt(token.encode("ascii")) == b"segredo"
+
+    def test_legacy_double_base64_token(self, manager):
+        """Valores antigos (urlsafe_b64encode do token Fernet) continuam legíveis"""
+        legacy = base64.urlsafe_b64encode(manager._fernet.encrypt(b"segredo_antigo")).decode()
+        assert manager.decrypt(legacy) == "segredo_antigo"
+
+    def test_same_key_across_instances(self, manager):
+        """A chave derivada é determinística: outra instância lê o mesmo token"""
+        token = manager.encrypt("segredo")
+        assert encryption.EncryptionManager().decrypt(token) == "segredo"
+
+    def test_wrong_key_raises(self, manager):
+        """Token de outra chave é rejeitado"""
+        foreign = Fernet(Fernet.generate_key()).encrypt(b"segredo").decode()
+        with pytest.raises(InvalidToken):
+            manager.decrypt(foreign)
+
+
+class TestDecryptCache:
+    """Testes para _decrypt_cached / clear_decrypt_cache"""
+
+    def test_decrypts_once_per_token(self, manager, monkeypatch):
+        """O mesmo token só é decifrado uma vez até limpar o cache"""
+        token = encryption.encrypt_api_key("api_key_12345")
+        calls = []
+        original = manager.decrypt
+        monkeypatch.setattr(manager, "decrypt", lambda t: calls.append(t) or original(t))
+
+        assert encryption.decrypt_api_key(token) == "api_key_12345"
+        assert encryption.decrypt_api_key(token) == "api_key_12345"
+        assert encryption.decrypt_sensitive_data(token) == "api_key_12345"
+        assert calls == [token]
+
+        encryption.clear_decrypt_cache()
+        assert encryption.decrypt_api_key(token) == "api_key_12345"
+        assert calls == [token, token]
+
+    def test_distinct_tokens_are_cached_separately(self, manager):
+        """Tokens diferentes não compartilham entrada de cache"""
+        first = encryption.encrypt_sensitive_data("primeiro")
+        second = encryption.encrypt_sensitive_data("segundo")
+        assert encryption.decrypt_sensitive_data(first) == "primeiro"
+        assert encryption.decrypt_sensitive_data(second) == "segundo"
+        assert encryption._decrypt_cached.cache_info().currsize == 2
+
+    def test_failed_decrypt_is_not_cached(self, manager):
+        """Erro de decrypt propaga e não fica memorizado"""
+        foreign = Fernet(Fernet.generate_key()).encrypt(b"segredo").decode()
+        with pytest.raises(InvalidToken):
+            encryption.decrypt_api_key(foreign)
+        assert encryption._decrypt_cached.cache_info().currsize == 0
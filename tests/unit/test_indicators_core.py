@@ -0,0 +1,200 @@
+# 🧪 Testes Unitários - Indicadores incrementais (src.indicators)
+"""
+Testes unitários para os indicadores de src.indicators usados pelas estratégias
+Localização: /tests/unit/test_indicators_core.py
+"""
+import math
+
+import numpy as np
+import pytest
+
+from src.indicators import (
+    ATRIndicator, EMAIndicator, EWOIndicator, RSIIndicator, StochRSIIndicator,
+    UTBotIndicator, compute_indicators
+)
+from src.indicators._batch import compute_all
+from src.indicators._kernels import atr_last
+
+
+@pytest.fixture
+def ohlc():
+    """Passeio aleatório com candles coerentes (low <= close <= high)"""
+    rng = np.random.default_rng(7)
+    close = 100.0 + np.cumsum(rng.standard_normal(300))
+    spread = rng.uniform(0.1, 2.0, close.size)
+    high = close + spread * rng.uniform(0.0, 1.0, close.size)
+    low = close - spread * rng.uniform(0.0, 1.0, close.size)
+    return high.tolist(), low.tolist(), close.tolist()
+
+
+class TestPushMatchesCalculate:
+    """push() incremental deve devolver o mesmo valor que calculate() sobre o histórico"""
+
+    @pytest.mark.parametrize("cls, args", [
+        (EMAIndicator, (10,)),
+        (RSIIndicator, (14,)),
+        (EWOIndicator, (5, 35)),
+        (StochRSIIndicator, (14, 14)),
+    ], ids=["ema", "rsi", "ewo", "stochrsi"])
+    def test_price_indicators(self, cls, args, ohlc):
+        """EMA, RSI, EWO e StochRSI: mesmo valor (ou None) a cada preço"""
+        indicator = cls(*args)
+        _, _, close = ohlc
+        for price in close:
+            pushed = indicator.push(price)
+            expected = indicator.calculate()
+            if expected is None:
+                assert pushed is None
+            else:
+                assert pushed == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+    def test_atr(self, ohlc):
+        """ATR de Wilder: push acompanha atr_last a cada candle"""
+        indicator = ATRIndicator(14)
+        for h, l, c in zip(*ohlc):
+            pushed = indicator.push(h, l, c)
+            expected = indicator.calculate()
+            if expected is None:
+                assert pushed is None
+            else:
+                assert pushed == pytest.approx(expected, rel=1e-12)
+
+    def test_rsi_flat_window_is_exactly_100(self):
+        """Depois que as perdas saem da janela o RSI volta a 100 exatos (sem resíduo)"""
+        indicator = RSIIndicator(3)
+        for price in [10.0, 9.7, 9.9, 10.3, 10.4, 10.6, 10.9]:
+            value = indicator.push(price)
+        assert value == 100.0
+        assert indicator.calculate() == 100.0
+
+    def test_rsi_ignores_invalid_values(self):
+        """Valores inválidos não alteram o estado incremental"""
+        indicator = RSIIndicator(3)
+        for price in [1.0, 2.0, None, 1.5, float("nan"), 2.5, 2.0]:
+            value = indicator.push(price)
+        assert value == pytest.approx(indicator.calculate())
+
+    def test_reset_clears_running_state(self, ohlc):
+        """reset() zera as somas correntes do RSI"""
+        _, _, close = ohlc
+        indicator = RSIIndicator(14)
+        for price in close[:50]:
+            indicator.push(price)
+        indicator.reset()
+        for price in close[100:150]:
+            value = indicator.push(price)
+        assert value == pytest.approx(RSIIndicator(14).calculate(close[100:150]), rel=1e-9)
+
+
+class TestATRKnownValues:
+    """ATR de Wilder contra valores calculados à mão (período 3)"""
+
+    # TRs: 2, 2, 4 (semente = 8/3), depois 1 e 4 pela suavização de Wilder
+    CANDLES = [(10, 8, 9), (11, 9, 10), (12, 10, 11), (13, 9, 12), (12, 11, 11), (15, 12, 14)]
+    EXPECTED = [None, None, None, 8 / 3, 19 / 9, 74 / 27]
+
+    def test_calculate_step_by_step(self):
+        """calculate() após cada candle: None até period + 1 candles, depois a série de Wilder"""
+        indicator = ATRIndicator(3)
+        for (h, l, c), expected in zip(self.CANDLES, self.EXPECTED):
+            indicator.add_ohlc_data(h, l, c)
+            if expected is None:
+                assert indicator.calculate() is None
+            else:
+                assert indicator.calculate() == pytest.approx(expected, rel=1e-12)
+
+    def test_atr_last(self):
+        """Kernel direto sobre as colunas"""
+        high, low, close = (np.array(col, dtype=np.float64) for col in zip(*self.CANDLES))
+        assert atr_last(high, low, close, 3) == pytest.approx(74 / 27, rel=1e-12)
+        assert atr_last(high[:4], low[:4], close[:4], 3) == pytest.approx(8 / 3, rel=1e-12)
+
+    def test_float32_columns(self):
+        """Colunas float32 acumulam em float64: mesmo resultado para valores exatos"""
+        indicator = ATRIndicator(3, dtype=np.float32)
+        for h, l, c in self.CANDLES:
+            indicator.add_ohlc_data(h, l, c)
+        assert indicator.calculate() == pytest.approx(74 / 27, rel=1e-12)
+
+
+def _calculate_each(high, low, close, ema_fast=5, ema_slow=35, rsi_period=14, atr_period=14,
+                    stoch_period=14, multiplier=2.0):
+    """Resultado esperado: calculate() de cada indicador sobre a mesma série"""
+    atr = ATRIndicator(atr_period)
+    for h, l, c in zip(high, low, close):
+        atr.push(h, l, c)
+    signals = UTBotIndicator(multiplier=multiplier).calculate_signals(close)
+    return {
+        "ema_fast": EMAIndicator(ema_fast).calculate(close),
+        "ema_slow": EMAIndicator(ema_slow).calculate(close),
+        "ewo": EWOIndicator(ema_fast, ema_slow).calculate(close),
+        "rsi": RSIIndicator(rsi_period).calculate(close),
+        "atr": atr.calculate(),
+        "stochrsi": StochRSIIndicator(rsi_period, stoch_period).calculate(close),
+        "utbot": signals[-1] if signals else None,
+    }
+
+
+def _assert_same(result, expected):
+    assert set(result) == set(expected)
+    for name, value in expected.items():
+        if value is None or isinstance(value, str):
+            assert result[name] == value, name
+        else:
+            assert result[name] == pytest.approx(value, rel=1e-9, abs=1e-9), name
+
+
+class TestComputeIndicators:
+    """compute_indicators / compute_all numa passada == calculate() de cada indicador"""
+
+    # tamanhos em volta dos limiares de prontidão (RSI 15, StochRSI 29, EWO 35)
+    @pytest.mark.parametrize("size", [1, 2, 14, 15, 28, 29, 35, 36, 300])
+    def test_matches_individual_calculate(self, ohlc, size):
+        """Mesmos valores (e os mesmos None) para séries curtas e longas"""
+        high, low, close = (col[:size] for col in ohlc)
+        _assert_same(compute_indicators(close, high, low), _calculate_each(high, low, close))
+
+    def test_custom_periods(self, ohlc):
+        """Períodos e multiplicador customizados são repassados a todos os indicadores"""
+        high, low, close = ohlc
+        params = dict(ema_fast=3, ema_slow=10, rsi_period=7, atr_period=5, stoch_period=9, multiplier=0.5)
+        _assert_same(
+            compute_indicators(close, high, low, **params),
+            _calculate_each(high, low, close, **params),
+        )
+
+    def test_without_high_low(self, ohlc):
+        """Sem high/low o ATR volta None e o resto segue igual"""
+        _, _, close = ohlc
+        result = compute_indicators(close)
+        expected = _calculate_each(close, close, close)
+        expected["atr"] = None
+        _assert_same(result, expected)
+
+    def test_invalid_candles_are_dropped(self, ohlc):
+        """Candle com qualquer campo inválido sai das três colunas"""
+        high, low, close = (list(col[:80]) for col in ohlc)
+        high[10] = None
+        close[40] = float("nan")
+        low[60] = "x"
+        keep = [i for i in range(80) if i not in (10, 40, 60)]
+        clean = [[col[i] for i in keep] for col in (high, low, close)]
+        _assert_same(compute_indicators(close, high, low), _calculate_each(*clean))
+
+    def test_mismatched_lengths_raise(self, ohlc):
+        """Colunas de tamanhos diferentes não são truncadas em silêncio"""
+        high, low, close = ohlc
+        with pytest.raises(ValueError):
+            compute_indicators(close[:100], high[:100], low[:50])
+        with pytest.raises(ValueError):
+            compute_indicators(close[:50], high[:100], low[:100])
+
+    def test_compute_all_returns_nan_when_not_ready(self):
+        """compute_all sinaliza falta de dados com NaN (compute_indicators converte em None)"""
+        c = np.array([100.0, 101.0, 100.5])
+        ef, es, rsi, atr, stoch, change = compute_all(c, c + 1.0, c - 1.0, 5, 35, 14, 14, 14)
+        assert ef == pytest.approx(EMAIndicator(5).calculate(c.tolist()))
+        assert es == pytest.approx(EMAIndicator(35).calculate(c.tolist()))
+        assert all(math.isnan(v) for v in (rsi, atr, stoch))
+        assert change == pytest.approx((100.5 - 101.0) / 101.0)
+        assert all(math.isnan(v) for v in compute_all(c[:0], c[:0], c[:0], 5, 35, 14, 14, 14))
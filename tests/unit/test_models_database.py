@@ -0,0 +1,96 @@
+# 🧪 Testes Unitários - Candles em memória do DatabaseManager
+"""
+Testes unitários para o armazenamento de candles em colunas NumPy
+Localização: /tests/unit/test_models_database.py
+"""
+import random
+
+import pytest
+
+from src.models.database import DatabaseManager, _MAX_CANDLES
+
+
+def _candle(ts: int) -> dict:
+    return {"timestamp": ts, "open": ts + 0.1, "high": ts + 0.5, "low": ts - 0.5, "close": ts + 0.2, "volume": 1.0}
+
+
+def _reference(batches):
+    """Modelo de referência: ordenação estável por timestamp e corte dos mais antigos."""
+    rows = []
+    for batch in batches:
+        rows = sorted(rows + list(batch), key=lambda c: c["timestamp"])
+        rows = rows[-_MAX_CANDLES:]
+    return rows[::-1]
+
+
+class TestStoreMarketData:
+    """Testes para store_market_data / get_market_data"""
+
+    @pytest.mark.asyncio
+    async def test_chronological_append(self):
+        """Lotes cronológicos são anexados e lidos do mais recente ao mais antigo"""
+        db = DatabaseManager()
+        batches = [[_candle(t) for t in range(i * 50, (i + 1) * 50)] for i in range(4)]
+        for batch in batches:
+            assert await db.store_market_data("BTCUSDT", "1m", batch) == 50
+
+        data = await db.get_market_data("BTCUSDT", "1m", limit=1000)
+        assert data == _reference(batches)
+        assert (await db.get_market_data("BTCUSDT", "1m", limit=3)) == data[:3]
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_merge(self):
+        """Candles fora de ordem são intercalados mantendo a ordem por timestamp"""
+        db = DatabaseManager()
+        batches = [
+            [_candle(t) for t in range(0, 200, 2)],
+            [_candle(t) for t in (151, 3, 77, 199, 1)],
+            [_candle(t) for t in range(1, 40, 2)],
+        ]
+        for batch in batches:
+            await db.store_market_data("ETHUSDT", "5m", batch)
+
+        data = await db.get_market_data("ETHUSDT", "5m", limit=1000)
+        assert data == _reference(batches)
+
+    @pytest.mark.asyncio
+    async def test_realloc_out_of_order_keeps_newest(self):
+        """Na realocação o merge usa todas as linhas vivas e só depois corta as mais antigas"""
+        db = DatabaseManager()
+        # dois lotes cheios deixam o buffer (2x o limite) quase sem espaço livre
+        full = [_candle(t) for t in range(1000, 1000 + _MAX_CANDLES)]
+        more = [_candle(t) for t in range(1000 + _MAX_CANDLES, 1000 + 2 * _MAX_CANDLES - 50)]
+        # candles antigos + mais novos que tudo, forçando a realocação
+        mixed = [_candle(t) for t in range(0, 100)] + [_candle(t) for t in range(20_000, 20_050)]
+        random.Random(1).shuffle(mixed)
+        batches = [full, more, mixed]
+        for batch in batches:
+            await db.store_market_data("BTCUSDT", "1h", batch)
+
+        data = await db.get_market_data("BTCUSDT", "1h", limit=_MAX_CANDLES)
+        assert len(data) == _MAX_CANDLES
+        assert data == _reference(batches)
+        assert data[0]["timestamp"] == 20_049
+
+    @pytest.mark.asyncio
+    async def test_oversized_unsorted_batch_keeps_newest(self):
+        """Lote maior que o limite e desordenado mantém os timestamps mais recentes"""
+        db = DatabaseManager()
+        batch = [_candle(t) for t in range(_MAX_CANDLES + 300)]
+        random.Random(2).shuffle(batch)
+        await db.store_market_data("BTCUSDT", "1d", batch)
+
+        data = await db.get_market_data("BTCUSDT", "1d", limit=_MAX_CANDLES)
+        assert data == _reference([batch])
+
+    @pytest.mark.asyncio
+    async def test_many_small_batches_stay_capped(self):
+        """Muitos lotes pequenos, com realocações e empates de timestamp, ficam no limite"""
+        db = DatabaseManager()
+        rng = random.Random(3)
+        batches = [[_candle(rng.randrange(20_000)) for _ in range(rng.randrange(1, 400))] for _ in range(60)]
+        for batch in batches:
+            await db.store_market_data("SOLUSDT", "1m", batch)
+
+        data = await db.get_market_data("SOLUSDT", "1m", limit=2 * _MAX_CANDLES)
+        assert data == _reference(batches)
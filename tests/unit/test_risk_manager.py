@@ -3,11 +3,14 @@
 Testes unitários para o gerenciador de risco do MVP Bot
 Localização: /tests/unit/test_risk_manager.py
 """
+import numpy as np
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timedelta
 
-from src.bot.risk_manager import RiskManager
+from src.bot.risk_manager import (
+    RiskManager, REASON_OK, REASON_TOO_MANY_POSITIONS, REASON_INSUFFICIENT_BALANCE, REASON_RISK_LIMIT
+)
 from src.bot.interfaces import (
     OrderRequest, OrderSide, OrderType, Position, PositionSide,
     MarketData
@@ -315,6 +318,67 @@ class TestTakeProfitCalculation:
         assert abs(take_profit - expected_take_profit) < 0.01
 
 
+class TestBatchCalculations:
+    """Testes para os cálculos em lote (vários símbolos)"""
+    
+    @pytest.fixture
+    def risk_manager(self):
+        """Fixture do gerenciador de risco"""
+        return RiskManager()
+    
+    def test_calculate_position_sizes_matches_scalar(self, risk_manager):
+        """Tamanhos em lote devem coincidir com o cálculo individual"""
+        balances = np.array([10000.0, 100000.0, 50.0, 10000.0])
+        prices = np.array([50000.0, 50000.0, 50000.0, 0.0])
+        
+        sizes = risk_manager.calculate_position_sizes(balances, prices)
+        
+        expected = [
+            risk_manager.calculate_position_size({"USDT": b}, p)
+            for b, p in zip(balances, prices)
+        ]
+        assert sizes.tolist() == expected
+    
+    def test_calculate_stop_losses_and_take_profits(self, risk_manager):
+        """SL/TP em lote devem respeitar o lado de cada posição"""
+        entries = np.array([50000.0, 50000.0])
+        is_long = np.array([True, False])
+        
+        stop_losses = risk_manager.calculate_stop_losses(entries, is_long, 0.02)
+        take_profits = risk_manager.calculate_take_profits(entries, is_long, 0.04)
+        
+        assert stop_losses.tolist() == [
+            risk_manager.calculate_stop_loss(50000.0, PositionSide.LONG, 0.02),
+            risk_manager.calculate_stop_loss(50000.0, PositionSide.SHORT, 0.02),
+        ]
+        assert take_profits.tolist() == [
+            risk_manager.calculate_take_profit(50000.0, PositionSide.LONG, 0.04),
+            risk_manager.calculate_take_profit(50000.0, PositionSide.SHORT, 0.04),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_validate_orders_matches_validate_order(self, risk_manager):
+        """Validação em lote deve concordar com validate_order ordem a ordem"""
+        quantities = np.array([0.004, 0.004, 1.0, 0.01])
+        prices = np.array([50000.0, 50000.0, 50000.0, 50000.0])
+        balances = np.array([10000.0, 10000.0, 10000.0, 10000.0])
+        open_counts = np.array([0, 5, 0, 0])
+        
+        valid, reasons, sizes = risk_manager.validate_orders(quantities, prices, balances, open_counts)
+        
+        assert reasons.tolist() == [
+            REASON_OK, REASON_TOO_MANY_POSITIONS, REASON_INSUFFICIENT_BALANCE, REASON_RISK_LIMIT
+        ]
+        for i in range(len(quantities)):
+            order = Mock(quantity=quantities[i])
+            market_data = Mock(price=prices[i])
+            expected = await risk_manager.validate_order(
+                order, [Mock()] * int(open_counts[i]), {"USDT": balances[i]}, market_data
+            )
+            assert bool(valid[i]) == expected
+        assert sizes.tolist() == risk_manager.calculate_position_sizes(balances, prices).tolist()
+
+
 class TestRiskParameterUpdate:
     """Testes para atualização de parâmetros de risco"""
     
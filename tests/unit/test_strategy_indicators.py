@@ -0,0 +1,71 @@
+# 🧪 Testes Unitários - Indicadores vetorizados (src.strategy.indicators)
+"""
+Testes unitários para os indicadores em pandas usados pelo backtest/estratégia
+Localização: /tests/unit/test_strategy_indicators.py
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategy.indicators import (
+    ATRIndicator, EMAIndicator, RSIIndicator, compute_bundle
+)
+
+
+@pytest.fixture
+def ohlc_df():
+    """DataFrame OHLC com passeio aleatório determinístico"""
+    rng = np.random.default_rng(11)
+    close = 100.0 + np.cumsum(rng.standard_normal(400))
+    high = close + rng.uniform(0.0, 1.5, close.size)
+    low = close - rng.uniform(0.0, 1.5, close.size)
+    index = pd.date_range("2024-01-01", periods=close.size, freq="1min")
+    return pd.DataFrame({"open": close, "high": high, "low": low, "close": close}, index=index)
+
+
+def _expected(df, spans, rsi_window, atr_window):
+    out = {f"ema{span}": EMAIndicator(df["close"], span).ema() for span in spans}
+    out["rsi"] = RSIIndicator(df["close"], rsi_window).rsi()
+    out["atr"] = ATRIndicator(df["high"], df["low"], df["close"], atr_window).atr()
+    return out
+
+
+class TestComputeBundle:
+    """compute_bundle deve reproduzir as classes individuais"""
+
+    @pytest.mark.parametrize("spans, rsi_window, atr_window", [
+        ((20, 100), 14, 14),
+        ((5,), 7, 3),
+    ])
+    def test_matches_indicator_classes(self, ohlc_df, spans, rsi_window, atr_window):
+        """Sem NaN (caminho do kernel conjunto quando há numba)"""
+        result = compute_bundle(ohlc_df, spans, rsi_window, atr_window)
+        expected = _expected(ohlc_df, spans, rsi_window, atr_window)
+
+        assert set(result) == set(expected)
+        for name, series in expected.items():
+            pd.testing.assert_series_equal(
+                result[name], series, check_exact=False, rtol=1e-9, check_names=False
+            )
+
+    def test_matches_indicator_classes_with_nan(self, ohlc_df):
+        """Com NaN nos dados o resultado (inclusive os buracos) segue as classes"""
+        df = ohlc_df.copy()
+        df.iloc[50, df.columns.get_loc("close")] = np.nan
+        df.iloc[120, df.columns.get_loc("high")] = np.nan
+
+        result = compute_bundle(df)
+        expected = _expected(df, (20, 100), 14, 14)
+
+        for name, series in expected.items():
+            pd.testing.assert_series_equal(
+                result[name], series, check_exact=False, rtol=1e-9, check_names=False
+            )
+        assert result["rsi"].isna().sum() == expected["rsi"].isna().sum()
+
+    def test_empty_frame(self):
+        """DataFrame vazio devolve séries vazias"""
+        df = pd.DataFrame({"open": [], "high": [], "low": [], "close": []}, dtype=float)
+        result = compute_bundle(df)
+        assert set(result) == {"ema20", "ema100", "rsi", "atr"}
+        assert all(series.empty for series in result.values())